@@ -0,0 +1,16 @@
+"""Request interception profile for bs.to."""
+
+from main.fetcher.RequestInterceptor import InterceptionProfile
+
+# Only bs.to itself plus the challenge/captcha providers it relies on.
+# Hoster iframes are blocked: we read their src attribute, never their content.
+BSTO_PROFILE = InterceptionProfile(
+    name='bs.to',
+    allowed_host_patterns=(
+        'bs.to',
+        '*.bs.to',
+        'challenges.cloudflare.com',
+        'www.google.com',
+        'www.gstatic.com',
+    ),
+)
@@ -0,0 +1,249 @@
+"""bs.to URL model and language-aware planning of episode fetches."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from urllib.parse import urlparse
+
+# Language segment of a bs.to path (de, en, des = German subtitles, jps = Japanese subtitles, ...)
+LANGUAGE_SEGMENT = re.compile(r'^[a-z]{2,3}$')
+
+# (series, season, episode number) of one episode
+EpisodeKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class EpisodeUrl:
+    """
+    Parsed bs.to path: /serie/<series>/<season>/<episode>/<language>/<hoster>.
+
+    Trailing parts are optional; the episode slug starts with its number
+    ("3-The-Title"), which is what identifies the episode across
+    languages (titles differ between the variants).
+    """
+    url: str
+    series: str
+    season: Optional[str] = None
+    episode: Optional[str] = None
+    language: Optional[str] = None
+    hoster: Optional[str] = None
+
+    @classmethod
+    def parse(cls, url: str) -> Optional['EpisodeUrl']:
+        """
+        Parse a bs.to series, episode or hoster URL.
+
+        Returns:
+            EpisodeUrl or None if the URL is not below /serie/
+        """
+        try:
+            path = urlparse(url).path
+        except ValueError:
+            return None
+        parts = [part for part in path.split('/') if part]
+        if len(parts) < 2 or parts[0] != 'serie':
+            return None
+
+        rest = parts[2:]
+        season = rest.pop(0) if rest and rest[0].isdigit() else None
+        episode = rest.pop(0) if season and rest and not LANGUAGE_SEGMENT.match(rest[0]) else None
+        language = rest.pop(0) if rest and LANGUAGE_SEGMENT.match(rest[0]) else None
+        hoster = rest.pop(0) if language and rest else None
+        return cls(url, parts[1], season, episode, language, hoster)
+
+    @property
+    def episode_key(self) -> Optional[EpisodeKey]:
+        """(series, season, episode number), the same for every language and hoster variant."""
+        if not self.episode:
+            return None
+        number = re.match(r'\d+', self.episode)
+        return self.series.lower(), self.season, number.group(0) if number else self.episode.lower()
+
+
+def hoster_key(name: str) -> str:
+    """Comparable hoster name ('VOE', 'Voe', 'voe ' -> 'voe')."""
+    return re.sub(r'[^a-z0-9]', '', (name or '').lower())
+
+
+@dataclass
+class EpisodeVariant:
+    """One language of an episode with the hosters the series page lists for it."""
+    language: Optional[str]
+    url: str
+    hosters: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class EpisodeFetch:
+    """The variant to fetch for an episode and the other languages to consider."""
+    key: EpisodeKey
+    primary: EpisodeVariant
+    variants: List[EpisodeVariant] = field(default_factory=list)
+
+
+@dataclass
+class EpisodePlannerStats:
+    """Episode URLs found compared to the pages actually fetched."""
+    episode_urls: int = 0
+    episodes: int = 0
+    variant_fetches: int = 0
+    variants_skipped: int = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            'episode_urls': self.episode_urls,
+            'episodes': self.episodes,
+            'variant_fetches': self.variant_fetches,
+            'variants_skipped': self.variants_skipped
+        }
+
+
+class EpisodePlanner:
+    """
+    Collapses the language and hoster variants of bs.to episode URLs.
+
+    The episode table of a series page links every hoster of every
+    language separately, and each of those pages shows the same hoster
+    tabs for its language. The planner fetches one page per episode in
+    the preferred language and another language only if the series page
+    lists a hoster for it that the fetched variant did not have.
+
+    Responsibilities:
+    - Grouping URLs by episode and language
+    - Picking the variant to fetch by language preference
+    - Deciding which other languages add hosters
+    - Collapsing variant links within an episode page's table
+    """
+
+    def __init__(self, languages: Sequence[str] = ('de', 'en')):
+        """
+        Initialize episode planner.
+
+        Args:
+            languages: Language segments in order of preference (others rank after them)
+        """
+        self.languages = [language.lower() for language in languages]
+        self.stats = EpisodePlannerStats()
+
+    @classmethod
+    def from_config(cls, config) -> 'EpisodePlanner':
+        return cls(config.BSTO_LANGUAGES)
+
+    def first_episodes(self, urls: Iterable[str], count: int) -> List[str]:
+        """URLs belonging to the first count distinct episodes (all their variants)."""
+        keys: Set[EpisodeKey] = set()
+        selected = []
+        for url in urls:
+            parsed = EpisodeUrl.parse(url)
+            key = parsed.episode_key if parsed else None
+            if key and key not in keys:
+                if len(keys) >= count:
+                    continue
+                keys.add(key)
+            selected.append(url)
+        return selected
+
+    def plan(self, urls: Iterable[str]) -> List[EpisodeFetch]:
+        """
+        One fetch per episode, in page order.
+
+        URLs that do not parse as episodes are fetched as they are.
+
+        Args:
+            urls: Episode and hoster URLs of a series
+
+        Returns:
+            EpisodeFetch per episode with the other languages by preference
+        """
+        by_episode: Dict[EpisodeKey, Dict[Optional[str], EpisodeVariant]] = {}
+        urls = list(dict.fromkeys(urls))
+        for url in urls:
+            parsed = EpisodeUrl.parse(url)
+            key = (parsed.episode_key if parsed else None) or ('', '', url)
+            variants = by_episode.setdefault(key, {})
+            language = parsed.language if parsed else None
+            variant = variants.get(language)
+            if variant is None:
+                variant = variants[language] = EpisodeVariant(language, url)
+            elif parsed and not parsed.hoster and EpisodeUrl.parse(variant.url).hoster:
+                # The plain episode page shows the same tabs; prefer it over a hoster URL
+                variant.url = url
+            if parsed and parsed.hoster:
+                variant.hosters.add(hoster_key(parsed.hoster))
+
+        fetches = []
+        for key, variants in by_episode.items():
+            ordered = sorted(variants.values(), key=lambda variant: self._rank(variant.language))
+            fetches.append(EpisodeFetch(key, ordered[0], ordered[1:]))
+
+        self.stats.episode_urls += len(urls)
+        self.stats.episodes += len(fetches)
+        return fetches
+
+    def variants_to_fetch(self, fetch: EpisodeFetch, found_hosters: Iterable[str]) -> List[EpisodeVariant]:
+        """
+        Other languages of an episode that have hosters the fetched variant lacks.
+
+        Args:
+            fetch: Planned episode
+            found_hosters: Hoster names extracted from the primary variant's page
+
+        Returns:
+            Variants worth fetching, by language preference
+        """
+        known = set(fetch.primary.hosters) | {hoster_key(name) for name in found_hosters}
+        selected = []
+        for variant in fetch.variants:
+            if variant.hosters - known:
+                selected.append(variant)
+                known |= variant.hosters
+            else:
+                self.stats.variants_skipped += 1
+        self.stats.variant_fetches += len(selected)
+        return selected
+
+    def collapse_links(self, links: List[Dict]) -> List[Dict]:
+        """
+        Drop language variants of the same episode and hoster.
+
+        Per episode the preferred language's links are kept; links of
+        other languages only for hosters the preferred ones lack. Links
+        that are not bs.to episode links are kept as they are.
+
+        Args:
+            links: Link dicts with 'url' and 'hoster'
+
+        Returns:
+            Filtered links in their original order
+        """
+        languages: Dict[EpisodeKey, Dict[Optional[str], Set[str]]] = {}
+        for link in links:
+            parsed = EpisodeUrl.parse(link['url'])
+            if parsed and parsed.episode_key:
+                hosters = languages.setdefault(parsed.episode_key, {}).setdefault(parsed.language, set())
+                hosters.add(hoster_key(parsed.hoster or link.get('hoster', '')))
+
+        # Per episode: language -> hosters to keep from it
+        keep: Dict[EpisodeKey, Dict[Optional[str], Set[str]]] = {}
+        for key, by_language in languages.items():
+            covered: Set[str] = set()
+            keep[key] = {}
+            for language in sorted(by_language, key=self._rank):
+                keep[key][language] = by_language[language] - covered
+                covered |= by_language[language]
+
+        collapsed = []
+        for link in links:
+            parsed = EpisodeUrl.parse(link['url'])
+            if not parsed or not parsed.episode_key:
+                collapsed.append(link)
+                continue
+            hoster = hoster_key(parsed.hoster or link.get('hoster', ''))
+            if hoster in keep[parsed.episode_key][parsed.language]:
+                collapsed.append(link)
+        return collapsed
+
+    def _rank(self, language: Optional[str]) -> int:
+        if language in self.languages:
+            return self.languages.index(language)
+        return len(self.languages)
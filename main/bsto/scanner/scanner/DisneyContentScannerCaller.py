@@ -1,15 +1,21 @@
 import asyncio
+import os
 import traceback
-from typing import List, Dict
+from typing import List, Dict, Optional
 from urllib.parse import urljoin
 
 from db.DatabaseManager import DatabaseManager
 from main.client.TMbdClient import TMDbClient
 from main.data import Config, MovieInfo
-from main.bsto.scanner.scanner.ContentScanner import ContentScanner
-from main.bsto.scanner.extractor.VideoLinkExtractor import VideoLinkExtractor
+from main.bsto.scanner.extractor.EpisodeUrl import EpisodePlanner
 from main.bsto.fetcher.PageFetcher import PageFetcher
 from main.bsto.manager.BrowserManager import BrowserManager
+from main.extractor.ExtractionBackend import ExtractionBackend
+from main.fetcher.RedirectCache import RedirectCache
+from main.fetcher.RetryQueue import RetryItem, RetryQueue
+from main.manager.BrowserRegistry import BrowserRegistry
+from main.sitespec.SpecScanner import SpecScanner
+from main.sitespec.sites import BSTO_SPEC
 from main.statistics import ReportGenerator
 from main.statistics.Statistics import Statistics
 from main.verifier.DisneyVerifier import DisneyVerifier
@@ -21,39 +27,64 @@ class DisneyContentScannerCaller:
         self.config = config
         self.tmdb_client = TMDbClient(config)
         self.verifier = DisneyVerifier(config)
-        self.scanner = ContentScanner(config)
         self.stats = Statistics()
         self.findings: List[MovieInfo] = []
         self.page = None
-        self.video_link_extractor = VideoLinkExtractor()
-        self.browser_manager = BrowserManager(headless=True)
+        # Language variants of an episode are fetched once (BSTO_LANGUAGES)
+        self.episode_planner = EpisodePlanner.from_config(config)
+        self.scanner = SpecScanner(
+            BSTO_SPEC,
+            backend=ExtractionBackend.from_config(config),
+            redirect_cache=RedirectCache.from_config(config),
+            base_url=config.TARGET_SITE,
+            page_delay=config.PAGE_DELAY,
+            # Other languages of the episode table only for hosters the preferred language lacks
+            group_filters={'table': self.episode_planner.collapse_links}
+        )
+        self.browser_pool = None  # Shared via BrowserRegistry in initialize()
         self.page_fetcher = None
+        self.retry_queue = RetryQueue(
+            max_attempts=config.RETRY_MAX_ATTEMPTS,
+            base_delay=config.RETRY_BASE_DELAY_SECONDS,
+            failures_path=os.path.join(config.FAILED_URLS_DIR, 'bsto.json')
+        )
         db_path = r"C:\Users\aurel\PycharmProjects\filmdmca\db\dmcalinks.db"
         self.db_manager = DatabaseManager(db_path)
 
     async def initialize(self):
-        await self.browser_manager.start()
-        browser = await self.browser_manager.get_browser()
-
-        self.page_fetcher = PageFetcher(
-            browser=browser,
-            timeout=self.config.REQUEST_TIMEOUT * 1000
+        self.browser_pool = await BrowserRegistry.acquire(
+            'bsto',
+            lambda: BrowserManager.pool_from_config(self.config)
         )
 
-        await self.scanner.initialize()
+        self.page_fetcher = PageFetcher.from_config(self.config, self.browser_pool)
+        # Pages and hoster tabs go through the same fetcher (one per site)
+        await self.scanner.initialize(self.page_fetcher)
 
     async def cleanup(self):
-        await self.browser_manager.stop()
+        if self.page_fetcher:
+            await self.page_fetcher.close()
+        await self.scanner.cleanup()
+        if self.browser_pool:
+            self.browser_pool = None
+            await BrowserRegistry.release('bsto')
 
     async def run(self, max_series: int = 10000, max_episodes_per_series: int = 100):
         print("Disney Content Scanner - BS.TO")
         print(f"Ziel: {self.config.TARGET_SITE}")
         print("Verifikation: TMDb API\n")
 
-        series_list = await self.scanner.scan_series_list(max_series)
-        self.stats.pages_scanned = 1
+        if self.config.RETRY_FAILED_ONLY:
+            await self._retry_failed_from_last_run()
+        else:
+            series_list = await self.scanner.scan_listing(limit=max_series)
+            self.stats.pages_scanned = 1
 
-        await self._scan_series(series_list, max_episodes_per_series)
+            await self._scan_series(series_list, max_episodes_per_series)
+
+        # Episodes that failed during the scan get their remaining attempts now
+        await self.retry_queue.drain(self._retry_episode)
+        self.retry_queue.save_failures()
 
         if self.findings:
             # Instead of generating report, insert into database
@@ -69,6 +100,7 @@ class DisneyContentScannerCaller:
                 total_inserted += inserted
 
             self.stats.api_calls = self.tmdb_client.api_calls
+            self._collect_fetch_stats()
             self.stats.print()
 
             print(f"\n✓ Fertig!")
@@ -77,8 +109,30 @@ class DisneyContentScannerCaller:
             print(f"→ Gesamt Links in DB: {self.db_manager.get_link_count()}")
         else:
             print("\nKeine Disney-Serien gefunden.")
+            self._collect_fetch_stats()
             self.stats.print()
 
+    def _collect_fetch_stats(self):
+        fetcher = self.page_fetcher
+        if fetcher:
+            self.stats.add_interception(fetcher.interceptor.stats)
+            self.stats.add_readiness(fetcher.readiness_stats)
+            self.stats.add_backends(fetcher.backend_counts)
+            if fetcher.ladder:
+                self.stats.add_ladder(fetcher.ladder)
+            if fetcher.host_health:
+                self.stats.add_host_health(fetcher.host_health)
+            self.stats.requeued_urls += fetcher.requeued
+        self.stats.add_redirect_waits(self.scanner.redirect_wait_stats)
+        for resolver in self.scanner.resolvers.values():
+            self.stats.add_redirect_resolver(resolver)
+        if self.scanner.redirect_cache:
+            self.stats.add_redirect_cache(self.scanner.redirect_cache)
+        self.stats.add_retries(self.retry_queue)
+        self.stats.add_episode_planner(self.episode_planner)
+        self.stats.browser_restarts = self.browser_pool.restarts
+        self.stats.browser_recycles = self.browser_pool.recycles
+
     async def _scan_series(self, series_list: List[MovieInfo], max_episodes_per_series: int):
         print(f"=== Prüfe {len(series_list)} Serien ===\n")
 
@@ -108,13 +162,15 @@ class DisneyContentScannerCaller:
             series.disney_company = company
 
             try:
-                await self.scanner.scan_series_episodes(series, max_episodes_per_series)
+                episode_urls = await self.scanner.scan_detail(series)
+                # max_episodes counts episodes, not their language and hoster variants
+                series.source_url.extend(self.episode_planner.first_episodes(episode_urls, max_episodes_per_series))
 
                 if len(series.source_url) > 1:
                     episode_urls = series.source_url[1:]
                     
                     print(f"  Processing {len(episode_urls)} episodes...")
-                    series.video_links = await self._extract_video_links_from_episodes(episode_urls)
+                    series.video_links = await self._extract_video_links_from_episodes(episode_urls, series)
 
                     if series.video_links:
                         self.findings.append(series)
@@ -132,29 +188,97 @@ class DisneyContentScannerCaller:
 
             await asyncio.sleep(self.config.MOVIE_DELAY)
 
-    async def _extract_video_links_from_episodes(self, episode_urls: List[str]) -> List[Dict]:
+            # Retries whose backoff has elapsed run between series
+            await self.retry_queue.process_due(self._retry_episode)
+
+    async def _extract_video_links_from_episodes(self, episode_urls: List[str],
+                                                 series: Optional[MovieInfo] = None) -> List[Dict]:
         all_video_links = []
-        episode_urls = list(dict.fromkeys(episode_urls))
-        
-        for url in episode_urls[:5]:
-            try:
-                if isinstance(url, list):
-                    url = url[0] if url else None
+        valid_urls = []
+        for url in episode_urls:
+            if isinstance(url, list):
+                url = url[0] if url else None
 
-                if not url or not isinstance(url, str):
-                    print(f"    ✗ Skipping invalid URL: {url}")
-                    continue
+            if not url or not isinstance(url, str):
+                print(f"    ✗ Skipping invalid URL: {url}")
+                continue
+            valid_urls.append(url)
 
-                page = await self.page_fetcher.fetch(url)
+        # One fetch per episode; other languages only if they list additional hosters
+        fetches = self.episode_planner.plan(valid_urls)
+        print(f"  {len(valid_urls)} Episoden-URLs → {len(fetches)} Episoden")
 
-                links = await self.video_link_extractor.extract_video_links(page)
+        for fetch in fetches[:5]:
+            try:
+                links = await self._fetch_episode_variant(fetch.primary.url, series)
+                if links is None:
+                    continue
                 all_video_links.extend(links)
 
-                await page.close()
+                found_hosters = [link['hoster'] for link in links]
+                for variant in self.episode_planner.variants_to_fetch(fetch, found_hosters):
+                    print(f"    + Sprachvariante {variant.language}: {variant.url}")
+                    variant_links = await self._fetch_episode_variant(variant.url, series)
+                    if variant_links:
+                        all_video_links.extend(variant_links)
 
             except Exception as e:
-                print(f"    ✗ Error extracting from {url}: {e}")
+                print(f"    ✗ Error extracting from {fetch.primary.url}: {e}")
                 traceback.print_exc()
                 continue
 
+        # Hoster tabs of the whole series → real hoster URLs, concurrently
+        await self.scanner.resolve_links(all_video_links)
         return all_video_links
+
+    async def _fetch_episode_variant(self, url: str, series: Optional[MovieInfo]) -> Optional[List[Dict]]:
+        # Failed pages go to the retry queue; None tells the caller to skip the episode
+        links = await self._extract_from_episode_page(url)
+        if links is None:
+            self.retry_queue.push(
+                url,
+                meta={'title': series.title, 'company': series.disney_company} if series else {},
+                context=series,
+                error=self.page_fetcher.last_errors.get(url, '')
+            )
+        return links
+
+    async def _extract_from_episode_page(self, url: str) -> Optional[List[Dict]]:
+        return await self.scanner.fetch_video_links(url)
+
+    async def _retry_episode(self, item: RetryItem) -> bool:
+        links = await self._extract_from_episode_page(item.url)
+        if links is None:
+            item.last_error = self.page_fetcher.last_errors.get(item.url, item.last_error)
+            return False
+
+        series = item.context
+        if series is None:
+            return True
+        await self.scanner.resolve_links(links)
+        known = {link['url'] for link in series.video_links}
+        known.update(link['source_url'] for link in series.video_links if 'source_url' in link)
+        new_links = [link for link in links if link['url'] not in known]
+        series.video_links.extend(new_links)
+        self.stats.urls_collected += len(new_links)
+        if series.video_links and all(found is not series for found in self.findings):
+            self.findings.append(series)
+            self.stats.disney_found += 1
+            print(f"✓ Disney-Serie (Retry): {series.title} → {len(series.video_links)} Links")
+        return True
+
+    async def _retry_failed_from_last_run(self):
+        items = self.retry_queue.load_failures()
+        print(f"=== Wiederhole {len(items)} fehlgeschlagene Episoden ===\n")
+
+        series_by_key: Dict[tuple, MovieInfo] = {}
+        for item in items:
+            key = (item.meta.get('title', ''), item.meta.get('company'))
+            if key not in series_by_key:
+                series_by_key[key] = MovieInfo.MovieInfo(title=key[0], source_url=[], disney_company=key[1])
+            series = series_by_key[key]
+            series.source_url.append(item.url)
+
+            item.context = series
+            if not await self._retry_episode(item):
+                self.retry_queue.push(item.url, meta=item.meta, context=series, error=item.last_error)
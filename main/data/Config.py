@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 from dataclasses import dataclass
 
 
@@ -16,9 +16,67 @@ class Config:
     DISNEY_NETWORK_IDS: List[int] = None
 
     MAX_CONCURRENT: float = 5
+    CONTEXT_POOL_SIZE: int = 4
+    BROWSER_POOL_SIZE: int = 1
+    RECYCLE_MAX_PAGES: int = 2000
+    RECYCLE_MAX_RSS_MB: float = 2048
+    RECYCLE_MAX_P95_SECONDS: float = 10.0
+    PREWARM_BROWSER: bool = True
+    LAUNCH_CONFIG_PATH: str = "cache/camoufox_launch.json"
+    LAUNCH_CONFIG_MAX_AGE_HOURS: float = 7 * 24
+    REFRESH_LAUNCH_CONFIG: bool = False
+    # Browser-Server pro Engine, z.B. {"camoufox": "ws://localhost:9323/bsto"}; fehlt eine Engine = eigener Browser
+    BROWSER_SERVER_ENDPOINTS: Dict[str, str] = None
+    BLOCK_HEAVY_RESOURCES: bool = True
+    HTTP_FIRST: bool = True
+    EXTRACTION_BACKEND: str = "browser"  # "browser" (JS in der Seite) oder "html" (selectolax, offline)
+    EXTRACTION_WORKERS: int = 2  # Prozesse für das HTML-Parsing, 0 = Thread
+    ESCALATION_LADDER: bool = True  # HTTP → Chromium → Camoufox, je nach Challenge
+    ESCALATION_DIR: str = "cache/escalation"
+    ADAPTIVE_TIMEOUTS: bool = True  # Timeout pro Host aus gemessenen Ladezeiten (max. REQUEST_TIMEOUT)
+    BREAKER_FAILURE_THRESHOLD: int = 3
+    BREAKER_COOLDOWN_SECONDS: float = 60
+    RETRY_MAX_ATTEMPTS: int = 4
+    RETRY_BASE_DELAY_SECONDS: float = 5.0
+    FAILED_URLS_DIR: str = "cache/failed"
+    RETRY_FAILED_ONLY: bool = False  # Nur die endgültig fehlgeschlagenen URLs des letzten Laufs erneut versuchen
+    SESSION_DIR: str = "sessions"
+    SESSION_MAX_AGE_HOURS: float = 12
+
+    # Seiten-Snapshots aufzeichnen (für REPLAY_MODE). Aus, weil ein Live-Lauf sonst bis zur TTL
+    # veraltete Seiten ausliefert, z.B. bs.to-Episodenlisten ohne die neuesten Folgen
+    PAGE_CACHE_ENABLED: bool = False
+    PAGE_CACHE_DIR: str = "cache/pages"
+    PAGE_CACHE_MAX_MB: int = 2048
+    PAGE_CACHE_TTLS: Dict[str, float] = None
+    REPLAY_MODE: bool = False
+    REDIRECT_CACHE_ENABLED: bool = True
+    REDIRECT_CACHE_PATH: str = "cache/redirects.db"
+    REDIRECT_CACHE_TTL_HOURS: float = 7 * 24  # Danach wird ein Redirect neu aufgelöst
+    REDIRECT_CACHE_LRU_SIZE: int = 4096
+    BSTO_LANGUAGES: List[str] = None  # Bevorzugte Sprachvarianten, andere nur bei zusätzlichen Hostern
 
 
     def __post_init__(self):
+        if self.REPLAY_MODE:
+            # Replay liest nur aus dem Cache - keine Rücksicht auf Rate-Limits nötig
+            self.PAGE_DELAY = 0.0
+            self.MOVIE_DELAY = 0.0
+
+        if self.PAGE_CACHE_TTLS is None:
+            # Sekunden, die eine gecachte Seite ohne Replay-Modus ausgeliefert wird;
+            # neue Episoden/Hoster erscheinen so lange nicht
+            self.PAGE_CACHE_TTLS = {
+                'bs.to': 6 * 3600,
+                'filmpalast.to': 1 * 3600,
+            }
+
+        if self.BROWSER_SERVER_ENDPOINTS is None:
+            self.BROWSER_SERVER_ENDPOINTS = {}
+
+        if self.BSTO_LANGUAGES is None:
+            self.BSTO_LANGUAGES = ['de', 'en']
+
         if self.DISNEY_COMPANY_IDS is None:
             self.DISNEY_COMPANY_IDS = [
                 2,  # Walt Disney Pictures
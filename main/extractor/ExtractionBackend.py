@@ -0,0 +1,253 @@
+"""Extraction backends: in-page JavaScript or offline HTML parsing."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+try:
+    from selectolax.lexbor import LexborHTMLParser, LexborNode
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+BROWSER = 'browser'
+HTML = 'html'
+
+# Elements whose text innerText leaves out, and the ones it puts on their own line
+_HIDDEN_TAGS = frozenset({'head', 'script', 'style', 'template', 'noscript'})
+_BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'fieldset',
+    'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header',
+    'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'tbody', 'td', 'tfoot',
+    'th', 'thead', 'tr', 'ul'
+})
+
+
+@dataclass(frozen=True)
+class DomQuery:
+    """
+    One extraction step with an implementation per backend.
+
+    js runs in the page with the root element (<html> for pages, the
+    element for locators) as its first argument; parse runs on the same
+    element of the parsed HTML. Both take the same argument and must return
+    the same plain data. parse has to be a module-level function so it
+    can be sent to worker processes.
+
+    Text is read the same way on both sides: text() matches textContent,
+    inner_text() approximates innerText (no script/style text, collapsed
+    whitespace, block elements on their own lines).
+    """
+    name: str
+    js: str
+    parse: Callable[[Any, Any], Any]
+
+
+@dataclass(frozen=True)
+class HtmlDocument:
+    """
+    HTML without a live page, e.g. from an HTTP fetch or the page cache.
+
+    Queries run on the first element matching root, so locator() scopes a
+    document the way Page.locator() scopes a page.
+    """
+    html: str
+    url: str
+    root: str = 'html'
+
+    def locator(self, selector: str) -> 'HtmlDocument':
+        """The same document with queries running on the first element matching selector."""
+        return replace(self, root=selector)
+
+    def contains(self, *selectors: str) -> bool:
+        """Whether every selector matches at least one element (needs selectolax)."""
+        tree = LexborHTMLParser(self.html)
+        return all(tree.css_first(selector) is not None for selector in selectors)
+
+
+# Anything a query can run against: a Page, a Locator or an HtmlDocument
+Source = Union[Any, HtmlDocument]
+
+
+class ExtractionBackend(ABC):
+    """
+    Runs DomQuery steps against a page or HTML.
+
+    Extractors only call run(); which side does the work is decided by
+    the configured backend.
+    """
+
+    name = ''
+
+    @abstractmethod
+    async def run(self, source: Source, query: DomQuery, arg: Any = None) -> Any:
+        """Run a query against a Page, Locator or HtmlDocument and return its plain data."""
+
+    async def close(self) -> None:
+        """Release worker processes (no-op by default)."""
+
+    @staticmethod
+    def from_config(config) -> 'ExtractionBackend':
+        """
+        Create the backend selected by EXTRACTION_BACKEND.
+
+        Falls back to the browser backend if selectolax is not installed.
+        """
+        if config.EXTRACTION_BACKEND == HTML:
+            if SELECTOLAX_AVAILABLE:
+                return HtmlBackend(workers=config.EXTRACTION_WORKERS)
+            print("  ⚠ selectolax not installed, extracting in the browser")
+        return BrowserBackend()
+
+
+class BrowserBackend(ExtractionBackend):
+    """
+    Evaluates the query's JavaScript in the live page (one round-trip per query).
+
+    HtmlDocuments (HTTP or cached pages) have no page to evaluate in; their
+    queries run the Python side in a thread instead.
+    """
+
+    name = BROWSER
+
+    async def run(self, source: Source, query: DomQuery, arg: Any = None) -> Any:
+        if isinstance(source, HtmlDocument):
+            return await asyncio.to_thread(_parse_and_run, query.parse, source.html, source.root, arg)
+        if hasattr(source, 'eval_on_selector'):
+            return await source.eval_on_selector('html', query.js, arg)
+        return await source.evaluate(query.js, arg)
+
+
+class HtmlBackend(ExtractionBackend):
+    """
+    Parses HTML with selectolax (lexbor) and runs the query's Python side.
+
+    Live pages are read once with content() (Locators with their outer
+    HTML). Parsing and querying run in a process pool so large pages
+    do not block the event loop; workers=0 uses a thread instead.
+
+    Responsibilities:
+    - Getting HTML from pages, locators or offline documents
+    - Parsing and querying off the event loop
+    - Owning the worker pool
+    """
+
+    name = HTML
+
+    def __init__(self, workers: int = 2):
+        """
+        Initialize HTML backend.
+
+        Args:
+            workers: Worker processes for parsing (0 = thread, no extra processes)
+        """
+        if not SELECTOLAX_AVAILABLE:
+            raise RuntimeError("HtmlBackend needs selectolax (pip install selectolax)")
+        self.workers = workers
+        self._executor: Optional[Executor] = None
+
+    async def run(self, source: Source, query: DomQuery, arg: Any = None) -> Any:
+        html, root = await self._html(source)
+        if not self.workers:
+            return await asyncio.to_thread(_parse_and_run, query.parse, html, root, arg)
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _parse_and_run, query.parse, html, root, arg)
+
+    async def close(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @staticmethod
+    async def _html(source: Source) -> Tuple[str, str]:
+        """HTML of the source and the selector of the element queries run on."""
+        if isinstance(source, HtmlDocument):
+            return source.html, source.root
+        if isinstance(source, str):
+            return source, 'html'
+        if hasattr(source, 'content'):
+            return await source.content(), 'html'
+        # Locator: only the element itself
+        tag, html = await source.evaluate('element => [element.tagName.toLowerCase(), element.outerHTML]')
+        return html, tag
+
+
+def _parse_and_run(parse: Callable[[Any, Any], Any], html: str, root_selector: str, arg: Any) -> Any:
+    tree = LexborHTMLParser(html)
+    # The parser only adds <html>/<head>/<body> around a locator's outerHTML,
+    # so the first element with its tag is the element itself
+    root = tree.css_first(root_selector) or tree.body or tree.root
+    return parse(root, arg)
+
+
+# Helpers for the parse side of DomQuery implementations
+
+def text(node: Optional['LexborNode']) -> Optional[str]:
+    """textContent of a node (None if there is no node)."""
+    if node is None:
+        return None
+    return node.text(deep=True)
+
+
+def inner_text(node: Optional['LexborNode']) -> Optional[str]:
+    """
+    innerText of a node without layout (None if there is no node).
+
+    Leaves out script and style text, collapses whitespace and puts block
+    elements on their own lines, which is what innerText does for pages
+    without unusual CSS.
+    """
+    if node is None:
+        return None
+    lines: List[str] = []
+    current: List[str] = []
+
+    def flush() -> None:
+        line = ' '.join(''.join(current).split())
+        if line:
+            lines.append(line)
+        current.clear()
+
+    def walk(parent) -> None:
+        for child in parent.iter(include_text=True):
+            if child.tag == '-text':
+                current.append(child.text_content or '')
+            elif child.tag in _HIDDEN_TAGS:
+                continue
+            elif child.tag in _BLOCK_TAGS:
+                flush()
+                walk(child)
+                flush()
+            else:
+                walk(child)
+
+    walk(node)
+    flush()
+    return '\n'.join(lines)
+
+
+def attr(node: 'LexborNode', name: str) -> Optional[str]:
+    """Attribute value, None if absent (valueless attributes are '')."""
+    attributes = node.attributes
+    if name not in attributes:
+        return None
+    return attributes[name] or ''
+
+
+def attrs(node: 'LexborNode', names: List[str]) -> List[Optional[str]]:
+    return [attr(node, name) for name in names]
+
+
+def classes(node: 'LexborNode') -> List[str]:
+    return (attr(node, 'class') or '').split()
+
+
+def grandparent(node: 'LexborNode') -> Optional['LexborNode']:
+    parent = node.parent
+    return parent.parent if parent is not None else None
+
@@ -0,0 +1,168 @@
+"""Escalation from cheap to heavy fetch engines, learned per path pattern."""
+
+import json
+import os
+import re
+from collections import defaultdict
+from typing import Dict, Optional, Sequence
+from urllib.parse import urlparse
+
+# Cheapest first
+LEVELS = ('http', 'chromium', 'camoufox')
+
+
+def path_pattern(url: str) -> str:
+    """
+    Group URLs by host and first path segment (numbers generalized).
+
+    e.g. https://bs.to/serie/Foo/1/de -> 'bs.to/serie'
+    """
+    parsed = urlparse(url)
+    host = (parsed.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    segments = [segment for segment in parsed.path.split('/') if segment]
+    first = re.sub(r'\d+', '#', segments[0]) if segments else ''
+    return f"{host}/{first}"
+
+
+class EscalationLadder:
+    """
+    Decides which fetch engine a URL starts on and learns from challenges.
+
+    A URL that hits a challenge moves up one level at a time. Once
+    prefix_threshold URLs of the same path pattern needed a higher level,
+    new URLs of that pattern start there. Every probe_interval URLs a
+    pattern tries one level lower again, so a passing challenge wave does
+    not pin it to the heavy engine forever.
+
+    Responsibilities:
+    - Picking the start level per URL
+    - Remembering per URL and per path pattern which level worked
+    - Counting hits and challenges per level
+    - Persisting learned pattern levels between runs
+    """
+
+    def __init__(self, levels: Sequence[str] = LEVELS, path: Optional[str] = None,
+                 prefix_threshold: int = 2, probe_interval: int = 50):
+        """
+        Initialize escalation ladder.
+
+        Args:
+            levels: Level names, cheapest first
+            path: JSON file for learned pattern levels (None keeps them in memory)
+            prefix_threshold: Escalated URLs after which a whole pattern starts higher
+            probe_interval: Every n-th URL of an escalated pattern tries one level lower (0 disables)
+        """
+        self.levels = tuple(levels)
+        self.path = path
+        self.prefix_threshold = prefix_threshold
+        self.probe_interval = probe_interval
+        self.hits: Dict[str, int] = {level: 0 for level in self.levels}
+        self.challenges: Dict[str, int] = {level: 0 for level in self.levels}
+        self._url_levels: Dict[str, int] = {}
+        self._pattern_levels: Dict[str, int] = self._read()
+        self._pattern_escalations: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self._pattern_starts: Dict[str, int] = defaultdict(int)
+
+    @property
+    def top(self) -> int:
+        return len(self.levels) - 1
+
+    def start_level(self, url: str) -> int:
+        """
+        Level a URL should be tried on first.
+
+        Args:
+            url: URL about to be fetched
+
+        Returns:
+            Index into levels
+        """
+        if url in self._url_levels:
+            return self._url_levels[url]
+
+        pattern = path_pattern(url)
+        level = self._pattern_levels.get(pattern, 0)
+        self._pattern_starts[pattern] += 1
+        if level > 0 and self.probe_interval and self._pattern_starts[pattern] % self.probe_interval == 0:
+            return level - 1
+        return level
+
+    def record_success(self, url: str, level: int, escalated: bool = True) -> None:
+        """
+        Remember that a URL was served without challenge on a level.
+
+        Args:
+            url: Fetched URL
+            level: Index of the level that worked
+            escalated: False if no cheaper level challenged this URL (e.g. it skipped
+                or fell through them); the level then says nothing about its pattern
+        """
+        self.hits[self.levels[level]] += 1
+        self._url_levels[url] = level
+
+        pattern = path_pattern(url)
+        current = self._pattern_levels.get(pattern, 0)
+        if level < current:
+            # A probe on a cheaper level got through
+            self._set_pattern_level(pattern, level)
+        elif level > current and escalated:
+            self._pattern_escalations[pattern][level] += 1
+            if self._pattern_escalations[pattern][level] >= self.prefix_threshold:
+                self._set_pattern_level(pattern, level)
+
+    def record_challenge(self, url: str, level: int) -> None:
+        """
+        Count a challenge (or unusable response) on a level.
+
+        Args:
+            url: Fetched URL
+            level: Index of the level that failed
+        """
+        self.challenges[self.levels[level]] += 1
+
+    def pattern_levels(self) -> Dict[str, str]:
+        """Learned start level per path pattern."""
+        return {pattern: self.levels[level] for pattern, level in self._pattern_levels.items()}
+
+    def to_dict(self) -> Dict:
+        return {
+            'hits': dict(self.hits),
+            'challenges': dict(self.challenges),
+            'patterns': self.pattern_levels()
+        }
+
+    def _set_pattern_level(self, pattern: str, level: int) -> None:
+        previous = self._pattern_levels.get(pattern, 0)
+        if level == previous:
+            return
+        self._pattern_levels[pattern] = level
+        self._pattern_escalations.pop(pattern, None)
+        arrow = '↑' if level > previous else '↓'
+        print(f"  {arrow} {pattern}/*: now starting on {self.levels[level]}")
+        self._write()
+
+    def _read(self) -> Dict[str, int]:
+        if not self.path:
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {pattern: self.levels.index(name) for pattern, name in stored.items() if name in self.levels}
+
+    def _write(self) -> None:
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.pattern_levels(), f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"  ⚠ Could not save escalation levels: {e}")
@@ -0,0 +1,200 @@
+"""Per-host latency tracking, adaptive timeouts and circuit breakers."""
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional
+from urllib.parse import urlparse
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+@dataclass
+class Latency:
+    """Durations of successful requests to one host over one backend."""
+    ewma: float = 0.0
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=200))
+
+    def add(self, seconds: float, alpha: float) -> None:
+        self.samples.append(seconds)
+        self.ewma = seconds if self.ewma == 0.0 else alpha * seconds + (1 - alpha) * self.ewma
+
+    def percentile(self, p: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+@dataclass
+class HostState:
+    """Latency history per backend and breaker state of one host."""
+    latencies: Dict[str, Latency] = field(default_factory=dict)
+    breaker: str = CLOSED
+    consecutive_failures: int = 0
+    failure_seconds: float = 0.0
+    opened_at: float = 0.0
+    probing: bool = False
+    times_opened: int = 0
+
+
+class HostHealth:
+    """
+    Derives a timeout per host from observed latencies and stops
+    sending requests to hosts that keep failing.
+
+    A host's breaker opens after failure_threshold consecutive failures.
+    While open, requests fail immediately. After cooldown seconds one probe
+    is let through (half-open): success closes the breaker, failure opens
+    it for another cooldown.
+
+    Latencies are kept per backend: a plain HTTP GET and a browser
+    navigation to the same host take very different times, so each gets
+    its own timeout. The breaker is shared, a failing host fails both.
+
+    Responsibilities:
+    - Tracking EWMA and percentiles of successful request durations per host and backend
+    - Deriving per-host timeouts between min_timeout_ms and the default
+    - Fast-failing requests to hosts with an open breaker
+    - Counting fast fails and the time they saved
+    """
+
+    def __init__(self, default_timeout_ms: float, min_timeout_ms: float = 3000,
+                 timeout_factor: float = 3.0, min_samples: int = 5, ewma_alpha: float = 0.2,
+                 failure_threshold: int = 3, cooldown: float = 60.0):
+        """
+        Initialize host health tracker.
+
+        Args:
+            default_timeout_ms: Timeout for hosts without enough samples (and upper bound)
+            min_timeout_ms: Lower bound for derived timeouts
+            timeout_factor: Derived timeout = factor * max(p95, EWMA)
+            min_samples: Successful requests needed before deriving a timeout
+            ewma_alpha: Weight of the newest sample in the EWMA
+            failure_threshold: Consecutive failures that open a breaker (0 disables breakers)
+            cooldown: Seconds a breaker stays open before a half-open probe
+        """
+        self.default_timeout_ms = default_timeout_ms
+        self.min_timeout_ms = min_timeout_ms
+        self.timeout_factor = timeout_factor
+        self.min_samples = min_samples
+        self.ewma_alpha = ewma_alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.fast_fails = 0
+        self.saved_seconds = 0.0
+        self._hosts: Dict[str, HostState] = {}
+
+    def timeout_for(self, url: str, default_ms: Optional[float] = None, backend: str = 'browser') -> float:
+        """
+        Timeout for a request to a URL's host.
+
+        Args:
+            url: Request URL
+            default_ms: Caller's own default (e.g. 10 s for redirects); also the upper bound
+            backend: 'http' for plain HTTP requests, 'browser' for navigations
+
+        Returns:
+            Timeout in milliseconds
+        """
+        default_ms = default_ms or self.default_timeout_ms
+        state = self._hosts.get(_host(url))
+        latency = state.latencies.get(backend) if state else None
+        if latency is None or len(latency.samples) < self.min_samples:
+            return default_ms
+        derived = self.timeout_factor * max(latency.percentile(0.95), latency.ewma) * 1000
+        return min(default_ms, max(self.min_timeout_ms, derived))
+
+    def allow(self, url: str) -> bool:
+        """
+        Check the breaker of a URL's host before a request.
+
+        Counts a fast fail (and the time it saved) if the request is refused.
+
+        Returns:
+            False if the request should fail immediately
+        """
+        if not self.failure_threshold:
+            return True
+        state = self._hosts.get(_host(url))
+        if state is None or state.breaker == CLOSED:
+            return True
+
+        now = time.monotonic()
+        if state.breaker == OPEN and now - state.opened_at >= self.cooldown:
+            state.breaker = HALF_OPEN
+            state.probing = False
+        # A probe whose outcome never got recorded does not block the host forever
+        if state.breaker == HALF_OPEN and (not state.probing or now - state.opened_at >= self.cooldown):
+            state.probing = True
+            state.opened_at = now
+            print(f"  ◐ {_host(url)}: half-open, probing")
+            return True
+
+        self.fast_fails += 1
+        # What the request would have cost: the average failure that opened the breaker
+        self.saved_seconds += state.failure_seconds / max(1, state.consecutive_failures)
+        return False
+
+    def record(self, url: str, seconds: float, ok: bool, backend: str = 'browser') -> None:
+        """
+        Record the outcome of a request.
+
+        Args:
+            url: Request URL
+            seconds: Duration of the request
+            ok: False for timeouts, connection errors and server errors
+            backend: 'http' for plain HTTP requests, 'browser' for navigations
+        """
+        host = _host(url)
+        state = self._hosts.setdefault(host, HostState())
+        state.probing = False
+
+        if ok:
+            state.latencies.setdefault(backend, Latency()).add(seconds, self.ewma_alpha)
+            if state.breaker != CLOSED:
+                print(f"  ● {host}: breaker closed")
+            state.breaker = CLOSED
+            state.consecutive_failures = 0
+            state.failure_seconds = 0.0
+            return
+
+        state.consecutive_failures += 1
+        state.failure_seconds += seconds
+        reopen = state.breaker == HALF_OPEN
+        if self.failure_threshold and (reopen or state.consecutive_failures >= self.failure_threshold):
+            if state.breaker != OPEN:
+                state.times_opened += 1
+                print(f"  ○ {host}: breaker open for {self.cooldown:.0f}s "
+                      f"after {state.consecutive_failures} failures")
+            state.breaker = OPEN
+            state.opened_at = time.monotonic()
+
+    def breaker_states(self) -> Dict[str, str]:
+        """Breaker state of every host whose breaker has opened at least once."""
+        return {host: state.breaker for host, state in self._hosts.items() if state.times_opened}
+
+    def timeouts(self) -> Dict[str, float]:
+        """Current derived timeout per host and backend ("host (backend)") in milliseconds."""
+        return {
+            f"{host} ({backend})": self.timeout_for(f"https://{host}/", backend=backend)
+            for host, state in self._hosts.items() for backend in state.latencies
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            'fast_fails': self.fast_fails,
+            'saved_seconds': round(self.saved_seconds, 3),
+            'breakers': self.breaker_states(),
+            'timeouts_ms': {host: round(ms) for host, ms in self.timeouts().items()}
+        }
+
+
+def _host(url: str) -> str:
+    try:
+        host = (urlparse(url).hostname or '').lower()
+    except ValueError:
+        return ''
+    return host[4:] if host.startswith('www.') else host
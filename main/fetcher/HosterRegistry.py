@@ -0,0 +1,97 @@
+"""Known video hoster domains."""
+
+import re
+from fnmatch import fnmatch
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+# Host pattern -> hoster name (matched against the host and its parent domains)
+DEFAULT_HOSTERS: Dict[str, str] = {
+    'voe.sx': 'VOE',
+    'voe.*': 'VOE',
+    'streamtape.*': 'Streamtape',
+    'strtape.*': 'Streamtape',
+    'stape.*': 'Streamtape',
+    'dood.*': 'Doodstream',
+    'doodstream.*': 'Doodstream',
+    'ds2play.*': 'Doodstream',
+    'd0000d.*': 'Doodstream',
+    'vidoza.*': 'Vidoza',
+    'mixdrop.*': 'Mixdrop',
+    'mixdrp.*': 'Mixdrop',
+    'm1xdrop.*': 'Mixdrop',
+    'upstream.*': 'Upstream',
+    'vidmoly.*': 'Vidmoly',
+    'filemoon.*': 'Filemoon',
+    'streamwish.*': 'Streamwish',
+    'vupload.*': 'Vupload',
+    'supervideo.*': 'SuperVideo',
+    'lulustream.*': 'LuluStream',
+    'luluvdo.*': 'LuluStream',
+    'veev.*': 'Veev',
+    'vidguard.*': 'Vidguard',
+    'listeamed.*': 'Vidguard',
+    'goodstream.*': 'Goodstream',
+    'savefiles.*': 'Savefiles',
+    'uqload.*': 'Uqload',
+}
+
+# Paths of embed/player pages (as opposed to a hoster's scripts and images)
+EMBED_PATH = re.compile(r'^/(?:e|embed|v|d|f|play|player)/|^/embed-', re.IGNORECASE)
+
+
+class HosterRegistry:
+    """
+    Maps URLs to hoster names by domain.
+
+    Responsibilities:
+    - Matching a URL's host (or a parent domain) against known hoster patterns
+    - Telling embed/player URLs apart from a hoster's static assets
+    """
+
+    def __init__(self, hosters: Optional[Dict[str, str]] = None):
+        """
+        Initialize hoster registry.
+
+        Args:
+            hosters: Host pattern -> hoster name (default: DEFAULT_HOSTERS)
+        """
+        self.hosters = dict(hosters if hosters is not None else DEFAULT_HOSTERS)
+
+    def register(self, pattern: str, name: str) -> None:
+        """Add a hoster domain pattern (e.g. a new VOE mirror)."""
+        self.hosters[pattern.lower()] = name
+
+    def match(self, url: str) -> Optional[str]:
+        """
+        Hoster name of a URL.
+
+        Args:
+            url: Any URL
+
+        Returns:
+            Hoster name or None if the host is not a known hoster
+        """
+        try:
+            host = (urlparse(url).hostname or '').lower()
+        except ValueError:
+            return None
+        labels = host.split('.')
+        # voe.sx, cdn.voe.sx, ... -> also try the parent domains
+        for i in range(max(1, len(labels) - 1)):
+            candidate = '.'.join(labels[i:])
+            for pattern, name in self.hosters.items():
+                if fnmatch(candidate, pattern):
+                    return name
+        return None
+
+    @staticmethod
+    def is_embed(url: str) -> bool:
+        """True if the URL path looks like an embed/player page."""
+        try:
+            return bool(EMBED_PATH.search(urlparse(url).path or ''))
+        except ValueError:
+            return False
+
+
+DEFAULT_REGISTRY = HosterRegistry()
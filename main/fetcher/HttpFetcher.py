@@ -0,0 +1,163 @@
+"""Plain HTTP page fetching with a pooled async client."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+CHALLENGE_STATUS_CODES = {403, 429, 503}
+
+# Markers of JS challenges / interstitials that plain HTTP cannot pass
+CHALLENGE_SIGNATURES = [
+    re.compile(p, re.IGNORECASE) for p in (
+        # Only the interstitial loads /h/; normal pages may carry the passive jsd script
+        r'challenge-platform/h/',
+        r'cf[-_]chl',
+        r'Just a moment\.\.\.',
+        r'Checking your browser',
+        r'DDoS-Guard',
+        r'enable JavaScript and cookies to continue',
+    )
+]
+
+
+def looks_like_challenge(status: int, text: str) -> bool:
+    """
+    Check a response for JS challenge / block page markers.
+
+    Args:
+        status: HTTP status code
+        text: Page HTML (or just its title)
+
+    Returns:
+        True if the page is a challenge or interstitial
+    """
+    if status in CHALLENGE_STATUS_CODES:
+        return True
+    head = text[:20000]
+    return any(signature.search(head) for signature in CHALLENGE_SIGNATURES)
+
+
+@dataclass
+class HttpPage:
+    """Result of a plain HTTP fetch."""
+    url: str
+    status: int
+    html: str
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_challenge(self) -> bool:
+        """True if the response looks like a JS challenge or block page."""
+        return looks_like_challenge(self.status, self.html)
+
+    @property
+    def is_html(self) -> bool:
+        return 'html' in self.headers.get('content-type', 'text/html')
+
+
+class HttpFetcher:
+    """
+    Fetches server-rendered pages without a browser.
+
+    Responsibilities:
+    - Keeping one pooled keep-alive client (HTTP/2 if h2 is installed)
+    - Requesting compressed responses
+    - Returning HTML with final URL, status and headers
+    """
+
+    def __init__(self, timeout: int = 15000,
+                 user_agent: str = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                 max_connections: int = 10):
+        """
+        Initialize HTTP fetcher.
+
+        Args:
+            timeout: Request timeout in milliseconds
+            user_agent: User agent string
+            max_connections: Size of the connection pool
+        """
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+        self._cookies: List[Dict] = []
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                follow_redirects=True,
+                verify=False,
+                timeout=self.timeout / 1000,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+                headers={
+                    'User-Agent': self.user_agent,
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                    'Accept-Encoding': 'gzip, deflate, br',
+                    'Accept-Language': 'de-DE,de;q=0.9,en;q=0.8',
+                }
+            )
+            self._apply_cookies()
+        return self._client
+
+    def set_cookies(self, cookies: List[Dict]) -> None:
+        """
+        Use browser session cookies (Playwright storage state format).
+
+        Args:
+            cookies: List of cookie dicts with name, value, domain and path
+        """
+        self._cookies = list(cookies)
+        if self._client is not None:
+            self._apply_cookies()
+
+    def _apply_cookies(self) -> None:
+        for cookie in self._cookies:
+            self._client.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain', ''), path=cookie.get('path', '/')
+            )
+
+    async def get(self, url: str, timeout: Optional[float] = None) -> Optional[HttpPage]:
+        """
+        Fetch a URL over plain HTTP.
+
+        Args:
+            url: URL to fetch
+            timeout: Timeout in milliseconds for this request (default: the client's)
+
+        Returns:
+            HttpPage or None if the request failed
+        """
+        try:
+            if timeout is None:
+                response = await self._get_client().get(url)
+            else:
+                response = await self._get_client().get(url, timeout=timeout / 1000)
+            return HttpPage(
+                url=str(response.url),
+                status=response.status_code,
+                html=response.text,
+                headers={k.lower(): v for k, v in response.headers.items()}
+            )
+        except Exception as e:
+            print(f"  ⚠ HTTP fetch failed for {url}: {e}")
+            return None
+
+    async def close(self) -> None:
+        """Close the pooled client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
@@ -0,0 +1,104 @@
+"""Collects hoster URLs from a page's network traffic."""
+
+from typing import Dict, List, Optional, Set
+from urllib.parse import urljoin
+
+from playwright.async_api import Frame, Page, Request, Response
+
+from main.fetcher.HosterRegistry import DEFAULT_REGISTRY, HosterRegistry
+
+# Frame loads are always embeds; XHR/fetch only count on embed paths
+_FRAME_RESOURCE_TYPES = {'document'}
+_DATA_RESOURCE_TYPES = {'xhr', 'fetch', 'other'}
+
+
+class NetworkLinkSniffer:
+    """
+    Watches request, response and framenavigated events for hoster URLs.
+
+    Requests are seen even if the interceptor blocks them, so player
+    iframes never have to load for their URL to be captured.
+
+    Responsibilities:
+    - Attaching to / detaching from a page's events
+    - Matching request URLs, redirect targets and frame URLs against the registry
+    - Merging captured links into extractor results (seen_urls dedupe)
+    """
+
+    def __init__(self, registry: Optional[HosterRegistry] = None):
+        """
+        Initialize network link sniffer.
+
+        Args:
+            registry: Known hoster domains (default: DEFAULT_REGISTRY)
+        """
+        self.registry = registry or DEFAULT_REGISTRY
+        self.links: Dict[str, str] = {}
+        self._page: Optional[Page] = None
+
+    def attach(self, page: Page) -> None:
+        """Start listening on a page (before it navigates)."""
+        self.detach()
+        self._page = page
+        page.on('request', self._on_request)
+        page.on('response', self._on_response)
+        page.on('framenavigated', self._on_frame_navigated)
+
+    def detach(self) -> None:
+        """Stop listening; captured links are kept."""
+        if not self._page:
+            return
+        for event, handler in (('request', self._on_request),
+                               ('response', self._on_response),
+                               ('framenavigated', self._on_frame_navigated)):
+            try:
+                self._page.remove_listener(event, handler)
+            except Exception:
+                pass
+        self._page = None
+
+    def merge_into(self, links: List[Dict], seen_urls: Set[str]) -> int:
+        """
+        Append captured links that the DOM strategies did not find.
+
+        Args:
+            links: Extractor result list ({'url', 'hoster'} dicts)
+            seen_urls: URLs already in links
+
+        Returns:
+            Number of links added
+        """
+        added = 0
+        for url, hoster in self.links.items():
+            if url in seen_urls:
+                continue
+            links.append({'url': url, 'hoster': hoster})
+            seen_urls.add(url)
+            added += 1
+            print(f"    ✓ {hoster} (network): {url[:60]}...")
+        if added:
+            print(f"  [Network] Found: {added}")
+        return added
+
+    def _capture(self, url: str) -> None:
+        if not url or not url.startswith('http') or url in self.links:
+            return
+        hoster = self.registry.match(url)
+        if hoster:
+            self.links[url] = hoster
+
+    def _on_request(self, request: Request) -> None:
+        if request.resource_type in _FRAME_RESOURCE_TYPES:
+            self._capture(request.url)
+        elif request.resource_type in _DATA_RESOURCE_TYPES and self.registry.is_embed(request.url):
+            self._capture(request.url)
+
+    def _on_response(self, response: Response) -> None:
+        # Redirects to a hoster reveal the target without following them
+        location = response.headers.get('location')
+        if location and 300 <= response.status < 400:
+            self._capture(urljoin(response.url, location))
+
+    def _on_frame_navigated(self, frame: Frame) -> None:
+        if frame.parent_frame is not None:
+            self._capture(frame.url)
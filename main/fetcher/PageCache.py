@@ -0,0 +1,210 @@
+"""Content-addressed on-disk cache of fetched pages."""
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+@dataclass
+class PageSnapshot:
+    """One cached page: final HTML plus where and when it was fetched."""
+    url: str
+    final_url: str
+    status: int
+    html: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    fetched_at: float = 0.0
+
+
+class PageCache:
+    """
+    Stores page snapshots as gzip blobs named by the SHA-256 of their HTML.
+
+    Identical pages share one blob. An SQLite index maps URLs to blobs.
+
+    Responsibilities:
+    - Storing and looking up snapshots by URL
+    - Treating entries older than the site's TTL as misses (except in replay)
+    - Evicting least recently used entries above a size limit
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 2 * 1024 ** 3,
+                 ttls: Optional[Dict[str, float]] = None, default_ttl: float = 6 * 3600):
+        """
+        Initialize page cache.
+
+        Args:
+            cache_dir: Directory for the index and blobs
+            max_bytes: Total compressed size above which entries are evicted
+            ttls: TTL in seconds per host (e.g. {'bs.to': 86400}); 0 disables reads for that host
+            default_ttl: TTL for hosts not listed in ttls
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+        os.makedirs(os.path.join(cache_dir, 'objects'), exist_ok=True)
+        self._db_path = os.path.join(cache_dir, 'index.db')
+        with sqlite3.connect(self._db_path) as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    final_url TEXT NOT NULL,
+                    digest TEXT NOT NULL,
+                    status INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    host TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS blobs (
+                    digest TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL
+                )
+            ''')
+            conn.commit()
+            self._total_bytes = conn.execute('SELECT COALESCE(SUM(size), 0) FROM blobs').fetchone()[0]
+
+    def get(self, url: str, ignore_ttl: bool = False) -> Optional[PageSnapshot]:
+        """
+        Look up a snapshot by URL.
+
+        Args:
+            url: Requested URL
+            ignore_ttl: Return expired entries too (replay mode)
+
+        Returns:
+            PageSnapshot or None if missing or expired
+        """
+        with sqlite3.connect(self._db_path) as conn:
+            row = conn.execute(
+                'SELECT final_url, digest, status, headers, host, fetched_at FROM pages WHERE url = ?',
+                (url,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            final_url, digest, status, headers, host, fetched_at = row
+            if not ignore_ttl and time.time() - fetched_at > self._ttl(host):
+                self.misses += 1
+                return None
+
+            try:
+                with open(self._blob_path(digest), 'rb') as f:
+                    html = gzip.decompress(f.read()).decode('utf-8')
+            except OSError:
+                conn.execute('DELETE FROM pages WHERE url = ?', (url,))
+                self.misses += 1
+                return None
+
+            conn.execute('UPDATE pages SET accessed_at = ? WHERE url = ?', (time.time(), url))
+            conn.commit()
+
+        self.hits += 1
+        return PageSnapshot(url=url, final_url=final_url, status=status, html=html,
+                            headers=json.loads(headers), fetched_at=fetched_at)
+
+    def put(self, url: str, final_url: str, html: str, status: int = 200,
+            headers: Optional[Dict[str, str]] = None) -> str:
+        """
+        Store a snapshot.
+
+        Args:
+            url: Requested URL (lookup key)
+            final_url: URL after redirects
+            html: Final page HTML
+            status: HTTP status code
+            headers: Response headers
+
+        Returns:
+            Content digest of the stored HTML
+        """
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        now = time.time()
+
+        with sqlite3.connect(self._db_path) as conn:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                compressed = gzip.compress(data)
+                with open(path, 'wb') as f:
+                    f.write(compressed)
+                conn.execute('INSERT OR REPLACE INTO blobs (digest, size) VALUES (?, ?)',
+                             (digest, len(compressed)))
+                self._total_bytes += len(compressed)
+
+            conn.execute('''
+                INSERT OR REPLACE INTO pages
+                    (url, final_url, digest, status, headers, host, fetched_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (url, final_url, digest, status, json.dumps(headers or {}),
+                  _host(url), now, now))
+            conn.commit()
+
+        self.stores += 1
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+        return digest
+
+    def evict(self) -> None:
+        """
+        Drop least recently used entries until the cache is below 90% of max_bytes.
+
+        Expired entries are kept (replay mode can still use them) and only
+        go away under size pressure.
+        """
+        with sqlite3.connect(self._db_path) as conn:
+            total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM blobs').fetchone()[0]
+            if total > self.max_bytes:
+                target = self.max_bytes * 0.9
+                rows = conn.execute('''
+                    SELECT p.url, b.size FROM pages p JOIN blobs b ON b.digest = p.digest
+                    ORDER BY p.accessed_at
+                ''').fetchall()
+                for url, size in rows:
+                    if total <= target:
+                        break
+                    conn.execute('DELETE FROM pages WHERE url = ?', (url,))
+                    self.evictions += 1
+                    total -= size
+                self._drop_orphans(conn)
+            conn.commit()
+            self._total_bytes = conn.execute('SELECT COALESCE(SUM(size), 0) FROM blobs').fetchone()[0]
+
+    def _drop_orphans(self, conn: sqlite3.Connection) -> None:
+        """Delete blobs no page refers to anymore."""
+        orphans = conn.execute(
+            'SELECT digest FROM blobs WHERE digest NOT IN (SELECT DISTINCT digest FROM pages)'
+        ).fetchall()
+        for (digest,) in orphans:
+            try:
+                os.remove(self._blob_path(digest))
+            except OSError:
+                pass
+            conn.execute('DELETE FROM blobs WHERE digest = ?', (digest,))
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, 'objects', digest[:2], f"{digest}.html.gz")
+
+    def _ttl(self, host: str) -> float:
+        return self.ttls.get(host, self.default_ttl)
+
+
+def _host(url: str) -> str:
+    host = (urlparse(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
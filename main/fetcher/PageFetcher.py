@@ -0,0 +1,559 @@
+"""Page fetching functionality."""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Optional, Tuple, Union
+from playwright.async_api import Page
+
+from main.extractor.ExtractionBackend import SELECTOLAX_AVAILABLE, HtmlDocument
+from main.fetcher.EscalationLadder import EscalationLadder
+from main.fetcher.HostHealth import HostHealth
+from main.fetcher.HttpFetcher import HttpFetcher, looks_like_challenge
+from main.fetcher.NetworkLinkSniffer import NetworkLinkSniffer
+from main.fetcher.PageCache import PageCache
+from main.fetcher.ReadinessStrategy import NETWORK_IDLE, ReadinessStats, ReadinessStrategy
+from main.fetcher.RequestInterceptor import InterceptionProfile, RequestInterceptor
+from main.manager.BrowserPool import BrowserPool, BrowserSlot
+from main.manager.BrowserRegistry import BrowserRegistry
+from main.manager.CamoufoxBrowserManager import CamoufoxBrowserManager
+from main.manager.ChromiumBrowserManager import ChromiumBrowserManager
+from main.manager.ContextPool import ContextPool, PooledContext
+from main.manager.StorageStateStore import StorageStateStore
+from main.statistics.StartupTimer import startup_timer
+
+# Browser ladder levels and the managers whose pools host them
+ENGINE_MANAGERS = {
+    'chromium': ChromiumBrowserManager,
+    'camoufox': CamoufoxBrowserManager,
+}
+
+
+class PageFetcher:
+    """
+    Fetches web pages using Playwright.
+
+    Responsibilities:
+    - Serving pages from the snapshot cache as HtmlDocuments, without a
+      browser (offline in replay mode)
+    - Trying a plain HTTP fetch first (if enabled), served as an
+      HtmlDocument, and falling back to browser navigation for challenge
+      pages, failed requests or missing selectors
+    - Escalating challenged URLs from HTTP to Chromium to Camoufox (if a
+      ladder is given), starting each URL on the cheapest level that worked;
+      only challenge pages move a URL's path pattern up
+    - Leasing warm browser contexts from the least loaded browser
+    - Requeueing a URL on another browser when its browser crashed
+    - Blocking heavy resources via the site's interception profile
+    - Restoring and refreshing the site's saved browser session
+    - Loading pages until the caller's readiness strategy is met
+    - Handling page load errors
+    - Deriving per-host timeouts and fast-failing hosts with an open breaker
+    - Returning pages to the pool
+    - Reporting which backend served each URL
+    - Remembering why a URL failed (for the callers' retry queues)
+    - Attaching a caller's network link sniffer while a page is leased
+
+    Site packages subclass it and set SITE (file names of the site's
+    session and ladder state), PROFILE and ENGINE for from_config().
+    """
+
+    SITE: str = ''
+    PROFILE: Optional[InterceptionProfile] = None
+    ENGINE: str = 'browser'
+
+    def __init__(self, browser_pool: BrowserPool, timeout: int = 30000,
+                 user_agent: str = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                 pool_size: int = 4, profile: Optional[InterceptionProfile] = None,
+                 block_resources: bool = True, http_fetcher: Optional[HttpFetcher] = None,
+                 session_store: Optional[StorageStateStore] = None,
+                 page_cache: Optional[PageCache] = None, replay: bool = False,
+                 ladder: Optional[EscalationLadder] = None, engine: str = 'browser',
+                 engine_pools: Optional[Dict[str, Tuple[str, Callable[[], BrowserPool]]]] = None,
+                 host_health: Optional[HostHealth] = None):
+        """
+        Initialize page fetcher.
+
+        Args:
+            browser_pool: Pool of browser processes to load pages in
+            timeout: Page load timeout in milliseconds
+            user_agent: User agent string
+            pool_size: Maximum number of browser contexts kept alive per browser
+            profile: Request interception profile of the site (None disables interception)
+            block_resources: Whether the profile is enforced or only load times are recorded
+            http_fetcher: Enables HTTP-first mode; pages are fetched over plain HTTP and
+                only navigated in the browser when that does not yield a usable document
+            session_store: Saved storage state (cookies, localStorage) for new contexts
+            page_cache: Snapshot cache; fresh entries are served as HtmlDocuments,
+                new pages are stored
+            replay: Serve pages only from page_cache and never go online
+            ladder: Escalation ladder; each URL starts on the cheapest level that
+                worked for its path pattern and moves up on challenges
+            engine: Ladder level browser_pool belongs to (e.g. 'camoufox')
+            engine_pools: Browser pools of the other ladder levels as (registry key,
+                factory); each is acquired from the BrowserRegistry on first use
+            host_health: Per-host adaptive timeouts and circuit breakers (None uses
+                timeout for every host)
+        """
+        self.browser_pool = browser_pool
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.pool_size = pool_size
+        self.interceptor = RequestInterceptor(
+            profile or InterceptionProfile(name='none', allowed_host_patterns=('*',)),
+            enabled=block_resources and profile is not None
+        )
+        self._context_pools: Dict[Tuple[str, int], Tuple[int, ContextPool]] = {}
+        self.http_fetcher = http_fetcher
+        self.session_store = session_store
+        self.page_cache = page_cache
+        self.replay = replay and page_cache is not None
+        self.ladder = ladder
+        self.engine = engine
+        self.engine_pools = engine_pools or {}
+        self._acquired_engines: Dict[str, BrowserPool] = {}
+        self.host_health = host_health
+        self._engine_lock = asyncio.Lock()
+        if http_fetcher and session_store and session_store.is_warm:
+            http_fetcher.set_cookies(session_store.cookies)
+        self.readiness_stats = ReadinessStats()
+        self.served_by: Dict[str, str] = {}
+        self.backend_counts: Dict[str, int] = {'cache': 0, 'http': 0, 'browser': 0, 'http_fallback': 0}
+        self.requeued = 0
+        self.last_errors: Dict[str, str] = {}
+        self._leased: Dict[int, Tuple[BrowserPool, BrowserSlot, ContextPool, PooledContext]] = {}
+        self._sniffers: Dict[int, NetworkLinkSniffer] = {}
+
+    @classmethod
+    def from_config(cls, config, browser_pool: BrowserPool) -> 'PageFetcher':
+        """
+        Create the site's page fetcher described by the run configuration.
+
+        Args:
+            config: Config instance
+            browser_pool: Shared browser pool of the site
+
+        Returns:
+            PageFetcher instance
+        """
+        page_cache = None
+        if config.REPLAY_MODE and not SELECTOLAX_AVAILABLE:
+            raise RuntimeError("Replay mode reads cached pages with selectolax (pip install selectolax)")
+        if config.PAGE_CACHE_ENABLED and not SELECTOLAX_AVAILABLE:
+            print("  ⚠ selectolax not installed, page cache disabled")
+        elif config.PAGE_CACHE_ENABLED or config.REPLAY_MODE:
+            page_cache = PageCache(
+                config.PAGE_CACHE_DIR,
+                max_bytes=config.PAGE_CACHE_MAX_MB * 1024 ** 2,
+                ttls=config.PAGE_CACHE_TTLS
+            )
+
+        http_first = config.HTTP_FIRST
+        if http_first and not SELECTOLAX_AVAILABLE:
+            print("  ⚠ selectolax not installed, HTTP-first disabled")
+            http_first = False
+
+        ladder = None
+        if config.ESCALATION_LADDER:
+            ladder = EscalationLadder(
+                levels=(('http',) if http_first else ()) + ('chromium', 'camoufox'),
+                path=os.path.join(config.ESCALATION_DIR, f'{cls.SITE}.json')
+            )
+
+        return cls(
+            browser_pool=browser_pool,
+            timeout=config.REQUEST_TIMEOUT * 1000,
+            pool_size=config.CONTEXT_POOL_SIZE,
+            profile=cls.PROFILE,
+            block_resources=config.BLOCK_HEAVY_RESOURCES,
+            http_fetcher=HttpFetcher(timeout=config.REQUEST_TIMEOUT * 1000) if http_first else None,
+            session_store=StorageStateStore(
+                os.path.join(config.SESSION_DIR, f'{cls.SITE}.json'),
+                max_age=config.SESSION_MAX_AGE_HOURS * 3600
+            ),
+            page_cache=page_cache,
+            replay=config.REPLAY_MODE,
+            host_health=HostHealth(
+                default_timeout_ms=config.REQUEST_TIMEOUT * 1000,
+                failure_threshold=config.BREAKER_FAILURE_THRESHOLD,
+                cooldown=config.BREAKER_COOLDOWN_SECONDS
+            ) if config.ADAPTIVE_TIMEOUTS else None,
+            ladder=ladder,
+            engine=cls.ENGINE,
+            engine_pools={
+                name: (name, lambda manager=manager: manager.pool_from_config(config))
+                for name, manager in ENGINE_MANAGERS.items() if name != cls.ENGINE
+            }
+        )
+
+    async def fetch(self, url: str, readiness: Optional[ReadinessStrategy] = None,
+                    sniffer: Optional[NetworkLinkSniffer] = None,
+                    check_breaker: bool = True, http: bool = True) -> Optional[Union[Page, HtmlDocument]]:
+        """
+        Fetch a web page as an HtmlDocument (cache or HTTP) or on a leased context.
+
+        A page must be handed back with release() (or use open()).
+        If the readiness selectors do not show up within the timeout the
+        page is still returned, since the DOM is loaded at that point.
+        HtmlDocuments need no release and see no sniffer.
+
+        Args:
+            url: URL to fetch
+            readiness: When the page counts as loaded (default: network idle)
+            sniffer: Listens to the page's network traffic from before navigation
+                until release()
+            check_breaker: False if the caller already checked the host's breaker
+                for this request (allow() must only run once per request)
+            http: False if the caller already tried the URL over plain HTTP; it then
+                starts on the cheapest browser (without teaching the ladder anything)
+
+        Returns:
+            Page, HtmlDocument or None if failed
+        """
+        readiness = readiness or NETWORK_IDLE
+        document = self._from_cache(url, readiness)
+        if document:
+            return document
+        if self.replay:
+            self._fail(url, "not in page cache (replay mode)")
+            return None
+
+        if check_breaker and self.host_health and not self.host_health.allow(url):
+            print(f"  ⏸ {url}: host failing, breaker open - skipped")
+            self.last_errors[url] = "circuit breaker open"
+            return None
+
+        if not self.ladder:
+            backend = 'browser'
+            if http and self.http_fetcher:
+                document, _ = await self._fetch_http(url, readiness)
+                if document:
+                    return document
+                backend = 'http_fallback'
+            page, _ = await self._fetch_on(self.engine, url, readiness, sniffer, backend)
+            return page
+
+        level = self.ladder.start_level(url)
+        while not http and self.ladder.levels[level] == 'http':
+            level += 1
+        backend = 'browser'
+        challenged_below = False
+        while True:
+            name = self.ladder.levels[level]
+            if name == 'http':
+                page, challenged = await self._fetch_http(url, readiness)
+                backend = 'http_fallback'
+            else:
+                page, challenged = await self._fetch_on(name, url, readiness, sniffer, backend)
+                if page is None:
+                    return None
+            if page is not None and not challenged:
+                self.ladder.record_success(url, level, escalated=challenged_below)
+                return page
+
+            # Failed requests and missing selectors over HTTP teach the ladder nothing
+            if challenged:
+                self.ladder.record_challenge(url, level)
+                challenged_below = True
+            if level == self.ladder.top:
+                print(f"  ⚠ {url}: still challenged on {name}, reading anyway")
+                return page
+            await self.release(page)
+            level += 1
+            if challenged:
+                print(f"  ↑ {url}: challenged on {name}, trying {self.ladder.levels[level]}")
+
+    async def _fetch_on(self, engine: str, url: str, readiness: ReadinessStrategy,
+                        sniffer: Optional[NetworkLinkSniffer], backend: str) -> Tuple[Optional[Page], bool]:
+        """
+        Fetch a URL on a context of one engine's browser pool.
+
+        Args:
+            backend: Name the load is counted under ('browser', or 'http_fallback'
+                after plain HTTP did not yield a usable document)
+
+        Returns:
+            (page or None if failed, whether the page is a challenge)
+        """
+        # Launch and restart failures end up in last_errors like load errors
+        try:
+            browser_pool = await self._engine_pool(engine)
+        except Exception as e:
+            return self._fail(url, f"could not start {engine}: {e}")
+
+        # One attempt per browser (plus one): a URL whose browser died is requeued
+        for _ in range(browser_pool.size + 1):
+            slot = None
+            pool = None
+            pooled = None
+            try:
+                slot = await browser_pool.acquire()
+                generation = slot.generation
+                pool = await self._context_pool(engine, slot)
+                pooled = await pool.lease()
+                if sniffer:
+                    sniffer.attach(pooled.page)
+                elapsed, challenged = await self._load(pooled.page, slot, url, readiness, engine, backend)
+                browser_pool.record_page(slot, elapsed)
+                startup_timer.mark('first_page')
+                self._leased[id(pooled.page)] = (browser_pool, slot, pool, pooled)
+                if sniffer:
+                    self._sniffers[id(pooled.page)] = sniffer
+                return pooled.page, challenged
+            except Exception as e:
+                if sniffer:
+                    sniffer.detach()
+                if slot is None:
+                    return self._fail(url, f"no browser: {e}")
+                if pooled:
+                    await pool.release(pooled)
+                browser_pool.release(slot)
+                if slot.is_alive():
+                    return self._fail(url, str(e))
+
+                print(f"  ⚠ Browser #{slot.index} died while loading {url}, requeueing")
+                self.requeued += 1
+                try:
+                    await browser_pool.restart(slot, generation)
+                except Exception as restart_error:
+                    return self._fail(url, f"browser #{slot.index} could not restart: {restart_error}")
+
+        return self._fail(url, "no healthy browser")
+
+    def _fail(self, url: str, error: str) -> Tuple[None, bool]:
+        """Report a failed load and remember why (for the callers' retry queues)."""
+        print(f"ERROR loading {url}: {error}")
+        self.last_errors[url] = error
+        return None, False
+
+    def _from_cache(self, url: str, readiness: ReadinessStrategy) -> Optional[HtmlDocument]:
+        """
+        Snapshot of a URL as a document (expired ones too in replay mode).
+
+        A cached page is served even if the selectors are missing; it was
+        read like that when it was stored.
+        """
+        if not self.page_cache:
+            return None
+        start = time.perf_counter()
+        snapshot = self.page_cache.get(url, ignore_ttl=self.replay)
+        if not snapshot:
+            return None
+        document = HtmlDocument(snapshot.html, snapshot.final_url)
+        self._record_load(url, 'cache', readiness, time.perf_counter() - start,
+                          readiness.selectors_in(document))
+        return document
+
+    async def _load(self, page: Page, slot: BrowserSlot, url: str, readiness: ReadinessStrategy,
+                    engine: str, backend: str) -> Tuple[float, bool]:
+        """
+        Navigate a leased page to a URL and record timings.
+
+        Only requests that went over the network feed the host's health;
+        challenges count neither way.
+
+        Returns:
+            (seconds until the page was ready, whether it is a challenge page)
+        """
+        start = time.perf_counter()
+        timeout = self._timeout_for(url, 'browser')
+        try:
+            response = await page.goto(url, timeout=timeout, wait_until=readiness.wait_until)
+        except Exception:
+            # A browser that died is not the host's fault
+            if slot.is_alive():
+                self._record_host(url, time.perf_counter() - start, False, 'browser')
+            raise
+        remaining = timeout - (time.perf_counter() - start) * 1000
+        ready = await readiness.wait(page, remaining)
+        status, headers = (response.status, response.headers) if response else (200, {})
+        html = await self._content(page)
+        # Selectors that showed up prove a real page, whatever the status
+        challenged = looks_like_challenge(status, html) and not (ready and readiness.selectors)
+        if not challenged:
+            self._record_host(url, time.perf_counter() - start, status < 500, 'browser')
+        if self.session_store and engine == self.engine:
+            await self._check_session(page, challenged)
+
+        if ready and not challenged and self.page_cache:
+            self._store_snapshot(url, page.url, status, headers, html)
+
+        elapsed = time.perf_counter() - start
+        self._record_load(url, backend, readiness, elapsed, ready, challenged)
+        return elapsed, challenged
+
+    def _record_load(self, url: str, backend: str, readiness: ReadinessStrategy,
+                     seconds: float, ready: bool, challenged: bool = False) -> None:
+        """Record which backend served a URL and how long it took to be ready."""
+        self._record_backend(url, backend)
+        self.readiness_stats.record(readiness, seconds, ready)
+        self.interceptor.stats.record_page_load(seconds)
+        if not ready and not challenged:
+            print(f"  ⚠ {url} not ready ({readiness.name}) after {seconds:.1f}s, reading anyway")
+
+    @staticmethod
+    async def _content(page: Page) -> str:
+        try:
+            return await page.content()
+        except Exception:
+            return ''
+
+    def _store_snapshot(self, url: str, final_url: str, status: int,
+                        headers: Dict[str, str], html: str) -> None:
+        """Put a page's final HTML into the snapshot cache."""
+        try:
+            self.page_cache.put(url, final_url, html, status=status, headers=headers)
+        except Exception as e:
+            print(f"  ⚠ Could not cache {url}: {e}")
+
+    async def _setup_context(self, context) -> None:
+        """Install the network layer on a new pooled context."""
+        await self.interceptor.install(context)
+
+    async def _engine_pool(self, engine: str) -> BrowserPool:
+        """Browser pool of a ladder level, acquired from the registry on first use."""
+        if engine == self.engine or engine not in self.engine_pools:
+            return self.browser_pool
+
+        async with self._engine_lock:
+            if engine not in self._acquired_engines:
+                key, factory = self.engine_pools[engine]
+                self._acquired_engines[engine] = await BrowserRegistry.acquire(key, factory)
+        return self._acquired_engines[engine]
+
+    async def _context_pool(self, engine: str, slot: BrowserSlot) -> ContextPool:
+        """Context pool for a browser slot, recreated after the browser was restarted."""
+        key = (engine, slot.index)
+        entry = self._context_pools.get(key)
+        if entry is None or entry[0] != slot.generation:
+            if entry is not None:
+                await entry[1].close()
+            # The saved session belongs to the site's own engine
+            own_engine = engine == self.engine and self.session_store
+            pool = ContextPool(
+                slot.browser,
+                size=self.pool_size,
+                context_options={
+                    'ignore_https_errors': True,
+                    'user_agent': self.user_agent
+                },
+                setup=self._setup_context,
+                options_provider=self.session_store.context_options if own_engine else None
+            )
+            entry = (slot.generation, pool)
+            self._context_pools[key] = entry
+        return entry[1]
+
+    async def _check_session(self, page: Page, challenged: bool) -> None:
+        """
+        Keep the saved session in sync with what the browser just saw.
+
+        A challenge page means the saved session is stale, so it is
+        invalidated once; the next real page then saves a fresh one.
+        """
+        if challenged:
+            self.session_store.invalidate()
+            return
+
+        if await self.session_store.capture(page.context) and self.http_fetcher:
+            self.http_fetcher.set_cookies(self.session_store.cookies)
+
+    async def _fetch_http(self, url: str, readiness: ReadinessStrategy) -> Tuple[Optional[HtmlDocument], bool]:
+        """
+        Fetch over plain HTTP, without a browser.
+
+        Returns:
+            (document if the response is usable, whether it is a challenge page)
+        """
+        start = time.perf_counter()
+        http_page = await self.http_fetcher.get(url, self._timeout_for(url, 'http'))
+        elapsed = time.perf_counter() - start
+        if http_page and http_page.is_challenge:
+            print(f"  ↪ {url}: challenge page (HTTP {http_page.status}), using browser")
+            return None, True
+
+        self._record_host(url, elapsed, http_page is not None and http_page.status < 500, 'http')
+        if not http_page or not http_page.is_html:
+            return None, False
+
+        document = HtmlDocument(http_page.html, http_page.url)
+        if not readiness.selectors_in(document):
+            print(f"  ↪ {url}: selectors missing in HTTP response, using browser")
+            return None, False
+
+        if self.page_cache:
+            self._store_snapshot(url, http_page.url, http_page.status, http_page.headers, http_page.html)
+        self._record_load(url, 'http', readiness, time.perf_counter() - start, True)
+        return document, False
+
+    def _timeout_for(self, url: str, backend: str) -> float:
+        """Per-host timeout of a backend ('http' or 'browser') in milliseconds."""
+        return self.host_health.timeout_for(url, self.timeout, backend) if self.host_health else self.timeout
+
+    def _record_host(self, url: str, seconds: float, ok: bool, backend: str) -> None:
+        """Feed a network request's outcome into the host's latency and breaker state."""
+        if self.host_health and not self.replay:
+            self.host_health.record(url, seconds, ok, backend)
+
+    def _record_backend(self, url: str, backend: str) -> None:
+        """Remember which backend served a URL."""
+        self.served_by[url] = backend
+        self.backend_counts[backend] += 1
+
+    async def release(self, page: Optional[Union[Page, HtmlDocument]]) -> None:
+        """
+        Return a page obtained from fetch() to the pool.
+
+        Args:
+            page: Page instance (None and HtmlDocuments are ignored)
+        """
+        if page is None:
+            return
+        sniffer = self._sniffers.pop(id(page), None)
+        if sniffer:
+            sniffer.detach()
+        leased = self._leased.pop(id(page), None)
+        if leased:
+            browser_pool, slot, pool, pooled = leased
+            await pool.release(pooled)
+            browser_pool.release(slot)
+
+    @asynccontextmanager
+    async def open(self, url: str, readiness: Optional[ReadinessStrategy] = None,
+                   sniffer: Optional[NetworkLinkSniffer] = None,
+                   check_breaker: bool = True,
+                   http: bool = True) -> AsyncIterator[Optional[Union[Page, HtmlDocument]]]:
+        """
+        Fetch a page for the duration of an ``async with`` block.
+
+        The page goes back to the pool on exit, even if the block raises.
+
+        Args:
+            url: URL to fetch
+            readiness: When the page counts as loaded (default: network idle)
+            sniffer: Listens to the page's network traffic while the block runs
+            check_breaker: False if the caller already checked the host's breaker
+            http: False if the caller already tried the URL over plain HTTP
+
+        Yields:
+            Page, HtmlDocument (cached pages) or None if failed
+        """
+        page = await self.fetch(url, readiness, sniffer, check_breaker, http)
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    async def close(self) -> None:
+        """Close all pooled contexts and release the ladder's extra browser pools."""
+        self._leased.clear()
+        self._sniffers.clear()
+        for _, pool in self._context_pools.values():
+            await pool.close()
+        self._context_pools.clear()
+        if self.http_fetcher:
+            await self.http_fetcher.close()
+        for engine in list(self._acquired_engines):
+            del self._acquired_engines[engine]
+            await BrowserRegistry.release(self.engine_pools[engine][0])
@@ -0,0 +1,135 @@
+"""Page readiness strategies used by PageFetcher."""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+from playwright.async_api import Page
+
+from main.extractor.ExtractionBackend import HtmlDocument
+
+
+@dataclass(frozen=True)
+class ReadinessStrategy:
+    """
+    Describes when a fetched page is ready to be read.
+
+    A page is ready once the navigation reached ``wait_until``, the optional
+    ``load_state`` was reached and every selector in ``selectors`` is
+    attached to the DOM. Use a comma-separated selector to wait for any
+    one of several alternatives.
+    """
+    name: str
+    wait_until: str = 'domcontentloaded'
+    selectors: Tuple[str, ...] = ()
+    load_state: str = ''
+
+    @classmethod
+    def for_selectors(cls, name: str, *selectors: str) -> 'ReadinessStrategy':
+        """
+        Create a strategy that returns as soon as the given selectors exist.
+
+        Args:
+            name: Name under which time-to-ready is recorded
+            selectors: CSS selectors the caller is going to read
+
+        Returns:
+            ReadinessStrategy instance
+        """
+        return cls(name=name, wait_until='domcontentloaded', selectors=tuple(selectors))
+
+    async def wait(self, page: Page, timeout: float) -> bool:
+        """
+        Wait until the page is ready after goto() returned.
+
+        Args:
+            page: Page that has been navigated
+            timeout: Remaining time budget in milliseconds
+
+        Returns:
+            True if ready, False if the budget ran out first
+        """
+        deadline = time.perf_counter() + timeout / 1000
+        try:
+            if self.load_state:
+                await page.wait_for_load_state(self.load_state, timeout=_remaining(deadline))
+            for selector in self.selectors:
+                await page.wait_for_selector(selector, state='attached', timeout=_remaining(deadline))
+            return True
+        except Exception:
+            return False
+
+    def selectors_in(self, document: HtmlDocument) -> bool:
+        """
+        Check the selectors against HTML that was never loaded in a browser.
+
+        Args:
+            document: HTTP response or cached snapshot
+
+        Returns:
+            True if every selector matches at least one element
+        """
+        if not self.selectors:
+            return True
+        try:
+            return document.contains(*self.selectors)
+        except Exception:
+            return False
+
+
+def _remaining(deadline: float) -> float:
+    """Milliseconds left until deadline (at least 1, 0 means 'no timeout' to Playwright)."""
+    return max(1.0, (deadline - time.perf_counter()) * 1000)
+
+
+# Legacy behaviour: wait for the network to go quiet
+NETWORK_IDLE = ReadinessStrategy(name='networkidle', wait_until='load', load_state='networkidle')
+
+# Return right after DOMContentLoaded, for callers that read static markup only
+DOM_CONTENT_LOADED = ReadinessStrategy(name='domcontentloaded')
+
+
+@dataclass
+class ReadinessTiming:
+    """Time-to-ready counters for one strategy."""
+    fetches: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    not_ready: int = 0
+
+    @property
+    def avg_seconds(self) -> float:
+        return self.total_seconds / self.fetches if self.fetches else 0.0
+
+
+@dataclass
+class ReadinessStats:
+    """Time-to-ready per strategy name."""
+    timings: Dict[str, ReadinessTiming] = field(default_factory=dict)
+
+    def record(self, strategy: ReadinessStrategy, seconds: float, ready: bool) -> None:
+        """
+        Record one fetch.
+
+        Args:
+            strategy: Strategy that was used
+            seconds: Time from goto() to ready (or giving up)
+            ready: Whether the page became ready within the budget
+        """
+        timing = self.timings.setdefault(strategy.name, ReadinessTiming())
+        timing.fetches += 1
+        timing.total_seconds += seconds
+        timing.max_seconds = max(timing.max_seconds, seconds)
+        if not ready:
+            timing.not_ready += 1
+
+    def to_dict(self) -> Dict:
+        return {
+            name: {
+                'fetches': t.fetches,
+                'avg_seconds': round(t.avg_seconds, 3),
+                'max_seconds': round(t.max_seconds, 3),
+                'not_ready': t.not_ready,
+            }
+            for name, t in self.timings.items()
+        }
@@ -0,0 +1,183 @@
+"""Persistent cache of resolved redirect targets."""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class RedirectCache:
+    """
+    Maps redirect URLs (filmpalast /redirect/<id>, bs.to hoster tabs) to
+    the hoster URL they resolved to.
+
+    Lookups go to an in-memory LRU first and to SQLite on a miss, so a
+    rerun starts warm from disk and repeated lookups within a run never
+    touch the database. Entries older than ttl are misses and get
+    replaced on the next resolution. Failed resolutions are not cached.
+
+    One SQLite connection is kept open; disk reads and writes run in a
+    worker thread so they never block the event loop.
+
+    Responsibilities:
+    - Storing resolved targets with their resolution time
+    - Serving fresh entries from the LRU or SQLite
+    - Counting hits and misses for the statistics
+    """
+
+    def __init__(self, db_path: str, ttl: float = 7 * 24 * 3600, lru_size: int = 4096):
+        """
+        Initialize redirect cache.
+
+        Args:
+            db_path: SQLite file
+            ttl: Seconds a resolved target stays valid
+            lru_size: Entries kept in memory
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self.lru_size = lru_size
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self._lru: 'OrderedDict[str, Tuple[str, float]]' = OrderedDict()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Used from worker threads, one at a time
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS redirects (
+                source TEXT PRIMARY KEY,
+                target TEXT NOT NULL,
+                resolved_at REAL NOT NULL
+            )
+        ''')
+        self._conn.commit()
+        self.purge_expired()
+
+    @classmethod
+    def from_config(cls, config) -> Optional['RedirectCache']:
+        """Redirect cache as configured, or None if REDIRECT_CACHE_ENABLED is off."""
+        if not config.REDIRECT_CACHE_ENABLED:
+            return None
+        return cls(
+            config.REDIRECT_CACHE_PATH,
+            ttl=config.REDIRECT_CACHE_TTL_HOURS * 3600,
+            lru_size=config.REDIRECT_CACHE_LRU_SIZE
+        )
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    async def get(self, url: str) -> Optional[str]:
+        """
+        Cached target of a redirect URL.
+
+        Returns:
+            Target URL or None if unknown or expired
+        """
+        key = _key(url)
+        now = time.time()
+
+        entry = self._lru.get(key)
+        if entry is not None:
+            target, resolved_at = entry
+            if now - resolved_at <= self.ttl:
+                self._lru.move_to_end(key)
+                self.memory_hits += 1
+                return target
+            del self._lru[key]
+
+        row = await asyncio.to_thread(self._read, key)
+        if row is None or now - row[1] > self.ttl:
+            self.misses += 1
+            return None
+
+        self._remember(key, row[0], row[1])
+        self.disk_hits += 1
+        return row[0]
+
+    async def put(self, url: str, target: str) -> None:
+        """Store a resolved target (empty targets are ignored)."""
+        if not target:
+            return
+        key = _key(url)
+        now = time.time()
+        self._remember(key, target, now)
+        self.stores += 1
+        await asyncio.to_thread(self._write, key, target, now)
+
+    def purge_expired(self) -> int:
+        """Delete expired entries from disk; returns how many were removed."""
+        with self._db_lock:
+            removed = self._conn.execute(
+                'DELETE FROM redirects WHERE resolved_at < ?', (time.time() - self.ttl,)
+            ).rowcount
+            self._conn.commit()
+        return removed
+
+    def close(self) -> None:
+        """Close the database connection (the in-memory LRU stays usable)."""
+        with self._db_lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def to_dict(self) -> Dict:
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'hit_rate': round(self.hit_rate, 3)
+        }
+
+    def _read(self, key: str) -> Optional[Tuple[str, float]]:
+        with self._db_lock:
+            if not self._conn:
+                return None
+            return self._conn.execute(
+                'SELECT target, resolved_at FROM redirects WHERE source = ?', (key,)
+            ).fetchone()
+
+    def _write(self, key: str, target: str, resolved_at: float) -> None:
+        with self._db_lock:
+            if not self._conn:
+                return
+            self._conn.execute(
+                'INSERT OR REPLACE INTO redirects (source, target, resolved_at) VALUES (?, ?, ?)',
+                (key, target, resolved_at)
+            )
+            self._conn.commit()
+
+    def _remember(self, key: str, target: str, resolved_at: float) -> None:
+        self._lru[key] = (target, resolved_at)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+
+def _key(url: str) -> str:
+    """Host (without www) + path + query; the redirect ID lives in the path."""
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return url
+    host = (parsed.hostname or '').lower()
+    host = host[4:] if host.startswith('www.') else host
+    key = f"{host}{parsed.path.rstrip('/')}"
+    return f"{key}?{parsed.query}" if parsed.query else key
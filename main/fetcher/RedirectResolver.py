@@ -0,0 +1,168 @@
+"""HTTP-first resolution of redirect links with a browser fallback."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Pattern, Sequence
+from urllib.parse import urlparse
+
+from main.fetcher.HostHealth import HostHealth
+from main.fetcher.HttpFetcher import HttpFetcher
+from main.fetcher.RedirectCache import RedirectCache
+
+# Resolves one redirect URL in a browser tab ("" if it could not)
+BrowserResolve = Callable[[str], Awaitable[str]]
+
+
+@dataclass
+class RedirectResolverStats:
+    """How redirect links were resolved."""
+    cached: int = 0
+    via_http: int = 0
+    via_browser: int = 0
+    unresolved: int = 0
+    skipped: int = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            'cached': self.cached,
+            'via_http': self.via_http,
+            'via_browser': self.via_browser,
+            'unresolved': self.unresolved,
+            'skipped': self.skipped
+        }
+
+
+class RedirectResolver:
+    """
+    Resolves redirect links (e.g. filmpalast /redirect/<id>) to hoster URLs.
+
+    Targets resolved in earlier runs come from the redirect cache. Other
+    links are first fetched over plain HTTP and the target is read from
+    the HTTP redirect or the location assignment in the HTML. Only if that
+    fails (challenge, no target, request error) does the link get a
+    browser tab. Links of one page resolve concurrently, bounded by
+    concurrency, and come back in their original order.
+
+    Responsibilities:
+    - Serving and storing targets through the redirect cache
+    - Resolving links over plain HTTP without a browser
+    - Falling back to a caller-supplied browser resolution
+    - Bounding concurrency per batch and keeping result order
+    - Checking the per-host breaker once per link
+    """
+
+    def __init__(self, patterns: Sequence[Pattern], http_fetcher: Optional[HttpFetcher] = None,
+                 host_health: Optional[HostHealth] = None, concurrency: int = 4,
+                 timeout_ms: float = 10000, cache: Optional[RedirectCache] = None):
+        """
+        Initialize redirect resolver.
+
+        Args:
+            patterns: Location-assignment regexes; the last match of the first matching pattern wins
+            http_fetcher: Plain HTTP client (None resolves every link in the browser)
+            host_health: Per-host breakers and adaptive timeouts (optional)
+            concurrency: Links resolved at the same time per batch
+            timeout_ms: HTTP timeout for hosts without latency history
+            cache: Persistent redirect cache (optional)
+        """
+        self.patterns = list(patterns)
+        self.http_fetcher = http_fetcher
+        self.host_health = host_health
+        self.concurrency = max(1, concurrency)
+        self.timeout_ms = timeout_ms
+        self.cache = cache
+        self.stats = RedirectResolverStats()
+
+    async def resolve_all(self, urls: List[str], browser_resolve: BrowserResolve) -> List[str]:
+        """
+        Resolve a batch of redirect links concurrently.
+
+        Args:
+            urls: Redirect URLs in page order
+            browser_resolve: Fallback that resolves one URL in a browser tab
+
+        Returns:
+            Target URL per input URL, in the same order ("" if unresolved)
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(url: str) -> str:
+            async with semaphore:
+                return await self.resolve(url, browser_resolve)
+
+        results = await asyncio.gather(*(bounded(url) for url in urls), return_exceptions=True)
+        resolved = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                print(f"      ⚠ Redirect resolution error for {url}: {result}")
+                result = ""
+            resolved.append(result)
+        return resolved
+
+    async def resolve(self, url: str, browser_resolve: BrowserResolve) -> str:
+        """
+        Resolve one redirect link: cache, then HTTP, then browser.
+
+        Returns:
+            Target URL or "" if neither HTTP nor the browser found one
+        """
+        if self.cache:
+            target = await self.cache.get(url)
+            if target:
+                self.stats.cached += 1
+                return target
+
+        # Skip redirect hosts that keep failing instead of burning the timeout
+        if self.host_health and not self.host_health.allow(url):
+            self.stats.skipped += 1
+            return ""
+
+        target = await self._resolve_http(url)
+        if target:
+            self.stats.via_http += 1
+        else:
+            target = await browser_resolve(url)
+            if target:
+                self.stats.via_browser += 1
+            else:
+                self.stats.unresolved += 1
+
+        if target and self.cache:
+            await self.cache.put(url, target)
+        return target
+
+    async def _resolve_http(self, url: str) -> str:
+        if not self.http_fetcher:
+            return ""
+        timeout = self.timeout_ms
+        if self.host_health:
+            timeout = self.host_health.timeout_for(url, self.timeout_ms, backend='http')
+
+        start = time.perf_counter()
+        http_page = await self.http_fetcher.get(url, timeout)
+        # A challenge counts neither way (as in PageFetcher); the browser takes over
+        if self.host_health and not (http_page and http_page.is_challenge):
+            ok = http_page is not None and http_page.status < 500
+            self.host_health.record(url, time.perf_counter() - start, ok, backend='http')
+        if not http_page or http_page.is_challenge:
+            return ""
+
+        # The server redirected straight to the hoster
+        if _host(http_page.url) and _host(http_page.url) != _host(url):
+            return http_page.url
+
+        for pattern in self.patterns:
+            matches = pattern.findall(http_page.html)
+            # The last match is usually the fallback without localStorage
+            if matches and matches[-1].startswith('http'):
+                return matches[-1]
+        return ""
+
+
+def _host(url: str) -> str:
+    try:
+        host = (urlparse(url).hostname or '').lower()
+    except ValueError:
+        return ''
+    return host[4:] if host.startswith('www.') else host
@@ -0,0 +1,122 @@
+"""Event-driven completion of redirect pages instead of fixed sleeps."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Pattern, Sequence
+from urllib.parse import urlparse
+
+from playwright.async_api import Page
+
+# Checks inline scripts only; the redirect target is assigned there
+_SCRIPT_MATCH_JS = """
+(sources) => {
+    const patterns = sources.map(source => new RegExp(source));
+    return Array.from(document.scripts).some(
+        script => patterns.some(pattern => pattern.test(script.text))
+    );
+}
+"""
+
+
+@dataclass
+class RedirectWaitResult:
+    """Which signal ended the wait and how long it took."""
+    signal: str
+    waited: float
+
+
+@dataclass
+class RedirectWaitStats:
+    """Time spent waiting on redirect pages compared to the old fixed sleep."""
+    resolutions: int = 0
+    waited_seconds: float = 0.0
+    saved_seconds: float = 0.0
+    signals: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, result: RedirectWaitResult, cap_seconds: float) -> None:
+        self.resolutions += 1
+        self.waited_seconds += result.waited
+        self.saved_seconds += max(0.0, cap_seconds - result.waited)
+        self.signals[result.signal] = self.signals.get(result.signal, 0) + 1
+
+    def to_dict(self) -> Dict:
+        return {
+            'resolutions': self.resolutions,
+            'waited_seconds': round(self.waited_seconds, 3),
+            'saved_seconds': round(self.saved_seconds, 3),
+            'signals': dict(self.signals)
+        }
+
+
+async def wait_for_redirect(page: Page, origin_url: str, cap_ms: float,
+                            iframe_selector: Optional[str] = None,
+                            patterns: Sequence[Pattern] = ()) -> RedirectWaitResult:
+    """
+    Wait until a redirect page has revealed its target, at most cap_ms.
+
+    Completes on whichever comes first:
+    - the page navigated to a host other than origin_url's
+    - iframe_selector is attached to the DOM
+    - an inline script matches one of the location-assignment patterns
+
+    Args:
+        page: Page after goto(..., wait_until='domcontentloaded')
+        origin_url: URL that was navigated to
+        cap_ms: Hard cap in milliseconds (the old fixed sleep)
+        iframe_selector: Player iframe that carries the target (e.g. 'iframe#bs_player')
+        patterns: Compiled location-assignment regexes
+
+    Returns:
+        RedirectWaitResult ('timeout' if no signal came within cap_ms)
+    """
+    start = time.perf_counter()
+    origin_host = _host(origin_url)
+
+    def is_foreign(url: str) -> bool:
+        host = _host(url)
+        return bool(host) and host != origin_host
+
+    if is_foreign(page.url):
+        return RedirectWaitResult('foreign_navigation', time.perf_counter() - start)
+
+    waiters = {
+        asyncio.create_task(page.wait_for_url(is_foreign, timeout=cap_ms, wait_until='commit')):
+            'foreign_navigation'
+    }
+    if iframe_selector:
+        waiters[asyncio.create_task(
+            page.wait_for_selector(iframe_selector, state='attached', timeout=cap_ms)
+        )] = 'iframe'
+    if patterns:
+        waiters[asyncio.create_task(
+            page.wait_for_function(_SCRIPT_MATCH_JS, arg=[p.pattern for p in patterns], timeout=cap_ms)
+        )] = 'location_script'
+
+    signal = 'timeout'
+    pending = set(waiters)
+    deadline = start + cap_ms / 1000
+    try:
+        while pending and signal == 'timeout':
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining,
+                                               return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if not task.cancelled() and task.exception() is None and signal == 'timeout':
+                    signal = waiters[task]
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    return RedirectWaitResult(signal, time.perf_counter() - start)
+
+
+def _host(url: str) -> str:
+    try:
+        host = (urlparse(url).hostname or '').lower()
+    except ValueError:
+        return ''
+    return host[4:] if host.startswith('www.') else host
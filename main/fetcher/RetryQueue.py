@@ -0,0 +1,168 @@
+"""Deferred retries of failed page fetches with backoff."""
+
+import asyncio
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+@dataclass
+class RetryItem:
+    """A URL waiting for another attempt."""
+    url: str
+    meta: Dict = field(default_factory=dict)
+    context: Any = None
+    attempts: int = 1
+    next_at: float = 0.0
+    last_error: str = ''
+
+
+class RetryQueue:
+    """
+    Collects failed URLs and retries them later instead of dropping them.
+
+    Every retry is scheduled with exponential backoff plus jitter. Items
+    are processed between regular work (process_due) and at the end of a
+    run (drain). After max_attempts an item counts as failed for good and
+    goes into the failure file, which a later run can retry on its own.
+
+    Responsibilities:
+    - Scheduling retries with exponential backoff and jitter
+    - Running due retries through a caller-supplied handler
+    - Capping attempts per URL
+    - Persisting and loading the final failure set
+    """
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 5.0, max_delay: float = 120.0,
+                 jitter: float = 0.5, failures_path: Optional[str] = None):
+        """
+        Initialize retry queue.
+
+        Args:
+            max_attempts: Total attempts per URL, including the original fetch
+            base_delay: Delay before the first retry in seconds
+            max_delay: Upper bound for a single backoff delay in seconds
+            jitter: Random +/- fraction applied to every delay
+            failures_path: JSON file for URLs that failed all attempts (None keeps them in memory)
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.failures_path = failures_path
+        self.retried = 0
+        self.recovered = 0
+        self.failures: List[RetryItem] = []
+        self._items: List[RetryItem] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def push(self, url: str, meta: Optional[Dict] = None, context: Any = None, error: str = '') -> None:
+        """
+        Queue a URL whose fetch just failed.
+
+        Args:
+            url: URL to retry
+            meta: JSON-serializable data needed to redo the work in a later run
+            context: In-memory object the handler needs (e.g. the series); not persisted
+            error: Why the fetch failed
+        """
+        if any(item.url == url for item in self._items):
+            return
+        item = RetryItem(url=url, meta=meta or {}, context=context, last_error=error)
+        self._schedule(item)
+
+    async def process_due(self, handler: Callable[[RetryItem], Awaitable[bool]]) -> int:
+        """
+        Retry every item whose backoff has elapsed, without waiting for the rest.
+
+        Args:
+            handler: Redoes the work for an item; returns True on success
+
+        Returns:
+            Number of items retried
+        """
+        now = time.monotonic()
+        due = [item for item in self._items if item.next_at <= now]
+        for item in due:
+            self._items.remove(item)
+            await self._attempt(item, handler)
+        return len(due)
+
+    async def drain(self, handler: Callable[[RetryItem], Awaitable[bool]]) -> None:
+        """
+        Retry until the queue is empty, sleeping until the next item is due.
+
+        Args:
+            handler: Redoes the work for an item; returns True on success
+        """
+        if self._items:
+            print(f"\n=== Retrying {len(self._items)} failed URLs ===")
+        while self._items:
+            wait = min(item.next_at for item in self._items) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            await self.process_due(handler)
+
+    def save_failures(self) -> None:
+        """Write the final failure set (an empty set removes the file)."""
+        if not self.failures_path:
+            return
+        if not self.failures:
+            try:
+                os.remove(self.failures_path)
+            except OSError:
+                pass
+            return
+
+        directory = os.path.dirname(self.failures_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        entries = [
+            {'url': item.url, 'meta': item.meta, 'attempts': item.attempts, 'last_error': item.last_error}
+            for item in self.failures
+        ]
+        tmp_path = f"{self.failures_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.failures_path)
+        print(f"  → {len(entries)} failed URLs saved: {self.failures_path}")
+
+    def load_failures(self) -> List[RetryItem]:
+        """Failure set of an earlier run (empty if there is none)."""
+        if not self.failures_path:
+            return []
+        try:
+            with open(self.failures_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return []
+        return [RetryItem(url=entry['url'], meta=entry.get('meta') or {}) for entry in entries]
+
+    async def _attempt(self, item: RetryItem, handler: Callable[[RetryItem], Awaitable[bool]]) -> None:
+        item.attempts += 1
+        self.retried += 1
+        print(f"  ↻ Retry {item.attempts}/{self.max_attempts}: {item.url}")
+        try:
+            ok = await handler(item)
+        except Exception as e:
+            item.last_error = str(e)
+            ok = False
+
+        if ok:
+            self.recovered += 1
+        elif item.attempts >= self.max_attempts:
+            self.failures.append(item)
+            print(f"  ✗ Giving up on {item.url} after {item.attempts} attempts")
+        else:
+            self._schedule(item)
+
+    def _schedule(self, item: RetryItem) -> None:
+        delay = min(self.max_delay, self.base_delay * 2 ** (item.attempts - 1))
+        delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        item.next_at = time.monotonic() + delay
+        self._items.append(item)
@@ -0,0 +1,14 @@
+"""Request interception profile for filmpalast."""
+
+from main.fetcher.RequestInterceptor import InterceptionProfile
+
+# Only filmpalast itself plus the challenge provider. Redirect targets
+# are blocked: the hoster URL is read from the redirect page's script.
+FILMPALAST_PROFILE = InterceptionProfile(
+    name='filmpalast',
+    allowed_host_patterns=(
+        'filmpalast.to',
+        '*.filmpalast.to',
+        'challenges.cloudflare.com',
+    ),
+)
@@ -1,15 +1,20 @@
 import asyncio
+import os
 import traceback
-from typing import List, Dict
+from typing import List, Dict, Optional
 from urllib.parse import urljoin
 
 from db.DatabaseManager import DatabaseManager
 from main.client.TMbdClient import TMDbClient
 from main.data import Config, MovieInfo
-from main.filmpalast.scanner.scanner.ContentScanner import ContentScanner
-from main.filmpalast.scanner.extractor.VideoLinkExtractor import VideoLinkExtractor
 from main.filmpalast.fetcher.PageFetcher import PageFetcher
 from main.filmpalast.manager.BrowserManager import BrowserManager
+from main.extractor.ExtractionBackend import ExtractionBackend
+from main.fetcher.RedirectCache import RedirectCache
+from main.fetcher.RetryQueue import RetryItem, RetryQueue
+from main.manager.BrowserRegistry import BrowserRegistry
+from main.sitespec.SpecScanner import SpecScanner
+from main.sitespec.sites import FILMPALAST_SPEC
 from main.statistics import ReportGenerator
 from main.statistics.Statistics import Statistics
 from main.verifier.DisneyVerifier import DisneyVerifier
@@ -22,13 +27,24 @@ class DisneyContentScannerCaller:
         self.config = config
         self.tmdb_client = TMDbClient(config)
         self.verifier = DisneyVerifier(config)
-        self.scanner = ContentScanner(config)
+        # In-page JavaScript or offline HTML parsing (EXTRACTION_BACKEND)
+        self.scanner = SpecScanner(
+            FILMPALAST_SPEC,
+            backend=ExtractionBackend.from_config(config),
+            redirect_cache=RedirectCache.from_config(config),
+            base_url=config.TARGET_SITE,
+            page_delay=config.PAGE_DELAY
+        )
         self.stats = Statistics()
         self.findings: List[MovieInfo] = []
         self.page = None  # Will be set during initialization
-        self.video_link_extractor = VideoLinkExtractor()
-        self.browser_manager = BrowserManager(headless=True)
+        self.browser_pool = None  # Shared via BrowserRegistry in initialize()
         self.page_fetcher = None
+        self.retry_queue = RetryQueue(
+            max_attempts=config.RETRY_MAX_ATTEMPTS,
+            base_delay=config.RETRY_BASE_DELAY_SECONDS,
+            failures_path=os.path.join(config.FAILED_URLS_DIR, 'filmpalast.json')
+        )
 
         db_path = r"C:\Users\aurel\PycharmProjects\filmdmca\db\dmcalinks.db"
         self.db_manager = DatabaseManager(db_path)
@@ -37,20 +53,24 @@ class DisneyContentScannerCaller:
 
     async def initialize(self):
         """Initialize async components."""
-        await self.browser_manager.start()
-        browser = await self.browser_manager.get_browser()
-
-        self.page_fetcher = PageFetcher(
-            browser=browser,
-            timeout=self.config.REQUEST_TIMEOUT * 1000
+        self.browser_pool = await BrowserRegistry.acquire(
+            'filmpalast',
+            lambda: BrowserManager.pool_from_config(self.config)
         )
 
-        # Initialize scanner's async components
-        await self.scanner.initialize()
+        self.page_fetcher = PageFetcher.from_config(self.config, self.browser_pool)
+
+        # The scanner reads pages and redirects through the same fetcher (one per site)
+        await self.scanner.initialize(self.page_fetcher)
 
     async def cleanup(self):
         """Cleanup async resources."""
-        await self.browser_manager.stop()
+        if self.page_fetcher:
+            await self.page_fetcher.close()
+        await self.scanner.cleanup()
+        if self.browser_pool:
+            self.browser_pool = None
+            await BrowserRegistry.release('filmpalast')
 
     async def run(self, num_pages: int = 1):
         """
@@ -63,12 +83,20 @@ class DisneyContentScannerCaller:
         print(f"Ziel: {self.config.TARGET_SITE}")
         print("Verifikation: TMDb API\n")
 
-        # Scan overview pages to collect movie information
-        movie = await self.scanner.scan_overview_pages(num_pages)
-        self.stats.pages_scanned = num_pages
+        if self.config.RETRY_FAILED_ONLY:
+            # Only the detail pages that failed for good in the last run
+            await self._retry_failed_from_last_run()
+        else:
+            # Scan overview pages to collect movie information
+            movie = await self.scanner.scan_listing(num_pages)
+            self.stats.pages_scanned = num_pages
+
+            # Scan and verify movies
+            await self._scan_movies(movie)
 
-        # Scan and verify movies
-        await self._scan_movies(movie)
+        # Detail pages that failed during the scan get their remaining attempts now
+        await self.retry_queue.drain(self._retry_detail_page)
+        self.retry_queue.save_failures()
 
         # Process results
         if self.findings:
@@ -99,6 +127,7 @@ class DisneyContentScannerCaller:
 
             # Update and print statistics
             self.stats.api_calls = self.tmdb_client.api_calls
+            self._collect_fetch_stats()
             self.stats.print()
 
             # Final summary
@@ -112,10 +141,32 @@ class DisneyContentScannerCaller:
 
         else:
             print("\nKeine Disney-Filme gefunden.")
+            self._collect_fetch_stats()
             self.stats.print()
             print(f"\n→ Datenbank: {self.db_manager.db_path}")
             print(f"→ Aktuelle Links in DB: {self.db_manager.get_link_count()}")
 
+    def _collect_fetch_stats(self):
+        """Übernimmt Fetch-Zähler (Interception, Ladezeiten) in die Statistik"""
+        fetcher = self.page_fetcher
+        if fetcher:
+            self.stats.add_interception(fetcher.interceptor.stats)
+            self.stats.add_readiness(fetcher.readiness_stats)
+            self.stats.add_backends(fetcher.backend_counts)
+            if fetcher.ladder:
+                self.stats.add_ladder(fetcher.ladder)
+            if fetcher.host_health:
+                self.stats.add_host_health(fetcher.host_health)
+            self.stats.requeued_urls += fetcher.requeued
+        self.stats.add_redirect_waits(self.scanner.redirect_wait_stats)
+        if self.scanner.redirect_cache:
+            self.stats.add_redirect_cache(self.scanner.redirect_cache)
+        for resolver in self.scanner.resolvers.values():
+            self.stats.add_redirect_resolver(resolver)
+        self.stats.add_retries(self.retry_queue)
+        self.stats.browser_restarts = self.browser_pool.restarts
+        self.stats.browser_recycles = self.browser_pool.recycles
+
     async def _scan_movies(self, movie_info: List[MovieInfo]):
         """Scannt alle Filme"""
         print(f"=== Prüfe {len(movie_info)} Filme ===\n")
@@ -157,7 +208,7 @@ class DisneyContentScannerCaller:
 
                     # Extract video links from all detail URLs for this movie
                     movie.video_links = await self._extract_video_links_from_urls(
-                        movie.source_url
+                        movie.source_url, movie
                     )
 
                     if movie.video_links:
@@ -176,12 +227,19 @@ class DisneyContentScannerCaller:
 
             await asyncio.sleep(self.config.MOVIE_DELAY)
 
-    async def _extract_video_links_from_urls(self, detail_urls: List[str]) -> List[Dict]:
+            # Retries whose backoff has elapsed run between movies
+            await self.retry_queue.process_due(self._retry_detail_page)
+
+    async def _extract_video_links_from_urls(self, detail_urls: List[str],
+                                             movie: Optional[MovieInfo] = None) -> List[Dict]:
         """
         Extract video links from a list of detail page URLs.
 
+        Detail pages that fail to load are queued for a later retry.
+
         Args:
             detail_urls: List of detail page URLs to visit
+            movie: Movie the links belong to (receives links of successful retries)
 
         Returns:
             List of video link dictionaries
@@ -197,14 +255,15 @@ class DisneyContentScannerCaller:
                     print(f"    ✗ Skipping invalid URL: {url}")
                     continue
 
-                # Navigate to detail page
-                page = await self.page_fetcher.fetch(url)
-
-                # Extract video links from this page
-                links = await self.video_link_extractor.extract_video_links(
-                    page.locator("body"),
-                    page
-                )
+                links = await self._extract_from_detail_page(url)
+                if links is None:
+                    self.retry_queue.push(
+                        url,
+                        meta={'title': movie.title, 'company': movie.disney_company} if movie else {},
+                        context=movie,
+                        error=self.page_fetcher.last_errors.get(url, '')
+                    )
+                    continue
                 all_video_links.extend(links)
 
             except Exception as e:
@@ -212,4 +271,61 @@ class DisneyContentScannerCaller:
                 traceback.print_exc()
                 continue
 
-        return all_video_links
\ No newline at end of file
+        return all_video_links
+
+    async def _extract_from_detail_page(self, url: str) -> Optional[List[Dict]]:
+        """
+        Load one detail page and extract its video links.
+
+        Returns:
+            List of video link dictionaries, or None if the page could not be loaded
+        """
+        links = await self.scanner.fetch_video_links(url)
+        if links is None:
+            return None
+
+        # watchEpisode redirects → hoster URLs (HTTP first, browser tab only as fallback)
+        await self.scanner.resolve_links(links)
+        return links
+
+    async def _retry_detail_page(self, item: RetryItem) -> bool:
+        """
+        Retry a failed detail page and add its links to the movie.
+
+        Returns:
+            True if the page loaded
+        """
+        links = await self._extract_from_detail_page(item.url)
+        if links is None:
+            item.last_error = self.page_fetcher.last_errors.get(item.url, item.last_error)
+            return False
+
+        movie = item.context
+        if movie is None:
+            return True
+        known = {link['url'] for link in movie.video_links}
+        new_links = [link for link in links if link['url'] not in known]
+        movie.video_links.extend(new_links)
+        self.stats.urls_collected += len(new_links)
+        if movie.video_links and all(found is not movie for found in self.findings):
+            self.findings.append(movie)
+            self.stats.disney_found += 1
+            print(f"✓ Disney-Film (Retry): {movie.title} → {len(movie.video_links)} Links")
+        return True
+
+    async def _retry_failed_from_last_run(self):
+        """Versucht die endgültig fehlgeschlagenen Detailseiten des letzten Laufs erneut"""
+        items = self.retry_queue.load_failures()
+        print(f"=== Wiederhole {len(items)} fehlgeschlagene Detailseiten ===\n")
+
+        movies: Dict[tuple, MovieInfo] = {}
+        for item in items:
+            key = (item.meta.get('title', ''), item.meta.get('company'))
+            if key not in movies:
+                movies[key] = MovieInfo.MovieInfo(title=key[0], source_url=[], disney_company=key[1])
+            movie = movies[key]
+            movie.source_url.append(item.url)
+
+            item.context = movie
+            if not await self._retry_detail_page(item):
+                self.retry_queue.push(item.url, meta=item.meta, context=movie, error=item.last_error)
\ No newline at end of file
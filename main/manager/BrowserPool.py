@@ -0,0 +1,240 @@
+"""Pool of browser processes with least-load sharding and crash recovery."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Set
+
+from playwright.async_api import Browser
+
+from main.manager.BrowserWatchdog import BrowserWatchdog, RecycleEvent
+
+
+@dataclass
+class BrowserSlot:
+    """One browser process in the pool."""
+    index: int
+    manager: object
+    browser: Optional[Browser] = None
+    in_flight: int = 0
+    generation: int = 0
+    restarts: int = 0
+    draining: bool = False
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def is_alive(self) -> bool:
+        try:
+            return self.browser is not None and self.browser.is_connected()
+        except Exception:
+            return False
+
+
+class BrowserPool:
+    """
+    Runs several browser processes and spreads work across them.
+
+    Responsibilities:
+    - Starting/stopping N site BrowserManagers
+    - Handing out the least loaded live browser
+    - Health-checking browsers in the background
+    - Restarting dead or hung browsers in place
+    - Draining and recycling browsers the watchdog flags
+    """
+
+    def __init__(self, manager_factory: Callable[[], object], size: int = 1,
+                 health_check_interval: float = 30.0, health_check_timeout: float = 10.0,
+                 watchdog: Optional[BrowserWatchdog] = None):
+        """
+        Initialize browser pool.
+
+        Args:
+            manager_factory: Creates a site BrowserManager (start/stop/get_browser)
+            size: Number of browser processes
+            health_check_interval: Seconds between background health checks (0 disables)
+            health_check_timeout: Seconds a probe may take before the browser counts as hung
+            watchdog: Recycles browsers that served too many pages, use too much
+                memory or got slow (None disables recycling)
+        """
+        self.manager_factory = manager_factory
+        self.size = max(1, size)
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.watchdog = watchdog
+        self.slots: List[BrowserSlot] = []
+        self.recycles = 0
+        self._health_task: Optional[asyncio.Task] = None
+        self._recycle_tasks: Set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Launch all browsers and the health check loop."""
+        if self.slots:
+            return
+
+        self.slots = [BrowserSlot(index=i, manager=self.manager_factory()) for i in range(self.size)]
+        if self.watchdog:
+            # One at a time, so each browser's processes can be told apart for RSS
+            for slot in self.slots:
+                await self._launch(slot)
+        else:
+            await asyncio.gather(*(self._launch(slot) for slot in self.slots))
+
+        if self.health_check_interval > 0:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def stop(self) -> None:
+        """Stop the health check loop and all browsers."""
+        if self._health_task:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+
+        for task in list(self._recycle_tasks):
+            task.cancel()
+
+        for slot in self.slots:
+            await self._shutdown(slot)
+        self.slots = []
+
+    async def acquire(self) -> BrowserSlot:
+        """
+        Pick the live browser with the fewest pages in flight.
+
+        Draining browsers get no new pages; if all browsers are draining
+        this waits until one of them has been recycled.
+
+        Returns:
+            BrowserSlot whose in_flight counter has been incremented
+        """
+        if not self.slots:
+            await self.start()
+
+        while True:
+            ready = [slot for slot in self.slots if slot.is_alive() and not slot.draining]
+            if ready:
+                break
+            if not any(slot.draining for slot in self.slots):
+                await self.restart(self.slots[0], self.slots[0].generation)
+                continue
+            await asyncio.sleep(0.05)
+
+        slot = min(ready, key=lambda s: s.in_flight)
+        slot.in_flight += 1
+        return slot
+
+    def release(self, slot: BrowserSlot) -> None:
+        """Return a slot obtained from acquire()."""
+        slot.in_flight = max(0, slot.in_flight - 1)
+        if slot.draining and slot.in_flight == 0:
+            self._schedule_recycle(slot)
+
+    def record_page(self, slot: BrowserSlot, seconds: float) -> None:
+        """
+        Report a page load to the watchdog.
+
+        Args:
+            slot: Slot that served the page
+            seconds: Page load time
+        """
+        if not self.watchdog:
+            return
+        self.watchdog.record_page(slot.index, seconds)
+        event = self.watchdog.check(slot.index)
+        if event:
+            self._drain(slot, event)
+
+    async def restart(self, slot: BrowserSlot, generation: int) -> bool:
+        """
+        Replace the browser of a slot with a fresh process.
+
+        Several callers may notice the same crash; the generation they saw
+        makes sure the browser is only restarted once.
+
+        Args:
+            slot: Slot to restart
+            generation: slot.generation observed by the caller
+
+        Returns:
+            True if this call restarted the browser
+        """
+        async with slot.lock:
+            if slot.generation != generation:
+                return False
+            print(f"  ↻ Restarting browser #{slot.index} (generation {slot.generation})")
+            await self._shutdown(slot)
+            await self._launch(slot)
+            slot.restarts += 1
+            return True
+
+    async def check_health(self) -> None:
+        """Probe every browser once, restart dead/hung ones and drain memory hogs."""
+        for slot in list(self.slots):
+            generation = slot.generation
+            if not await self._probe(slot):
+                await self.restart(slot, generation)
+            elif self.watchdog and not slot.draining:
+                event = self.watchdog.check(slot.index, include_rss=True)
+                if event:
+                    self._drain(slot, event)
+
+    def _drain(self, slot: BrowserSlot, event: RecycleEvent) -> None:
+        """Stop giving pages to a browser and recycle it once its last page is back."""
+        if slot.draining:
+            return
+        slot.draining = True
+        self.watchdog.log(event)
+        if slot.in_flight == 0:
+            self._schedule_recycle(slot)
+
+    def _schedule_recycle(self, slot: BrowserSlot) -> None:
+        task = asyncio.create_task(self._recycle(slot, slot.generation))
+        self._recycle_tasks.add(task)
+        task.add_done_callback(self._recycle_tasks.discard)
+
+    async def _recycle(self, slot: BrowserSlot, generation: int) -> None:
+        try:
+            if await self.restart(slot, generation):
+                self.recycles += 1
+        except Exception as e:
+            print(f"  ⚠ Recycling browser #{slot.index} failed: {e}")
+            slot.draining = False
+
+    @property
+    def restarts(self) -> int:
+        return sum(slot.restarts for slot in self.slots)
+
+    async def _probe(self, slot: BrowserSlot) -> bool:
+        if not slot.is_alive():
+            return False
+        try:
+            context = await asyncio.wait_for(slot.browser.new_context(), self.health_check_timeout)
+            await context.close()
+            return True
+        except Exception:
+            return False
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            try:
+                await self.check_health()
+            except Exception as e:
+                print(f"  ⚠ Browser health check failed: {e}")
+
+    async def _launch(self, slot: BrowserSlot) -> None:
+        pids_before = BrowserWatchdog.child_pids() if self.watchdog else set()
+        slot.browser = await slot.manager.start()
+        slot.generation += 1
+        slot.draining = False
+        if self.watchdog:
+            self.watchdog.reset(slot.index, BrowserWatchdog.child_pids() - pids_before)
+
+    async def _shutdown(self, slot: BrowserSlot) -> None:
+        try:
+            await asyncio.wait_for(slot.manager.stop(), self.health_check_timeout)
+        except Exception as e:
+            print(f"  ⚠ Browser #{slot.index} did not stop cleanly: {e}")
+            # The manager may be stuck half-stopped; start over with a fresh one
+            slot.manager = self.manager_factory()
+        slot.browser = None
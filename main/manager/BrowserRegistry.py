@@ -0,0 +1,93 @@
+"""Process-wide registry of shared, reference-counted browser pools."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Callable, Dict
+
+from main.manager.BrowserPool import BrowserPool
+
+
+@dataclass
+class _Entry:
+    pool: BrowserPool
+    refs: int = 0
+
+
+class BrowserRegistry:
+    """
+    Shares one browser pool per key (e.g. per site) across all components.
+
+    Responsibilities:
+    - Starting the pool for the first user of a key
+    - Pre-warming a pool before its first user exists
+    - Counting users of each pool
+    - Stopping the pool when the last user releases it
+    """
+
+    _entries: Dict[str, _Entry] = {}
+    _lock = asyncio.Lock()
+
+    @classmethod
+    async def acquire(cls, key: str, factory: Callable[[], BrowserPool]) -> BrowserPool:
+        """
+        Get the shared pool for a key, starting it on first use.
+
+        Every acquire() must be paired with one release().
+
+        Args:
+            key: Registry key, usually the site name
+            factory: Creates the pool if none is registered for the key
+
+        Returns:
+            Started BrowserPool
+        """
+        async with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                pool = factory()
+                await pool.start()
+                entry = _Entry(pool=pool)
+                cls._entries[key] = entry
+            entry.refs += 1
+            return entry.pool
+
+    @classmethod
+    def prewarm(cls, key: str, factory: Callable[[], BrowserPool]) -> asyncio.Task:
+        """
+        Start the pool for a key in the background.
+
+        The task holds one reference, so the pool stays up until the caller
+        releases it. Components that acquire the key meanwhile wait for the
+        launch instead of starting a second pool.
+
+        Args:
+            key: Registry key, usually the site name
+            factory: Creates the pool if none is registered for the key
+
+        Returns:
+            Task resolving to the started BrowserPool
+        """
+        return asyncio.create_task(cls.acquire(key, factory))
+
+    @classmethod
+    async def release(cls, key: str) -> None:
+        """
+        Drop one reference; the pool is stopped when none are left.
+
+        Args:
+            key: Registry key passed to acquire()
+        """
+        async with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return
+            entry.refs -= 1
+            if entry.refs <= 0:
+                del cls._entries[key]
+                await entry.pool.stop()
+
+    @classmethod
+    def refs(cls, key: str) -> int:
+        """Number of components currently holding the pool for a key."""
+        entry = cls._entries.get(key)
+        return entry.refs if entry else 0
@@ -0,0 +1,72 @@
+"""Long-lived browser servers and clients connecting to them over websocket."""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Optional
+
+from playwright.async_api import Browser, BrowserType
+
+
+async def connect(browser_type: BrowserType, ws_endpoint: str, attempts: int = 3,
+                  timeout: float = 30000) -> Optional[Browser]:
+    """
+    Connect to a running browser server, retrying with backoff.
+
+    Contexts created on the returned browser belong to this client only;
+    closing it disconnects without stopping the server.
+
+    Args:
+        browser_type: playwright.firefox or playwright.chromium (must match the server)
+        ws_endpoint: Websocket endpoint printed by the server
+        attempts: Connection attempts before giving up
+        timeout: Timeout per attempt in milliseconds
+
+    Returns:
+        Connected Browser or None if the server is unreachable
+    """
+    for attempt in range(attempts):
+        try:
+            browser = await browser_type.connect(ws_endpoint, timeout=timeout)
+        except Exception as e:
+            print(f"  ⚠ Browser server {ws_endpoint} unreachable ({attempt + 1}/{attempts}): {e}")
+            if attempt < attempts - 1:
+                await asyncio.sleep(2 ** attempt)
+            continue
+
+        browser.on('disconnected', lambda _: print(f"  ⚠ Disconnected from browser server {ws_endpoint}"))
+        print(f"  ✓ Connected to browser server {ws_endpoint}")
+        return browser
+    return None
+
+
+def launch_chromium_server(port: int, ws_path: str, headless: bool = True) -> None:
+    """
+    Run a Chromium browser server until it is interrupted (blocking).
+
+    Python Playwright has no launch_server(); the bundled driver's
+    launch-server command provides the same websocket server.
+
+    Args:
+        port: Port to listen on
+        ws_path: Path of the websocket endpoint (e.g. 'filmpalast')
+        headless: Whether to run browser in headless mode
+    """
+    config = {'headless': headless, 'port': port, 'wsPath': f"/{ws_path.lstrip('/')}"}
+    fd, config_path = tempfile.mkstemp(suffix='.json')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(config, f)
+        print(f"Browser server: ws://localhost:{port}{config['wsPath']}")
+        subprocess.run(
+            [sys.executable, '-m', 'playwright', 'launch-server',
+             '--browser', 'chromium', '--config', config_path],
+            check=True
+        )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        os.remove(config_path)
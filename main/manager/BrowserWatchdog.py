@@ -0,0 +1,143 @@
+"""Watchdog that decides when a long-running browser should be recycled."""
+
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Set
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+@dataclass
+class BrowserMetrics:
+    """Usage metrics of one browser process since its last (re)start."""
+    pages_served: int = 0
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=100))
+    pids: Set[int] = field(default_factory=set)
+
+    def p95_latency(self) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+@dataclass
+class RecycleEvent:
+    """Why and when a browser was recycled."""
+    slot: int
+    metric: str
+    value: float
+    threshold: float
+    timestamp: float
+
+
+class BrowserWatchdog:
+    """
+    Tracks pages served, process RSS and rolling p95 latency per browser.
+
+    Responsibilities:
+    - Recording page loads per browser
+    - Measuring the RSS of a browser's process tree (needs psutil)
+    - Reporting which threshold, if any, a browser has crossed
+    - Logging recycle events
+    """
+
+    def __init__(self, max_pages: int = 2000, max_rss_mb: float = 2048,
+                 max_p95_seconds: float = 10.0, latency_window: int = 100):
+        """
+        Initialize browser watchdog.
+
+        Args:
+            max_pages: Recycle after this many pages (0 disables)
+            max_rss_mb: Recycle when the process tree uses more memory (0 disables)
+            max_p95_seconds: Recycle when rolling p95 page latency exceeds this (0 disables)
+            latency_window: Number of recent page loads the p95 is computed over
+        """
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.max_p95_seconds = max_p95_seconds
+        self.latency_window = latency_window
+        self.events: List[RecycleEvent] = []
+        self._metrics: Dict[int, BrowserMetrics] = {}
+
+        if max_rss_mb and not PSUTIL_AVAILABLE:
+            print("  ⚠ psutil not installed, browser RSS is not monitored")
+
+    def metrics(self, slot_index: int) -> BrowserMetrics:
+        if slot_index not in self._metrics:
+            self._metrics[slot_index] = BrowserMetrics(latencies=deque(maxlen=self.latency_window))
+        return self._metrics[slot_index]
+
+    def reset(self, slot_index: int, pids: Optional[Set[int]] = None) -> None:
+        """Start fresh metrics after a browser was (re)launched."""
+        self._metrics[slot_index] = BrowserMetrics(
+            latencies=deque(maxlen=self.latency_window),
+            pids=pids or set()
+        )
+
+    def record_page(self, slot_index: int, seconds: float) -> None:
+        """Record one page served by a browser."""
+        metrics = self.metrics(slot_index)
+        metrics.pages_served += 1
+        metrics.latencies.append(seconds)
+
+    def check(self, slot_index: int, include_rss: bool = False) -> Optional[RecycleEvent]:
+        """
+        Check a browser against all thresholds.
+
+        Args:
+            slot_index: Browser slot
+            include_rss: Also measure RSS (slower, done from the health loop)
+
+        Returns:
+            RecycleEvent for the first crossed threshold, or None
+        """
+        metrics = self.metrics(slot_index)
+        checks = [('pages_served', metrics.pages_served, self.max_pages)]
+        if len(metrics.latencies) >= self.latency_window:
+            checks.append(('p95_latency_s', metrics.p95_latency(), self.max_p95_seconds))
+        if include_rss:
+            checks.append(('rss_mb', self.rss_mb(slot_index), self.max_rss_mb))
+
+        for metric, value, threshold in checks:
+            if threshold and value > threshold:
+                return RecycleEvent(slot=slot_index, metric=metric, value=value,
+                                    threshold=threshold, timestamp=time.time())
+        return None
+
+    def log(self, event: RecycleEvent) -> None:
+        """Remember and print a recycle event."""
+        self.events.append(event)
+        print(f"  ♻ Recycling browser #{event.slot}: {event.metric}={event.value:.1f} "
+              f"> {event.threshold:g}")
+
+    def rss_mb(self, slot_index: int) -> float:
+        """Resident memory of a browser's process tree in MB (0 without psutil)."""
+        if not PSUTIL_AVAILABLE:
+            return 0.0
+
+        total = 0
+        for pid in self.metrics(slot_index).pids:
+            try:
+                root = psutil.Process(pid)
+                for proc in [root] + root.children(recursive=True):
+                    total += proc.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 ** 2)
+
+    @staticmethod
+    def child_pids() -> Set[int]:
+        """PIDs of this process's direct children (the Playwright drivers)."""
+        if not PSUTIL_AVAILABLE:
+            return set()
+        try:
+            return {child.pid for child in psutil.Process(os.getpid()).children()}
+        except psutil.Error:
+            return set()
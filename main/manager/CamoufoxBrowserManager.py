@@ -0,0 +1,171 @@
+"""Browser lifecycle management using Camoufox."""
+
+import asyncio
+from typing import Optional
+from camoufox.async_api import AsyncNewBrowser
+from camoufox.server import launch_server
+from camoufox.utils import launch_options
+from playwright.async_api import async_playwright, Browser, Playwright
+
+from main.manager.LaunchConfigCache import LaunchConfigCache
+from main.manager.BrowserPool import BrowserPool
+from main.manager.BrowserServer import connect
+from main.manager.BrowserWatchdog import BrowserWatchdog
+from main.statistics.StartupTimer import startup_timer
+
+
+class CamoufoxBrowserManager:
+    """
+    Manages Camoufox browser lifecycle (async version).
+
+    Shared by every site that scans with Camoufox or escalates to it;
+    site packages subclass it to name their server endpoint.
+
+    Responsibilities:
+    - Starting/stopping Camoufox
+    - Reusing cached launch options (fingerprint, geoip)
+    - Launching/closing browser
+    - Connecting to a shared browser server instead (client mode)
+    - Running the shared browser server (server mode)
+    - Providing browser instances
+    """
+
+    # Key of this browser's server in Config.BROWSER_SERVER_ENDPOINTS
+    ENGINE = 'camoufox'
+
+    def __init__(self, headless: bool = True, launch_cache: Optional[LaunchConfigCache] = None,
+                 ws_endpoint: str = ""):
+        """
+        Initialize browser manager.
+
+        Args:
+            headless: Whether to run browser in headless mode
+            launch_cache: Cache for generated launch options (None generates them on every start)
+            ws_endpoint: Browser server to connect to; launches a local browser
+                if empty or the server is unreachable
+        """
+        self.headless = headless
+        self.launch_cache = launch_cache
+        self.ws_endpoint = ws_endpoint
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+
+    @classmethod
+    def pool_from_config(cls, config) -> BrowserPool:
+        """
+        Create a pool of Camoufox browsers described by the run configuration.
+
+        Args:
+            config: Config instance
+
+        Returns:
+            BrowserPool (not started yet)
+        """
+        launch_cache = LaunchConfigCache(
+            config.LAUNCH_CONFIG_PATH,
+            max_age=config.LAUNCH_CONFIG_MAX_AGE_HOURS * 3600,
+            refresh=config.REFRESH_LAUNCH_CONFIG
+        )
+        # Only a server of the same browser type can host these pages
+        ws_endpoint = config.BROWSER_SERVER_ENDPOINTS.get(cls.ENGINE, '')
+        # A shared server's memory is not ours to recycle
+        watchdog = None if ws_endpoint else BrowserWatchdog(
+            max_pages=config.RECYCLE_MAX_PAGES,
+            max_rss_mb=config.RECYCLE_MAX_RSS_MB,
+            max_p95_seconds=config.RECYCLE_MAX_P95_SECONDS
+        )
+        return BrowserPool(
+            lambda: cls(headless=True, launch_cache=launch_cache,
+                        ws_endpoint=ws_endpoint),
+            size=config.BROWSER_POOL_SIZE,
+            watchdog=watchdog
+        )
+
+    @staticmethod
+    def serve(port: int, ws_path: str, headless: bool = True) -> None:
+        """
+        Run a long-lived Camoufox server until interrupted (blocking).
+
+        Scanner processes connect with Config.BROWSER_SERVER_ENDPOINTS['camoufox']
+        set to ws://<host>:<port>/<ws_path>.
+
+        Args:
+            port: Port to listen on
+            ws_path: Path of the websocket endpoint
+            headless: Whether to run browser in headless mode
+        """
+        launch_server(port=port, ws_path=ws_path, headless=headless, humanize=True, geoip=True)
+
+    async def start(self) -> Browser:
+        """
+        Start Camoufox and launch browser.
+
+        Returns:
+            Browser instance
+        """
+        if not self._browser and self.ws_endpoint:
+            with startup_timer.phase('browser_connect'):
+                if not self._playwright:
+                    self._playwright = await async_playwright().start()
+                self._browser = await connect(self._playwright.firefox, self.ws_endpoint)
+            if not self._browser:
+                print("  ⚠ Falling back to a local browser")
+
+        if not self._browser:
+            with startup_timer.phase('launch_config'):
+                # Generating a fingerprint (and the geoip lookup) blocks for seconds
+                options = await asyncio.to_thread(self._launch_options)
+
+            with startup_timer.phase('browser_launch'):
+                if not self._playwright:
+                    self._playwright = await async_playwright().start()
+                self._browser = await AsyncNewBrowser(self._playwright, from_options=options)
+
+        return self._browser
+
+    def _launch_options(self) -> dict:
+        kwargs = {'headless': self.headless, 'humanize': True, 'geoip': True}
+        if self.launch_cache:
+            return self.launch_cache.options(**kwargs)
+        return launch_options(**kwargs)
+
+    async def stop(self) -> None:
+        """
+        Stop browser and Playwright (also after the browser crashed).
+
+        A browser connected to a server is only disconnected; the server and
+        other clients keep running.
+        """
+        if self._browser:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                print(f"  ⚠ Browser close failed: {e}")
+            self._browser = None
+
+        if self._playwright:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    async def get_browser(self) -> Browser:
+        """
+        Get browser instance (starts if not running).
+
+        Returns:
+            Browser instance
+        """
+        if not self._browser:
+            return await self.start()
+        return self._browser
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.stop()
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""Browser lifecycle management using Playwright Chromium."""
+
+from typing import Optional
+from playwright.async_api import async_playwright, Browser, Playwright
+
+from main.manager.BrowserPool import BrowserPool
+from main.manager.BrowserServer import connect, launch_chromium_server
+from main.manager.BrowserWatchdog import BrowserWatchdog
+from main.statistics.StartupTimer import startup_timer
+
+
+class ChromiumBrowserManager:
+    """
+    Manages Playwright Chromium browser lifecycle (async version).
+
+    Shared by every site that scans with Chromium or escalates to it;
+    site packages subclass it to name their server endpoint.
+
+    Responsibilities:
+    - Starting/stopping Playwright
+    - Launching/closing browser
+    - Connecting to a shared browser server instead (client mode)
+    - Running the shared browser server (server mode)
+    - Providing browser instances
+    """
+
+    # Key of this browser's server in Config.BROWSER_SERVER_ENDPOINTS
+    ENGINE = 'chromium'
+
+    def __init__(self, headless: bool = True, ws_endpoint: str = ""):
+        """
+        Initialize browser manager.
+
+        Args:
+            headless: Whether to run browser in headless mode
+            ws_endpoint: Browser server to connect to; launches a local browser
+                if empty or the server is unreachable
+        """
+        self.headless = headless
+        self.ws_endpoint = ws_endpoint
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+
+    @classmethod
+    def pool_from_config(cls, config) -> BrowserPool:
+        """
+        Create a pool of Chromium browsers described by the run configuration.
+
+        Args:
+            config: Config instance
+
+        Returns:
+            BrowserPool (not started yet)
+        """
+        # Only a server of the same browser type can host these pages
+        ws_endpoint = config.BROWSER_SERVER_ENDPOINTS.get(cls.ENGINE, '')
+        # A shared server's memory is not ours to recycle
+        watchdog = None if ws_endpoint else BrowserWatchdog(
+            max_pages=config.RECYCLE_MAX_PAGES,
+            max_rss_mb=config.RECYCLE_MAX_RSS_MB,
+            max_p95_seconds=config.RECYCLE_MAX_P95_SECONDS
+        )
+        return BrowserPool(
+            lambda: cls(headless=True, ws_endpoint=ws_endpoint),
+            size=config.BROWSER_POOL_SIZE,
+            watchdog=watchdog
+        )
+
+    @staticmethod
+    def serve(port: int, ws_path: str, headless: bool = True) -> None:
+        """
+        Run a long-lived Chromium server until interrupted (blocking).
+
+        Scanner processes connect with Config.BROWSER_SERVER_ENDPOINTS['chromium']
+        set to ws://<host>:<port>/<ws_path>.
+
+        Args:
+            port: Port to listen on
+            ws_path: Path of the websocket endpoint
+            headless: Whether to run browser in headless mode
+        """
+        launch_chromium_server(port=port, ws_path=ws_path, headless=headless)
+
+    async def start(self) -> Browser:
+        """
+        Start Playwright and launch browser.
+
+        Returns:
+            Browser instance
+        """
+        if not self._browser and self.ws_endpoint:
+            with startup_timer.phase('browser_connect'):
+                if not self._playwright:
+                    self._playwright = await async_playwright().start()
+                self._browser = await connect(self._playwright.chromium, self.ws_endpoint)
+            if not self._browser:
+                print("  ⚠ Falling back to a local browser")
+
+        if not self._browser:
+            with startup_timer.phase('browser_launch'):
+                if not self._playwright:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=self.headless
+                )
+
+        return self._browser
+
+    async def stop(self) -> None:
+        """
+        Stop browser and Playwright (also after the browser crashed).
+
+        A browser connected to a server is only disconnected; the server and
+        other clients keep running.
+        """
+        if self._browser:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                print(f"  ⚠ Browser close failed: {e}")
+            self._browser = None
+
+        if self._playwright:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    async def get_browser(self) -> Browser:
+        """
+        Get browser instance (starts if not running).
+
+        Returns:
+            Browser instance
+        """
+        if not self._browser:
+            return await self.start()
+        return self._browser
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.stop()
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""Pool of reusable browser contexts and pages."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from playwright.async_api import Browser, BrowserContext, Page
+
+
+@dataclass
+class PooledContext:
+    """A browser context with its warm page, leased from a ContextPool."""
+    context: BrowserContext
+    page: Page
+    uses: int = 0
+
+
+class ContextPool:
+    """
+    Keeps a bounded number of browser contexts alive and hands them out.
+
+    Responsibilities:
+    - Creating contexts lazily up to the configured size
+    - Leasing a context/page pair and waiting when all are in use
+    - Resetting a context before it goes back into the pool
+    - Closing every context on shutdown
+    """
+
+    def __init__(self, browser: Browser, size: int = 4, context_options: Optional[Dict] = None,
+                 setup: Optional[Callable[[BrowserContext], Awaitable[None]]] = None,
+                 options_provider: Optional[Callable[[], Dict]] = None):
+        """
+        Initialize context pool.
+
+        Args:
+            browser: Playwright browser instance
+            size: Maximum number of live contexts
+            context_options: Keyword arguments for browser.new_context()
+            setup: Coroutine run once on every new context (e.g. route handlers)
+            options_provider: Returns extra new_context() arguments at creation time
+                (e.g. the current storage state)
+        """
+        self.browser = browser
+        self.size = max(1, size)
+        self.context_options = context_options or {}
+        self.setup = setup
+        self.options_provider = options_provider
+        self._idle: List[PooledContext] = []
+        self._all: List[PooledContext] = []
+        self._slots = asyncio.Semaphore(self.size)
+        self._closed = False
+
+        self.contexts_created = 0
+        self.leases = 0
+
+    async def lease(self) -> PooledContext:
+        """
+        Lease a context/page pair, creating one if the pool is not full yet.
+
+        Returns:
+            PooledContext that must be handed back via release()
+        """
+        if self._closed:
+            raise RuntimeError("ContextPool is closed")
+
+        await self._slots.acquire()
+        try:
+            pooled = self._idle.pop() if self._idle else await self._create()
+        except Exception:
+            self._slots.release()
+            raise
+
+        pooled.uses += 1
+        self.leases += 1
+        return pooled
+
+    async def release(self, pooled: PooledContext, discard: bool = False) -> None:
+        """
+        Return a leased context to the pool.
+
+        Args:
+            pooled: Context previously obtained from lease()
+            discard: Close the context instead of reusing it
+        """
+        try:
+            if self._closed or discard or not await self._reset(pooled):
+                await self._discard(pooled)
+            else:
+                self._idle.append(pooled)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Lease a page for the duration of an ``async with`` block."""
+        pooled = await self.lease()
+        try:
+            yield pooled.page
+        finally:
+            await self.release(pooled)
+
+    async def close(self) -> None:
+        """Close all contexts owned by the pool."""
+        self._closed = True
+        for pooled in list(self._all):
+            await self._discard(pooled)
+        self._idle.clear()
+
+    async def _create(self) -> PooledContext:
+        """Create a new context with one page and register it."""
+        options = dict(self.context_options)
+        if self.options_provider:
+            options.update(self.options_provider())
+        context = await self.browser.new_context(**options)
+        if self.setup:
+            await self.setup(context)
+        page = await context.new_page()
+        pooled = PooledContext(context=context, page=page)
+        self._all.append(pooled)
+        self.contexts_created += 1
+        return pooled
+
+    async def _reset(self, pooled: PooledContext) -> bool:
+        """
+        Bring a context back into a clean state for the next lease.
+
+        Closes pages opened during the lease (e.g. redirect tabs), replaces
+        the warm page if the caller closed it and navigates to about:blank.
+        Cookies are kept so sessions stay warm.
+
+        Returns:
+            True if the context can be reused
+        """
+        try:
+            for extra in pooled.context.pages:
+                if extra is not pooled.page:
+                    await extra.close()
+
+            if pooled.page.is_closed():
+                pooled.page = await pooled.context.new_page()
+            else:
+                await pooled.page.goto('about:blank')
+            return True
+        except Exception as e:
+            print(f"  ⚠ Context reset failed, discarding: {e}")
+            return False
+
+    async def _discard(self, pooled: PooledContext) -> None:
+        """Close a context and forget about it."""
+        if pooled in self._all:
+            self._all.remove(pooled)
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
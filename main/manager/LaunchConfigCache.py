@@ -0,0 +1,109 @@
+"""On-disk cache of generated Camoufox launch options."""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from camoufox.utils import launch_options
+
+# Environment variables that carry the generated fingerprint; everything else
+# is taken from the current process at launch time and never written to disk.
+FINGERPRINT_ENV_PREFIX = 'CAMOU_'
+
+
+class LaunchConfigCache:
+    """
+    Caches the output of camoufox.utils.launch_options between runs.
+
+    Generating the options picks a fingerprint and resolves the geoip
+    location, which costs seconds on every start. Reusing them also keeps
+    the fingerprint (and with it the User-Agent) stable across runs, which
+    saved sessions depend on.
+
+    Responsibilities:
+    - Loading cached options if fresh and made for the same launch arguments
+    - Generating and saving new options otherwise (or when refresh is set)
+    - Keeping the host environment out of the cache file
+    """
+
+    def __init__(self, path: str, max_age: float = 7 * 24 * 3600, refresh: bool = False):
+        """
+        Initialize launch config cache.
+
+        Args:
+            path: JSON file holding the cached options
+            max_age: Seconds after which cached options are regenerated
+            refresh: Ignore the cache file and generate new options once
+        """
+        self.path = path
+        self.max_age = max_age
+        self.refresh = refresh
+        self.generated = 0
+        self.reused = 0
+        # Browsers of a pool start concurrently, each from a worker thread
+        self._lock = threading.Lock()
+
+    def options(self, **kwargs) -> Dict:
+        """
+        Get launch options for the given Camoufox arguments.
+
+        Args:
+            **kwargs: Arguments for launch_options (headless, humanize, geoip, ...)
+
+        Returns:
+            Keyword arguments for playwright.firefox.launch()
+        """
+        with self._lock:
+            cached = None if self.refresh else self._read(kwargs)
+            if cached is not None:
+                self.reused += 1
+                return self._with_host_env(cached)
+
+            options = launch_options(**kwargs)
+            self._write(kwargs, options)
+            self.generated += 1
+            # Only the first launch of a run regenerates; the rest reuse it
+            self.refresh = False
+            return options
+
+    def _read(self, kwargs: Dict) -> Optional[Dict]:
+        try:
+            if time.time() - os.path.getmtime(self.path) > self.max_age:
+                return None
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        options = data.get('options')
+        if data.get('kwargs') != kwargs or not isinstance(options, dict):
+            return None
+        # Camoufox was updated or moved since the options were generated
+        if not os.path.exists(options.get('executable_path', '')):
+            return None
+        return options
+
+    def _write(self, kwargs: Dict, options: Dict) -> None:
+        stored = dict(options)
+        stored['env'] = {
+            key: value for key, value in (options.get('env') or {}).items()
+            if key.startswith(FINGERPRINT_ENV_PREFIX)
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'kwargs': kwargs, 'options': stored}, f)
+            os.replace(tmp_path, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"  ⚠ Could not cache launch config: {e}")
+
+    @staticmethod
+    def _with_host_env(options: Dict) -> Dict:
+        options = dict(options)
+        options['env'] = {**os.environ, **(options.get('env') or {})}
+        return options
@@ -0,0 +1,114 @@
+"""On-disk browser storage state (cookies, localStorage) per site."""
+
+import asyncio
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+from playwright.async_api import BrowserContext
+
+
+class StorageStateStore:
+    """
+    Saves and restores a site's Playwright storage state between runs.
+
+    Responsibilities:
+    - Loading a saved session if it is not older than max_age
+    - Providing it to every new browser context
+    - Capturing a fresh session once after it was invalidated
+    - Invalidating a session that ran into a challenge page
+    """
+
+    def __init__(self, path: str, max_age: float = 12 * 3600):
+        """
+        Initialize storage state store.
+
+        Args:
+            path: JSON file holding the storage state
+            max_age: Seconds after which a saved session counts as stale
+        """
+        self.path = path
+        self.max_age = max_age
+        self.state: Optional[Dict] = self._read()
+        self.restored = self.state is not None
+        self.saves = 0
+        self.invalidations = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_warm(self) -> bool:
+        """True if a usable session is loaded."""
+        return self.state is not None
+
+    @property
+    def cookies(self) -> List[Dict]:
+        return self.state.get('cookies', []) if self.state else []
+
+    def context_options(self) -> Dict:
+        """Extra keyword arguments for browser.new_context()."""
+        return {'storage_state': self.state} if self.state else {}
+
+    async def capture(self, context: BrowserContext) -> bool:
+        """
+        Save the context's storage state if no valid session is loaded.
+
+        Only the first caller after an invalidation captures; everyone else
+        returns immediately.
+
+        Args:
+            context: Context that just loaded a real page successfully
+
+        Returns:
+            True if a new session was saved
+        """
+        if self.state is not None:
+            return False
+
+        async with self._lock:
+            if self.state is not None:
+                return False
+            try:
+                state = await context.storage_state()
+            except Exception as e:
+                print(f"  ⚠ Could not read storage state: {e}")
+                return False
+            try:
+                self._write(state)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"  ⚠ Could not save session {self.path}: {e}")
+                return False
+            self.state = state
+            self.saves += 1
+            print(f"  ✓ Session saved: {self.path}")
+            return True
+
+    def invalidate(self) -> None:
+        """Forget the current session so the next successful page refreshes it."""
+        if self.state is None:
+            return
+        self.state = None
+        self.invalidations += 1
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+        print(f"  ↻ Session invalidated: {self.path}")
+
+    def _read(self) -> Optional[Dict]:
+        try:
+            if time.time() - os.path.getmtime(self.path) > self.max_age:
+                return None
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, state: Dict) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
@@ -1,6 +1,8 @@
 import asyncio
 import importlib
 from main.data.Config import Config
+from main.manager.BrowserRegistry import BrowserRegistry
+from main.statistics.StartupTimer import startup_timer
 
 
 async def main():
@@ -23,13 +25,31 @@ async def main():
     ScannerClass = getattr(module, class_name)
 
     config = Config(TMDB_API_KEY=API_KEY,TMDB_BASE_URL="https://api.themoviedb.org/3",TARGET_SITE="https://bs.to")
-    scanner = ScannerClass(config)
+
+    # Site package (e.g. 'bsto') decides which browser the scanner will ask the registry for
+    site = module_path.split('.')[1]
+    prewarm = None
+    if config.PREWARM_BROWSER:
+        BrowserManager = importlib.import_module(f"main.{site}.manager.BrowserManager").BrowserManager
+        prewarm = BrowserRegistry.prewarm(site, lambda: BrowserManager.pool_from_config(config))
+
+    # TMDb client and DB are set up in a thread while the browser launches
+    with startup_timer.phase('scanner_setup'):
+        scanner = await asyncio.to_thread(ScannerClass, config)
 
     try:
-        await scanner.initialize()
+        with startup_timer.phase('initialize'):
+            await scanner.initialize()
         await scanner.run()
     finally:
         await scanner.cleanup()
+        if prewarm:
+            try:
+                await prewarm
+                await BrowserRegistry.release(site)
+            except Exception as e:
+                print(f"  ⚠ Browser pre-warm failed: {e}")
+        startup_timer.print()
 
 if __name__ == '__main__':
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
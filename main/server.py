@@ -0,0 +1,21 @@
+import importlib
+import os
+import sys
+
+
+def main():
+    # Browser server shared by all scanner processes of one site.
+    # Clients put the printed ws:// endpoint into Config.BROWSER_SERVER_ENDPOINTS under the
+    # browser's engine ('camoufox' for bsto, 'chromium' for filmpalast).
+    # Usage: python -m main.server [site] [port]  (or BROWSER_SERVER_SITE / BROWSER_SERVER_PORT)
+    args = sys.argv[1:]
+    site = args[0] if args else os.environ.get("BROWSER_SERVER_SITE", "bsto")
+
+    # Site package (e.g. 'bsto') decides which browser is served, as in run.py
+    BrowserManager = importlib.import_module(f"main.{site}.manager.BrowserManager").BrowserManager
+    port = int(args[1] if len(args) > 1 else os.environ.get("BROWSER_SERVER_PORT", BrowserManager.SERVER_PORT))
+    BrowserManager.serve(port=port, ws_path=site, headless=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+"""Compiles spec groups into a single-round-trip extraction."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from main.extractor.ExtractionBackend import (
+    DomQuery, ExtractionBackend, Source, attr as read_attr, inner_text, text
+)
+from main.sitespec.SiteSpec import FieldSpec, GroupSpec
+
+HTML_KEY = '__html__'
+
+# Interprets a compiled plan in the page: every group and field in one evaluation.
+# Returns raw strings only; stripping, regexes and URL joining happen in Python.
+_PLAN_JS = """
+(root, plan) => {
+    const ancestor = (el, up) => {
+        for (let i = 0; i < up && el; i++) el = el.parentElement;
+        return el;
+    };
+    const read = (el, attr) => {
+        if (!el) return null;
+        if (attr === 'text') return el.textContent;
+        if (attr === 'inner_text') return el.innerText;
+        if (attr === 'html') return el.innerHTML;
+        return el.getAttribute(attr);
+    };
+    const readSource = (item, source) => {
+        const scope = ancestor(item, source.up);
+        if (!scope) return source.many ? [] : null;
+        if (source.many) {
+            const els = source.selector ? scope.querySelectorAll(source.selector) : [scope];
+            return Array.from(els, el => read(el, source.attr));
+        }
+        return read(source.selector ? scope.querySelector(source.selector) : scope, source.attr);
+    };
+
+    const result = {};
+    if (plan.root) root = root.querySelector(plan.root);
+    for (const group of plan.groups) {
+        if (!root) {
+            result[group.name] = {total: 0, items: []};
+            continue;
+        }
+        const items = group.items ? Array.from(root.querySelectorAll(group.items)) : [root];
+        const limited = group.limit ? items.slice(0, group.limit) : items;
+        result[group.name] = {
+            total: items.length,
+            items: limited.map(item => {
+                const values = {};
+                for (const field of group.fields) {
+                    values[field.name] = field.sources.map(source => readSource(item, source));
+                }
+                return values;
+            })
+        };
+    }
+    if (plan.html) result['__html__'] = root ? root.innerHTML : '';
+    return result;
+}
+"""
+
+
+def _ancestor(node, up: int):
+    for _ in range(up):
+        if node is None:
+            return None
+        node = node.parent
+    return node
+
+
+def _read(node, attribute: str) -> Optional[str]:
+    if node is None:
+        return None
+    if attribute == 'text':
+        return text(node)
+    if attribute == 'inner_text':
+        return inner_text(node)
+    if attribute == 'html':
+        return node.inner_html
+    return read_attr(node, attribute)
+
+
+def _read_source(item, source: Dict) -> Any:
+    scope = _ancestor(item, source['up'])
+    if scope is None:
+        return [] if source['many'] else None
+    if source['many']:
+        nodes = scope.css(source['selector']) if source['selector'] else [scope]
+        return [_read(node, source['attr']) for node in nodes]
+    node = scope.css_first(source['selector']) if source['selector'] else scope
+    return _read(node, source['attr'])
+
+
+def _parse_plan(root, plan: Dict) -> Dict:
+    """Python side of _PLAN_JS for the offline HTML backend."""
+    result = {}
+    if plan['root']:
+        root = root.css_first(plan['root'])
+    for group in plan['groups']:
+        if root is None:
+            result[group['name']] = {'total': 0, 'items': []}
+            continue
+        items = root.css(group['items']) if group['items'] else [root]
+        limited = items[:group['limit']] if group['limit'] else items
+        result[group['name']] = {
+            'total': len(items),
+            'items': [
+                {field['name']: [_read_source(item, source) for source in field['sources']]
+                 for field in group['fields']}
+                for item in limited
+            ]
+        }
+    if plan['html']:
+        result[HTML_KEY] = (root.inner_html or '') if root is not None else ''
+    return result
+
+
+PLAN_QUERY = DomQuery('site_spec_plan', _PLAN_JS, _parse_plan)
+
+
+def _alternatives(spec_field) -> Tuple[FieldSpec, ...]:
+    if isinstance(spec_field, FieldSpec):
+        return (spec_field,)
+    return tuple(spec_field)
+
+
+class ExtractionPlan:
+    """
+    A set of spec groups read from one page in a single backend call.
+
+    The plan is compiled once into plain data that one generic script
+    (or its selectolax twin) interprets, so adding groups or fields never
+    adds round-trips.
+
+    Responsibilities:
+    - Compiling GroupSpecs into the plan the page script understands
+    - Running it through an ExtractionBackend
+    - Applying FieldSpec post-processing (strip, regex, absolute URLs)
+    - Skipping items that lack a required field
+    """
+
+    def __init__(self, groups: Dict[str, GroupSpec], include_html: bool = False,
+                 root: Optional[str] = None):
+        """
+        Initialize extraction plan.
+
+        Args:
+            groups: Group name -> spec, all read in the same evaluation
+            include_html: Also return the root's innerHTML (regex fallbacks)
+            root: Selector of the element all groups are read below (default: whole page)
+        """
+        self.groups = groups
+        self.include_html = include_html
+        self._compiled = {
+            'groups': [
+                {
+                    'name': name,
+                    'items': group.items,
+                    'limit': group.limit,
+                    'fields': [
+                        {
+                            'name': field_name,
+                            'sources': [
+                                {'selector': alt.selector, 'attr': alt.attr, 'up': alt.up, 'many': alt.many}
+                                for alt in _alternatives(spec_field)
+                            ]
+                        }
+                        for field_name, spec_field in group.fields.items()
+                    ]
+                }
+                for name, group in groups.items()
+            ],
+            'html': include_html,
+            'root': root
+        }
+
+    async def run(self, backend: ExtractionBackend, source: Source, base_url: str,
+                  limits: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """
+        Read all groups from a page, element or offline document.
+
+        Args:
+            backend: Extraction backend
+            source: Page, Locator or HtmlDocument
+            base_url: URL relative links are resolved against
+            limits: Per-call item limits by group name (e.g. max_series)
+
+        Returns:
+            Group name -> {'total': int, 'items': [field dicts]}; HTML_KEY -> HTML if requested.
+            total counts all matching elements, items only those with their required fields
+        """
+        plan = self._compiled
+        if limits:
+            plan = dict(plan, groups=[
+                dict(group, limit=limits.get(group['name'], group['limit'])) for group in plan['groups']
+            ])
+
+        raw = await backend.run(source, PLAN_QUERY, plan)
+        result: Dict[str, Any] = {}
+        for name, group in self.groups.items():
+            raw_group = raw[name]
+            items = [self._values(group, item, base_url) for item in raw_group['items']]
+            result[name] = {
+                'total': raw_group['total'],
+                'items': [item for item in items if all(item.get(field) for field in group.required)]
+            }
+        if self.include_html:
+            result[HTML_KEY] = raw.get(HTML_KEY, '')
+        return result
+
+    @staticmethod
+    def _values(group: GroupSpec, raw_item: Dict[str, List], base_url: str) -> Dict[str, Any]:
+        values = {}
+        for field_name, spec_field in group.fields.items():
+            value = [] if _alternatives(spec_field)[0].many else None
+            for alt, raw in zip(_alternatives(spec_field), raw_item[field_name]):
+                if alt.many:
+                    applied = [v for v in (alt.apply(r, base_url) for r in raw or []) if v]
+                else:
+                    applied = alt.apply(raw, base_url)
+                if applied:
+                    value = applied
+                    break
+            values[field_name] = value
+        return values
@@ -0,0 +1,153 @@
+"""Declarative description of a streaming site's pages."""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple, Union
+from urllib.parse import urljoin
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    Where one value lives relative to an item element.
+
+    attr is 'text' (textContent), 'inner_text', 'html' (innerHTML) or an
+    attribute name. The raw value is stripped and the remove substrings
+    are deleted, then regex is applied (group 1 if the pattern has a
+    group), then it is capitalised and made absolute against the page's
+    site root if requested. Empty results count as missing, so the next
+    alternative of a field is tried.
+    """
+    selector: Optional[str] = None  # None = the item itself
+    attr: str = 'text'
+    up: int = 0  # Ancestor levels above the item to search from
+    many: bool = False  # All matches instead of the first
+    regex: Optional[str] = None
+    absolute: bool = False
+    remove: Tuple[str, ...] = ()
+    capitalize: bool = False
+
+    def apply(self, raw: Optional[str], base_url: str = '') -> Optional[str]:
+        if raw is None:
+            return None
+        value = raw.strip()
+        if self.remove:
+            for part in self.remove:
+                value = value.replace(part, '')
+            value = value.strip()
+        if self.regex:
+            match = re.search(self.regex, value)
+            if not match:
+                return None
+            value = (match.group(1) if match.groups() else match.group(0)).strip()
+        if self.capitalize:
+            value = value.capitalize()
+        if self.absolute and value:
+            value = urljoin(base_url, value)
+        return value or None
+
+
+# One field = one FieldSpec or alternatives tried in order
+Field = Union[FieldSpec, Sequence[FieldSpec]]
+
+
+@dataclass(frozen=True)
+class GroupSpec:
+    """
+    Repeated items (e.g. articles, hoster tabs) and the fields read from each.
+
+    Items missing one of the required fields are skipped.
+    """
+    items: Optional[str]  # None = the page root
+    fields: Dict[str, Field]
+    limit: Optional[int] = None
+    required: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class ListingSpec:
+    """
+    Overview page(s) listing movies or series.
+
+    url may contain {base} and {page}. Item fields: 'title' and 'url'
+    are required; 'release_info', 'imdb_rating' and 'detail_urls'
+    (many) are used if present.
+    """
+    url: str
+    group: GroupSpec
+    pages: int = 1
+
+
+@dataclass(frozen=True)
+class DetailSpec:
+    """
+    Series/movie page: metadata fields and episode links.
+
+    metadata fields 'genres' and 'years' end up in release_info. Without
+    labels they are read from the first metadata item; with labels every
+    item is a label/value row (field 'label'), and a (field, text) pair
+    takes the field from the first row whose label contains the text.
+    episodes needs a 'url' field (links its regex rejects are skipped).
+    """
+    metadata: GroupSpec
+    episodes: Optional[GroupSpec] = None
+    labels: Tuple[Tuple[str, str], ...] = ()
+    ready: Optional[str] = None  # Selector the page counts as loaded with (default: the groups' items)
+
+
+@dataclass(frozen=True)
+class HosterGroup:
+    """
+    Elements carrying video links, in priority order within a page.
+
+    group needs a 'url' field (single or many; links its regex rejects
+    are skipped); 'hoster' is optional. Without one the label is
+    default_hoster, or derived from the URL if that is None too.
+    """
+    name: str
+    group: GroupSpec
+    default_hoster: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RedirectRule:
+    """
+    How redirect/intermediate URLs matching url_pattern reveal their target.
+
+    patterns are searched in the HTML (HTTP or browser), page_patterns
+    only in pages the browser loaded, and iframe_selector names a player
+    iframe whose src is the target. With known_hosters_only, targets
+    other than the player iframe must point at a known hoster, so captcha
+    or ad frames never count. Links nothing resolves are dropped unless
+    keep_unresolved is set.
+    """
+    url_pattern: str
+    patterns: Tuple[str, ...] = ()
+    page_patterns: Tuple[str, ...] = ()
+    iframe_selector: Optional[str] = None
+    known_hosters_only: bool = False
+    keep_unresolved: bool = False
+    concurrency: int = 4
+    timeout_ms: float = 10000
+    wait_cap_ms: float = 1000
+
+
+@dataclass(frozen=True)
+class SiteSpec:
+    """Everything the generic engine needs to scan one site."""
+    name: str
+    base_url: str
+    listing: ListingSpec
+    detail: Optional[DetailSpec] = None
+    hosters: Tuple[HosterGroup, ...] = ()
+    hoster_root: Optional[str] = None  # Only look for hosters below this element
+    hoster_ready: Optional[str] = None  # Selector hoster pages count as loaded with
+    html_patterns: Tuple[str, ...] = ()  # Regex fallback over the hoster root's HTML
+    redirects: Tuple[RedirectRule, ...] = ()
+
+    def redirect_rule(self, url: str) -> Optional[RedirectRule]:
+        """First redirect rule matching a URL."""
+        for rule in self.redirects:
+            if re.search(rule.url_pattern, url):
+                return rule
+        return None
@@ -0,0 +1,532 @@
+"""Generic scanner driven by a SiteSpec."""
+
+import asyncio
+import re
+import traceback
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import urljoin, urlparse
+
+from playwright.async_api import Page
+
+from main.data.MovieInfo import MovieInfo
+from main.extractor.ExtractionBackend import BrowserBackend, ExtractionBackend, HtmlDocument
+from main.fetcher.HosterRegistry import DEFAULT_REGISTRY
+from main.fetcher.NetworkLinkSniffer import NetworkLinkSniffer
+from main.fetcher.PageFetcher import PageFetcher
+from main.fetcher.ReadinessStrategy import ReadinessStrategy
+from main.fetcher.RedirectCache import RedirectCache
+from main.fetcher.RedirectResolver import RedirectResolver
+from main.fetcher.RedirectWait import RedirectWaitStats, wait_for_redirect
+from main.sitespec.ExtractionPlan import HTML_KEY, ExtractionPlan
+from main.sitespec.SiteSpec import FieldSpec, GroupSpec, RedirectRule, SiteSpec
+
+# Post-processes the entries of one hoster group (e.g. collapsing language variants)
+GroupFilter = Callable[[List[Dict]], List[Dict]]
+
+
+class SpecScanner:
+    """
+    Scans any site described by a SiteSpec.
+
+    Each page kind (listing, detail, hoster page) is one compiled
+    ExtractionPlan, so a page costs one backend call no matter how many
+    fields the spec reads. Pages come from the site's PageFetcher (page
+    cache, HTTP or browser); redirect links are resolved in batches
+    through one RedirectResolver per redirect rule (cache, HTTP, browser).
+
+    Responsibilities:
+    - Compiling the spec's groups into extraction plans
+    - Deriving readiness strategies from the spec's selectors
+    - Turning listing items into MovieInfo objects
+    - Reading metadata and episode links of detail pages
+    - Collecting, deduplicating and resolving hoster links
+    """
+
+    def __init__(self, spec: SiteSpec, backend: Optional[ExtractionBackend] = None,
+                 redirect_cache: Optional[RedirectCache] = None, base_url: Optional[str] = None,
+                 page_delay: float = 0, group_filters: Optional[Dict[str, GroupFilter]] = None):
+        """
+        Initialize spec scanner.
+
+        Args:
+            spec: Site specification
+            backend: Extraction backend (default: in-page JavaScript)
+            redirect_cache: Persistent redirect cache (optional, closed in cleanup())
+            base_url: Overrides spec.base_url (e.g. config.TARGET_SITE)
+            page_delay: Seconds to wait after each listing or detail page
+            group_filters: Hoster group name -> filter applied to that group's links
+        """
+        self.spec = spec
+        self.backend = backend or BrowserBackend()
+        self.redirect_cache = redirect_cache
+        self.base_url = (base_url or spec.base_url).rstrip('/')
+        self.page_delay = page_delay
+        self.group_filters = group_filters or {}
+        self.page_fetcher: Optional[PageFetcher] = None
+        self.redirect_wait_stats = RedirectWaitStats()
+
+        self.listing_plan = ExtractionPlan({'items': spec.listing.group})
+        detail_groups = {}
+        if spec.detail:
+            detail_groups['metadata'] = spec.detail.metadata
+            if spec.detail.episodes:
+                detail_groups['episodes'] = spec.detail.episodes
+        self.detail_plan = ExtractionPlan(detail_groups) if detail_groups else None
+        self.hoster_plan = ExtractionPlan(
+            {hoster.name: hoster.group for hoster in spec.hosters},
+            include_html=bool(spec.html_patterns),
+            root=spec.hoster_root
+        )
+
+        self.resolvers: Dict[str, RedirectResolver] = {
+            rule.url_pattern: RedirectResolver(
+                [re.compile(pattern) for pattern in rule.patterns],
+                concurrency=rule.concurrency,
+                timeout_ms=rule.timeout_ms,
+                cache=redirect_cache
+            )
+            for rule in spec.redirects
+        }
+        # Player iframe of a loaded redirect page, read like any other group
+        self._iframe_plans: Dict[str, ExtractionPlan] = {
+            rule.url_pattern: ExtractionPlan({'iframe': GroupSpec(rule.iframe_selector, {
+                'src': FieldSpec(attr='src', regex=r'^(http.*)')
+            }, limit=1)})
+            for rule in spec.redirects if rule.iframe_selector
+        }
+
+        self.listing_readiness = ReadinessStrategy.for_selectors(
+            f'{spec.name}:listing', spec.listing.group.items or 'body'
+        )
+        self.detail_readiness = ReadinessStrategy.for_selectors(
+            f'{spec.name}:detail',
+            (spec.detail and spec.detail.ready)
+            or ', '.join(group.items for group in detail_groups.values() if group.items) or 'body'
+        )
+        self.hoster_readiness = ReadinessStrategy.for_selectors(
+            f'{spec.name}:hosters',
+            spec.hoster_ready or ', '.join(h.group.items for h in spec.hosters if h.group.items) or 'body'
+        )
+        # Redirect pages are read right after DOMContentLoaded: read_redirect_target waits
+        # (briefly) for the iframe, script or navigation that reveals the target; a selector
+        # would wait out the timeout on pages without one
+        self.redirect_readiness = ReadinessStrategy(name=f'{spec.name}:redirect')
+
+    async def initialize(self, page_fetcher: PageFetcher) -> None:
+        """
+        Read pages through the site's fetcher (the caller keeps owning it).
+
+        Redirect resolution shares the fetcher's per-host timeouts and
+        breakers, and tries plain HTTP with the session cookies first; a
+        replay resolves from the redirect cache and never goes online.
+        """
+        self.page_fetcher = page_fetcher
+        for resolver in self.resolvers.values():
+            resolver.host_health = page_fetcher.host_health
+            resolver.http_fetcher = None if page_fetcher.replay else page_fetcher.http_fetcher
+
+    async def cleanup(self) -> None:
+        """Stop the parser workers and close the redirect cache."""
+        await self.backend.close()
+        if self.redirect_cache:
+            self.redirect_cache.close()
+
+    def listing_urls(self, pages: Optional[int] = None) -> List[str]:
+        """URLs of the listing pages to scan (spec.listing.pages unless given)."""
+        count = pages or self.spec.listing.pages
+        return [
+            self.spec.listing.url.format(base=self.base_url, page=page_num)
+            for page_num in range(1, count + 1)
+        ]
+
+    async def scan_listing(self, pages: Optional[int] = None, limit: Optional[int] = None) -> List[MovieInfo]:
+        """
+        Fetch the listing pages and turn their items into MovieInfo objects.
+
+        Args:
+            pages: Number of listing pages (default: the spec's)
+            limit: Maximum number of items over all pages (default: all)
+
+        Returns:
+            List of MovieInfo objects
+        """
+        urls = self.listing_urls(pages)
+        print(f"\n=== Scanning {len(urls)} listing pages ({self.spec.name}) ===\n")
+
+        movies: List[MovieInfo] = []
+        for page_num, url in enumerate(urls, 1):
+            remaining = limit - len(movies) if limit else None
+            if remaining is not None and remaining <= 0:
+                break
+            try:
+                print(f"Page {page_num}/{len(urls)}...")
+                print("URL:", url)
+
+                async with self.page_fetcher.open(url, self.listing_readiness) as page:
+                    if not page:
+                        print("Error! Page not loaded!")
+                        continue
+
+                    total, page_movies = await self.extract_listing(page, remaining)
+                    print(f"  → {total} items found")
+                    movies.extend(page_movies)
+
+                await asyncio.sleep(self.page_delay)
+
+            except Exception as e:
+                print(f"Error on page {page_num}: {e}")
+                traceback.print_exc()
+
+        print(f"\n{len(movies)} items collected\n")
+        return movies
+
+    async def scan_detail(self, movie: MovieInfo) -> List[str]:
+        """
+        Fetch a movie's detail page (its first source URL) and read it.
+
+        Args:
+            movie: MovieInfo whose release_info receives the page's metadata
+
+        Returns:
+            Episode URLs in page order ([] if the page did not load)
+        """
+        if not self.detail_plan or not movie.source_url:
+            return []
+
+        episode_urls: List[str] = []
+        try:
+            url = movie.source_url[0]
+            print(f"  Opening detail page: {url}")
+
+            async with self.page_fetcher.open(url, self.detail_readiness) as page:
+                if not page:
+                    print("  ✗ Detail page not loaded")
+                    return []
+                episode_urls = await self.extract_detail(page, movie)
+
+            print(f"  Found {len(episode_urls)} episode links")
+            await asyncio.sleep(self.page_delay)
+
+        except Exception as e:
+            print(f"  ✗ Error scanning detail page: {e}")
+            traceback.print_exc()
+
+        return episode_urls
+
+    async def fetch_video_links(self, url: str) -> Optional[List[Dict]]:
+        """
+        Fetch a page with hoster links and collect them (redirects unresolved).
+
+        The page goes back to the pool before anything is resolved, so
+        resolve_links can batch the redirects of several pages.
+
+        Args:
+            url: Hoster page (episode or movie detail page)
+
+        Returns:
+            Link dictionaries, or None if the page could not be loaded
+        """
+        # Player requests are captured while the page loads
+        sniffer = NetworkLinkSniffer()
+        async with self.page_fetcher.open(url, self.hoster_readiness, sniffer) as page:
+            if not page:
+                return None
+            return await self.extract_video_links(page, sniffer)
+
+    async def extract_listing(self, page: Union[Page, HtmlDocument],
+                              limit: Optional[int] = None) -> Tuple[int, List[MovieInfo]]:
+        """
+        Read all items of a listing page.
+
+        Args:
+            page: Listing page or its HtmlDocument
+            limit: Maximum number of items (default: the spec's limit)
+
+        Returns:
+            Tuple of (items on the page, MovieInfo objects)
+        """
+        limits = {'items': limit} if limit else None
+        result = await self.listing_plan.run(self.backend, page, _site_root(page.url, self.base_url), limits)
+        listing = result['items']
+
+        movies = []
+        for item in listing['items']:
+            title = item.get('title')
+            if not title:
+                continue
+
+            source_url = [item['url']] if item.get('url') else []
+            for detail_url in item.get('detail_urls') or []:
+                if detail_url not in source_url:
+                    source_url.append(detail_url)
+
+            movies.append(MovieInfo(
+                title=title,
+                source_url=source_url,
+                release_info=item.get('release_info') or "",
+                imdb_rating=item.get('imdb_rating') or ""
+            ))
+        return listing['total'], movies
+
+    async def extract_detail(self, page: Union[Page, HtmlDocument],
+                             movie: Optional[MovieInfo] = None) -> List[str]:
+        """
+        Read metadata and episode links of a detail page.
+
+        Metadata fields 'genres' and 'years' are appended to the movie's
+        release_info as "Genres: ... | Years: ..." (many-fields count with
+        their first entry).
+
+        Args:
+            page: Detail page or its HtmlDocument
+            movie: MovieInfo to complete (optional)
+
+        Returns:
+            Episode URLs in page order, without duplicates
+        """
+        if not self.detail_plan:
+            return []
+
+        result = await self.detail_plan.run(self.backend, page, _site_root(page.url, self.base_url))
+
+        if movie is not None:
+            metadata = self._metadata(result['metadata']['items'])
+            parts = [
+                f"{label}: {_first(metadata.get(name))}"
+                for name, label in (('genres', 'Genres'), ('years', 'Years'))
+                if _first(metadata.get(name))
+            ]
+            extra = " | ".join(parts)
+            if extra:
+                movie.release_info = f"{movie.release_info} | {extra}" if movie.release_info else extra
+
+        episode_urls: List[str] = []
+        for item in result.get('episodes', {}).get('items', []):
+            url = item.get('url')
+            if url and url not in episode_urls:
+                episode_urls.append(url)
+        return episode_urls
+
+    async def extract_video_links(self, page: Union[Page, HtmlDocument],
+                                  sniffer: Optional[NetworkLinkSniffer] = None) -> List[Dict]:
+        """
+        Collect the hoster links of a page in the spec's priority order.
+
+        Redirect links are kept as they are; resolve_links replaces them
+        by their targets.
+
+        Args:
+            page: Page with hoster links or its HtmlDocument
+            sniffer: Network sniffer that watched the page load (optional)
+
+        Returns:
+            List of dictionaries with 'url' and 'hoster' keys
+        """
+        links: List[Dict] = []
+        seen_urls: Set[str] = set()
+
+        print(f"→ Extracting video links ({self.spec.name})...")
+
+        try:
+            collected = await self.hoster_plan.run(self.backend, page, _site_root(page.url, self.base_url))
+        except Exception as e:
+            print(f"  [Collect] ⚠ Error: {e}")
+            collected = None
+
+        if collected:
+            for hoster_group in self.spec.hosters:
+                entries = [
+                    entry for entry in self._hoster_entries(collected[hoster_group.name]['items'],
+                                                            hoster_group.default_hoster)
+                    if entry['url'] not in seen_urls
+                ]
+                if hoster_group.name in self.group_filters:
+                    entries = self.group_filters[hoster_group.name](entries)
+                if not entries:
+                    continue
+                print(f"  [{hoster_group.name}] Found: {len(entries)}")
+
+                for entry in entries:
+                    self._add_link(links, seen_urls, entry)
+
+            for pattern in self.spec.html_patterns:
+                for url in re.findall(pattern, collected.get(HTML_KEY, '')):
+                    if _is_valid_url(url):
+                        self._add_link(links, seen_urls, {'url': url, 'hoster': _hoster_name(url)})
+
+        # Hoster URLs the page requested while loading
+        if sniffer:
+            sniffer.merge_into(links, seen_urls)
+
+        if not links:
+            print("  ⚠ NO video links found!")
+        else:
+            print(f"✓ Total: {len(links)} unique video links extracted\n")
+        return links
+
+    async def resolve_links(self, links: List[Dict]) -> int:
+        """
+        Resolve the redirect links of a batch (e.g. all episodes of a series) at once.
+
+        Every distinct redirect URL is resolved once: redirect cache, then
+        plain HTTP, then a browser tab from the site's fetcher. Resolved
+        links get the target as 'url' and keep the original in
+        'source_url'; unresolved ones are dropped unless their rule keeps
+        them. Links that end up on the same URL are merged.
+
+        Args:
+            links: Link dicts from extract_video_links (modified in place)
+
+        Returns:
+            Number of distinct redirect URLs resolved
+        """
+        # The same redirect is often listed on several pages of a batch
+        pending = list(dict.fromkeys(link['url'] for link in links if self._needs_resolution(link['url'])))
+        if not pending:
+            return 0
+
+        print(f"→ Resolving {len(pending)} redirect links...")
+        targets: Dict[str, str] = {}
+        for rule in self.spec.redirects:
+            urls = [url for url in pending if self.spec.redirect_rule(url) is rule]
+            if not urls:
+                continue
+            results = await self.resolvers[rule.url_pattern].resolve_all(
+                urls, lambda url, rule=rule: self._open_redirect(url, rule)
+            )
+            targets.update(zip(urls, results))
+
+        seen_urls: Set[str] = set()
+        unique_links = []
+        for link in links:
+            if link['url'] in targets:
+                target = targets[link['url']]
+                if target:
+                    link['source_url'] = link['url']
+                    link['url'] = target
+                elif not self.spec.redirect_rule(link['url']).keep_unresolved:
+                    continue
+            if link['url'] not in seen_urls:
+                seen_urls.add(link['url'])
+                unique_links.append(link)
+        links[:] = unique_links
+
+        resolved = sum(1 for target in targets.values() if target)
+        print(f"✓ {resolved}/{len(pending)} redirect links resolved\n")
+        return resolved
+
+    async def read_redirect_target(self, page: Union[Page, HtmlDocument], url: str, rule: RedirectRule) -> str:
+        """
+        Target of a loaded redirect page ("" if it reveals none).
+
+        A live page gets up to rule.wait_cap_ms for the iframe, script or
+        navigation to show up; an HtmlDocument (cached page) is read
+        without waiting.
+
+        Args:
+            page: Redirect page or its HtmlDocument
+            url: URL the page was loaded from
+            rule: Redirect rule of the URL
+        """
+        patterns = [re.compile(pattern) for pattern in rule.patterns]
+        if not isinstance(page, HtmlDocument):
+            result = await wait_for_redirect(
+                page, url, rule.wait_cap_ms,
+                iframe_selector=rule.iframe_selector, patterns=patterns
+            )
+            self.redirect_wait_stats.record(result, rule.wait_cap_ms / 1000)
+
+        if rule.iframe_selector:
+            iframe = await self._iframe_plans[rule.url_pattern].run(self.backend, page, url)
+            if iframe['iframe']['items']:
+                return iframe['iframe']['items'][0]['src']
+
+        content = page.html if isinstance(page, HtmlDocument) else await page.content()
+        for pattern in patterns + [re.compile(pattern) for pattern in rule.page_patterns]:
+            # The last match is usually the fallback without localStorage
+            for candidate in reversed(pattern.findall(content)):
+                if self._accepts(candidate, rule):
+                    return candidate
+
+        if page.url != url and self._accepts(page.url, rule):
+            return page.url
+        return ""
+
+    async def _open_redirect(self, url: str, rule: RedirectRule) -> str:
+        # Browser fallback: the resolver already checked the host's breaker and tried plain HTTP
+        async with self.page_fetcher.open(url, self.redirect_readiness, check_breaker=False, http=False) as page:
+            if not page:
+                return ""
+            return await self.read_redirect_target(page, url, rule)
+
+    def _metadata(self, items: List[Dict]) -> Dict:
+        labels = self.spec.detail.labels
+        if not labels:
+            return items[0] if items else {}
+
+        metadata = {}
+        for name, label in labels:
+            row = next((item for item in items if label in (item.get('label') or '').lower()), None)
+            if row is not None:
+                metadata[name] = row.get(name)
+        return metadata
+
+    @staticmethod
+    def _hoster_entries(items: List[Dict], default_hoster: Optional[str]) -> List[Dict]:
+        entries = []
+        for item in items:
+            raw_urls = item.get('url')
+            for url in raw_urls if isinstance(raw_urls, list) else [raw_urls]:
+                if not _is_valid_url(url):
+                    continue
+                hoster = _first(item.get('hoster')) or default_hoster or _hoster_name(url)
+                entries.append({'url': url, 'hoster': hoster})
+        return entries
+
+    def _needs_resolution(self, url: str) -> bool:
+        return self.spec.redirect_rule(url) is not None and not DEFAULT_REGISTRY.match(url)
+
+    @staticmethod
+    def _accepts(url: Optional[str], rule: RedirectRule) -> bool:
+        return _is_valid_url(url) and (not rule.known_hosters_only or DEFAULT_REGISTRY.match(url) is not None)
+
+    @staticmethod
+    def _add_link(links: List[Dict], seen_urls: Set[str], entry: Dict) -> None:
+        if entry['url'] in seen_urls:
+            return
+        links.append(entry)
+        seen_urls.add(entry['url'])
+        print(f"    ✓ {entry['hoster']}: {entry['url'][:60]}...")
+
+
+def _site_root(url: Optional[str], fallback: str) -> str:
+    """Root of the page's site; relative links are site-relative (bs.to's lack the leading slash)."""
+    try:
+        parsed = urlparse(url or '')
+    except ValueError:
+        parsed = None
+    if parsed and parsed.scheme and parsed.netloc:
+        return f"{parsed.scheme}://{parsed.netloc}/"
+    return urljoin(fallback, '/')
+
+
+def _first(value):
+    """First entry of a many-field, or the value itself."""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _is_valid_url(url: Optional[str]) -> bool:
+    return bool(url) and url.startswith('http')
+
+
+def _hoster_name(url: str) -> str:
+    """Capitalised main domain of a URL (https://voe.sx/e/abc -> Voe)."""
+    try:
+        domain = re.sub(r'^www\d?\.', '', urlparse(url).netloc).split(':')[0]
+    except ValueError:
+        return "Unknown"
+    parts = domain.split('.')
+    main_domain = parts[-2] if len(parts) >= 2 else parts[0]
+    return main_domain.capitalize() or "Unknown"
@@ -0,0 +1,162 @@
+"""Site specifications for the supported streaming sites."""
+
+from typing import Dict
+
+from main.sitespec.SiteSpec import (
+    DetailSpec, FieldSpec, GroupSpec, HosterGroup, ListingSpec, RedirectRule, SiteSpec
+)
+
+# JavaScript redirect assignments on redirect pages
+LOCATION_PATTERNS = (
+    r"window\.location\.href\s*=\s*['\"]([^'\"]+)['\"]",
+    r"location\.href\s*=\s*['\"]([^'\"]+)['\"]",
+    r"window\.location\s*=\s*['\"]([^'\"]+)['\"]",
+)
+
+
+def _href(selector=None, **kwargs) -> FieldSpec:
+    return FieldSpec(selector, attr='href', **kwargs)
+
+
+def _class_except(*generic: str) -> str:
+    """Regex for the first class of an element that is not one of the generic ones."""
+    return rf"(?i)(?:^|\s)(?!(?:{'|'.join(generic)})(?:\s|$))(\S+)"
+
+
+BSTO_SPEC = SiteSpec(
+    name='bsto',
+    base_url='https://bs.to',
+    listing=ListingSpec(
+        url='{base}/andere-serien',
+        group=GroupSpec('#seriesContainer .genre ul li a', {
+            'title': FieldSpec(),
+            'url': _href(absolute=True),
+        }),
+    ),
+    detail=DetailSpec(
+        # <div><span>Genres</span><p>...</p></div>, <div><span>Produktionsjahre</span><p><em>2010</em>...</p></div>
+        metadata=GroupSpec('.infos div', {
+            'label': FieldSpec('span'),
+            'genres': FieldSpec('p'),
+            'years': FieldSpec('p em'),
+        }),
+        labels=(('genres', 'genres'), ('years', 'produktionsjahre')),
+        episodes=GroupSpec('table.episodes tr td a[href*="serie/"]', {
+            # Episode links have at least five path separators
+            'url': _href(absolute=True, regex=r'^((?:[^/]*/){5}.*)$'),
+        }),
+        ready='#sp_left, table.episodes',
+    ),
+    hosters=(
+        HosterGroup('tabs', GroupSpec('ul.hoster-tabs a', {
+            'url': _href(absolute=True),
+            'hoster': (FieldSpec(attr='title'), FieldSpec(attr='inner_text')),
+        }, required=('url', 'hoster'))),
+        HosterGroup('table', GroupSpec('table.episodes td a[href*="serie/"]', {
+            # Language-specific episode links only
+            'url': _href(absolute=True, regex=r'^((?=(?:[^/]*/){5})(?=.*/(?:en|de)).*)$'),
+            'hoster': FieldSpec('i.hoster', attr='class', regex=_class_except('hoster')),
+        }), default_hoster='Unknown'),
+    ),
+    hoster_ready='ul.hoster-tabs a',
+    # Hoster tabs of a whole series are resolved in one batch (SpecScanner.resolve_links)
+    redirects=(
+        RedirectRule(
+            url_pattern=r'^https?://(?:www\.)?bs\.to/serie/',
+            # Player iframe in server-rendered tab HTML (either attribute order)
+            patterns=(
+                r'<iframe[^>]*id=["\']bs_player["\'][^>]*src=["\'](http[^"\']+)["\']',
+                r'<iframe[^>]*src=["\'](http[^"\']+)["\'][^>]*id=["\']bs_player["\']',
+            ) + LOCATION_PATTERNS[:2],
+            # Any iframe, last resort on a rendered tab
+            page_patterns=(r'<iframe[^>]*src=["\']([^"\']+)["\']',),
+            iframe_selector='iframe#bs_player',
+            known_hosters_only=True,
+            keep_unresolved=True,
+            concurrency=3,  # bs.to rate-limits harder than filmpalast
+            timeout_ms=15000,
+            wait_cap_ms=1000,
+        ),
+    ),
+)
+
+
+# Elements that carry player URLs in data attributes or links, in priority order
+_FILMPALAST_DATA_SELECTORS = (
+    'a[data-player-url]',
+    'a.iconPlay',
+    'a.button.rb.iconPlay',
+    'li[data-link-target]',
+    '[data-player-url]',
+    'a[data-video-url]',
+    'div[data-stream-url]',
+    '.streamPlayBtn a[href]',
+)
+
+# First attribute holding an absolute URL wins
+_FILMPALAST_DATA_URL = tuple(
+    FieldSpec(attr=name, regex=r'^(http.*)')
+    for name in ('data-player-url', 'data-video-url', 'data-link-target', 'data-stream-url', 'href')
+)
+
+# Host label next to the element (two levels up), without "HD"
+_FILMPALAST_HOST_LABEL = FieldSpec('.hostName, [class*="host"]', attr='inner_text', up=2, remove=(' HD', 'HD'))
+
+FILMPALAST_SPEC = SiteSpec(
+    name='filmpalast',
+    base_url='https://filmpalast.to',
+    listing=ListingSpec(
+        url='{base}/page/{page}',
+        group=GroupSpec('article', {
+            'title': FieldSpec('h2.h2-start a'),
+            'url': _href('h2.h2-start a', absolute=True),
+            'release_info': FieldSpec('span.releaseTitleHome'),
+            'imdb_rating': FieldSpec('.toggle-content', regex=r'Imdb:\s*([\d.]+)/10'),
+            'detail_urls': _href('a[href*="/stream/"]', many=True, absolute=True),
+        }),
+    ),
+    hosters=(
+        HosterGroup('iframes', GroupSpec('iframe', {'url': FieldSpec(attr='src')})),
+        # Lazy-loading attributes, in priority order
+        HosterGroup('iframes_data_src', GroupSpec('iframe[data-src]', {'url': FieldSpec(attr='data-src')})),
+        HosterGroup('iframes_data_lazy_src',
+                    GroupSpec('iframe[data-lazy-src]', {'url': FieldSpec(attr='data-lazy-src')})),
+        HosterGroup('iframes_data_url', GroupSpec('iframe[data-url]', {'url': FieldSpec(attr='data-url')})),
+        # <a class="watchEpisode" href="/redirect/1792993"><i class="icon VOE"></i><h4>VOE</h4></a>
+        HosterGroup('watch_episode', GroupSpec('a.watchEpisode', {
+            'url': _href(absolute=True),
+            'hoster': (
+                FieldSpec('h4', attr='inner_text'),
+                FieldSpec('i.icon', attr='title', regex=r'Hoster\s+(\w+)'),
+                FieldSpec('i.icon', attr='class', regex=_class_except('icon', 'fa', 'fas'), capitalize=True),
+                FieldSpec(attr='inner_text', regex=r'^([^\n]*\S)'),
+            ),
+        }), default_hoster='Unknown'),
+    ) + tuple(
+        HosterGroup(f'data_{index}', GroupSpec(selector, {
+            'url': _FILMPALAST_DATA_URL,
+            'hoster': _FILMPALAST_HOST_LABEL,
+        }))
+        for index, selector in enumerate(_FILMPALAST_DATA_SELECTORS, 1)
+    ),
+    hoster_root='body',
+    hoster_ready='a.watchEpisode, iframe, [data-player-url], .streamPlayBtn a[href]',
+    html_patterns=(
+        r'data-(?:player-url|video-url|stream-url|link-target)=["\']([^"\']+)["\']',
+        r'<iframe[^>]*src=["\']([^"\']+)["\']',
+    ),
+    # watchEpisode redirects of a detail page, resolved once the page is released
+    redirects=(
+        RedirectRule(
+            url_pattern=r'^https?://(?:www\.)?filmpalast\.to/',
+            patterns=LOCATION_PATTERNS,
+            concurrency=4,
+            timeout_ms=10000,
+            wait_cap_ms=500,
+        ),
+    ),
+)
+
+SITE_SPECS: Dict[str, SiteSpec] = {
+    spec.name: spec for spec in (BSTO_SPEC, FILMPALAST_SPEC)
+}
@@ -0,0 +1,47 @@
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+
+class StartupTimer:
+    """Misst die Dauer der Startphasen (Browser, TMDb, DB, erste Seite)"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.marks: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """Misst eine Phase; mehrfach gemessene Phasen werden aufsummiert"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def mark(self, name: str) -> None:
+        """Merkt sich einmalig die Zeit seit Programmstart (z.B. 'first_page')"""
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() - self.started_at
+
+    def to_dict(self) -> Dict:
+        """Konvertiert zu Dictionary"""
+        return {
+            'phases': {name: round(seconds, 3) for name, seconds in self.phases.items()},
+            'marks': {name: round(seconds, 3) for name, seconds in self.marks.items()},
+        }
+
+    def print(self):
+        """Gibt die Startphasen aus"""
+        if not self.phases and not self.marks:
+            return
+        print("\nStartphasen (teilweise parallel):")
+        for name, seconds in self.phases.items():
+            print(f"  {name:<20} {seconds:6.2f}s")
+        for name, seconds in self.marks.items():
+            print(f"  {name:<20} {seconds:6.2f}s nach Start")
+
+
+# Prozessweiter Timer, damit Browser, Scanner und run.py dieselbe Zeitachse nutzen
+startup_timer = StartupTimer()
@@ -11,6 +11,35 @@ class Statistics:
         self.urls_collected = 0
         self.api_calls = 0
         self.errors = 0
+        self.requests_blocked = 0
+        self.estimated_bytes_saved = 0
+        self.page_loads = 0
+        self.page_load_seconds = 0.0
+        self.readiness: Dict[str, Dict] = {}
+        self.fetch_backends: Dict[str, int] = {}
+        self.ladder_hits: Dict[str, int] = {}
+        self.ladder_challenges: Dict[str, int] = {}
+        self.redirect_resolutions = 0
+        self.redirect_wait_seconds = 0.0
+        self.redirect_wait_saved = 0.0
+        self.redirects_via_http = 0
+        self.redirects_via_browser = 0
+        self.redirect_cache_hits = 0
+        self.redirect_cache_misses = 0
+        self.breaker_fast_fails = 0
+        self.breaker_saved_seconds = 0.0
+        self.breaker_states: Dict[str, str] = {}
+        self.host_timeouts_ms: Dict[str, float] = {}
+        self.retries = 0
+        self.retries_recovered = 0
+        self.retries_failed = 0
+        self.browser_restarts = 0
+        self.browser_recycles = 0
+        self.requeued_urls = 0
+        self.episode_urls = 0
+        self.episodes = 0
+        self.episode_variant_fetches = 0
+        self.episode_variants_skipped = 0
 
     def to_dict(self) -> Dict:
         """Konvertiert zu Dictionary"""
@@ -20,9 +49,103 @@ class Statistics:
             'disney_found': self.disney_found,
             'urls_collected': self.urls_collected,
             'api_calls': self.api_calls,
-            'errors': self.errors
+            'errors': self.errors,
+            'requests_blocked': self.requests_blocked,
+            'estimated_bytes_saved': self.estimated_bytes_saved,
+            'page_loads': self.page_loads,
+            'avg_page_load_seconds': round(self._avg_page_load(), 3),
+            'readiness': self.readiness,
+            'fetch_backends': self.fetch_backends,
+            'ladder_hits': self.ladder_hits,
+            'ladder_challenges': self.ladder_challenges,
+            'redirect_resolutions': self.redirect_resolutions,
+            'redirect_wait_seconds': round(self.redirect_wait_seconds, 3),
+            'redirect_wait_saved_seconds': round(self.redirect_wait_saved, 3),
+            'redirects_via_http': self.redirects_via_http,
+            'redirects_via_browser': self.redirects_via_browser,
+            'redirect_cache_hits': self.redirect_cache_hits,
+            'redirect_cache_misses': self.redirect_cache_misses,
+            'breaker_fast_fails': self.breaker_fast_fails,
+            'breaker_saved_seconds': round(self.breaker_saved_seconds, 3),
+            'breaker_states': self.breaker_states,
+            'host_timeouts_ms': {host: round(ms) for host, ms in self.host_timeouts_ms.items()},
+            'retries': self.retries,
+            'retries_recovered': self.retries_recovered,
+            'retries_failed': self.retries_failed,
+            'browser_restarts': self.browser_restarts,
+            'browser_recycles': self.browser_recycles,
+            'requeued_urls': self.requeued_urls,
+            'episode_urls': self.episode_urls,
+            'episodes': self.episodes,
+            'episode_variant_fetches': self.episode_variant_fetches,
+            'episode_variants_skipped': self.episode_variants_skipped
         }
 
+    def add_interception(self, interception_stats) -> None:
+        """Übernimmt Zähler eines RequestInterceptor"""
+        self.requests_blocked += interception_stats.blocked_requests
+        self.estimated_bytes_saved += interception_stats.estimated_bytes_saved
+        self.page_loads += interception_stats.page_loads
+        self.page_load_seconds += interception_stats.load_seconds
+
+    def add_readiness(self, readiness_stats) -> None:
+        """Übernimmt Time-to-ready pro Readiness-Strategie"""
+        for name, timing in readiness_stats.timings.items():
+            entry = self.readiness.setdefault(name, {'fetches': 0, 'total_seconds': 0.0, 'not_ready': 0})
+            entry['fetches'] += timing.fetches
+            entry['total_seconds'] += timing.total_seconds
+            entry['not_ready'] += timing.not_ready
+
+    def add_backends(self, backend_counts: Dict[str, int]) -> None:
+        """Übernimmt, wie viele Seiten per HTTP bzw. Browser geladen wurden"""
+        for backend, count in backend_counts.items():
+            self.fetch_backends[backend] = self.fetch_backends.get(backend, 0) + count
+
+    def add_ladder(self, ladder) -> None:
+        """Übernimmt Treffer und Challenges pro Eskalationsstufe"""
+        for level in ladder.levels:
+            self.ladder_hits[level] = self.ladder_hits.get(level, 0) + ladder.hits[level]
+            self.ladder_challenges[level] = self.ladder_challenges.get(level, 0) + ladder.challenges[level]
+
+    def add_redirect_waits(self, redirect_wait_stats) -> None:
+        """Übernimmt Wartezeiten beim Auflösen von Redirect-Seiten"""
+        self.redirect_resolutions += redirect_wait_stats.resolutions
+        self.redirect_wait_seconds += redirect_wait_stats.waited_seconds
+        self.redirect_wait_saved += redirect_wait_stats.saved_seconds
+
+    def add_redirect_resolver(self, redirect_resolver) -> None:
+        """Übernimmt, wie Redirect-Links aufgelöst wurden (HTTP oder Browser)"""
+        self.redirects_via_http += redirect_resolver.stats.via_http
+        self.redirects_via_browser += redirect_resolver.stats.via_browser
+
+    def add_redirect_cache(self, redirect_cache) -> None:
+        """Übernimmt Treffer und Fehlschläge des Redirect-Caches"""
+        self.redirect_cache_hits += redirect_cache.hits
+        self.redirect_cache_misses += redirect_cache.misses
+
+    def add_host_health(self, host_health) -> None:
+        """Übernimmt Circuit-Breaker-Zustände und adaptive Timeouts pro Host"""
+        self.breaker_fast_fails += host_health.fast_fails
+        self.breaker_saved_seconds += host_health.saved_seconds
+        self.breaker_states.update(host_health.breaker_states())
+        self.host_timeouts_ms.update(host_health.timeouts())
+
+    def add_retries(self, retry_queue) -> None:
+        """Übernimmt Zähler der Retry-Queue"""
+        self.retries += retry_queue.retried
+        self.retries_recovered += retry_queue.recovered
+        self.retries_failed += len(retry_queue.failures)
+
+    def add_episode_planner(self, episode_planner) -> None:
+        """Übernimmt, wie viele Episoden-URLs zu wie vielen Episoden zusammengefasst wurden"""
+        self.episode_urls += episode_planner.stats.episode_urls
+        self.episodes += episode_planner.stats.episodes
+        self.episode_variant_fetches += episode_planner.stats.variant_fetches
+        self.episode_variants_skipped += episode_planner.stats.variants_skipped
+
+    def _avg_page_load(self) -> float:
+        return self.page_load_seconds / self.page_loads if self.page_loads else 0.0
+
     def print(self):
         """Zeigt Statistiken"""
         print("\n" + "=" * 60)
@@ -34,4 +157,48 @@ class Statistics:
         print(f"Video-URLs: {self.urls_collected}")
         print(f"API-Calls: {self.api_calls}")
         print(f"Fehler: {self.errors}")
+        print(f"Blockierte Requests: {self.requests_blocked} "
+              f"(~{self.estimated_bytes_saved / 1_000_000:.1f} MB gespart, geschätzt)")
+        print(f"Seitenladezeit Ø: {self._avg_page_load():.2f}s ({self.page_loads} Seiten)")
+        for name, entry in self.readiness.items():
+            avg = entry['total_seconds'] / entry['fetches'] if entry['fetches'] else 0.0
+            print(f"  Time-to-ready {name}: Ø {avg:.2f}s ({entry['fetches']} Seiten, {entry['not_ready']} nicht bereit)")
+        if self.fetch_backends:
+            cache = self.fetch_backends.get('cache', 0)
+            http = self.fetch_backends.get('http', 0)
+            browser = self.fetch_backends.get('browser', 0) + self.fetch_backends.get('http_fallback', 0)
+            print(f"Fetch-Backends: Cache {cache}, HTTP {http}, Browser {browser} "
+                  f"(davon {self.fetch_backends.get('http_fallback', 0)} Fallbacks) "
+                  f"→ {cache + http} Browser-Navigationen vermieden")
+        if self.ladder_hits:
+            levels = ", ".join(f"{level} {count}" for level, count in self.ladder_hits.items())
+            challenges = ", ".join(f"{level} {count}" for level, count in self.ladder_challenges.items())
+            print(f"Eskalationsstufen: {levels} (Challenges: {challenges})")
+        if self.redirect_resolutions:
+            avg = self.redirect_wait_seconds / self.redirect_resolutions
+            print(f"Redirect-Wartezeit: Ø {avg:.2f}s ({self.redirect_resolutions} Redirects, "
+                  f"{self.redirect_wait_saved:.1f}s gegenüber fester Wartezeit gespart)")
+        if self.redirects_via_http or self.redirects_via_browser:
+            print(f"Redirect-Auflösung: {self.redirects_via_http} per HTTP, "
+                  f"{self.redirects_via_browser} im Browser")
+        lookups = self.redirect_cache_hits + self.redirect_cache_misses
+        if lookups:
+            print(f"Redirect-Cache: {self.redirect_cache_hits}/{lookups} Treffer "
+                  f"({self.redirect_cache_hits / lookups:.0%})")
+        if self.breaker_states or self.breaker_fast_fails:
+            states = ", ".join(f"{host} {state}" for host, state in self.breaker_states.items())
+            print(f"Circuit-Breaker: {self.breaker_fast_fails} Fast-Fails, "
+                  f"~{self.breaker_saved_seconds:.1f}s gespart ({states})")
+        if self.host_timeouts_ms:
+            timeouts = ", ".join(f"{host} {ms / 1000:.1f}s" for host, ms in self.host_timeouts_ms.items())
+            print(f"Timeouts pro Host: {timeouts}")
+        if self.retries:
+            print(f"Retries: {self.retries} Versuche, {self.retries_recovered} URLs gerettet, "
+                  f"{self.retries_failed} endgültig fehlgeschlagen")
+        if self.episode_urls:
+            print(f"Episoden: {self.episode_urls} URLs → {self.episodes} Episoden, "
+                  f"{self.episode_variant_fetches} Sprachvarianten zusätzlich abgerufen, "
+                  f"{self.episode_variants_skipped} übersprungen")
+        print(f"Browser-Neustarts: {self.browser_restarts} (davon {self.browser_recycles} Recycles, "
+              f"{self.requeued_urls} URLs neu eingereiht)")
         print("=" * 60)
@@ -0,0 +1,17 @@
+import os
+import sys
+import time
+
+import pytest
+
+# The repo is run from its root (python -m main.run); make `main` importable the same way
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Frozen time.time() and time.monotonic(); move it with clock[0] += seconds."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    return now
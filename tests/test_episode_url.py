@@ -0,0 +1,73 @@
+from main.bsto.scanner.extractor.EpisodeUrl import EpisodePlanner, EpisodeUrl, hoster_key
+
+SERIES = 'https://bs.to/serie/Gravity-Falls'
+
+
+def test_parse_hoster_url():
+    parsed = EpisodeUrl.parse(f'{SERIES}/1/3-Headhunters/de/VOE')
+    assert (parsed.series, parsed.season, parsed.episode, parsed.language, parsed.hoster) == \
+        ('Gravity-Falls', '1', '3-Headhunters', 'de', 'VOE')
+    assert parsed.episode_key == ('gravity-falls', '1', '3')
+
+
+def test_parse_partial_and_foreign_urls():
+    assert EpisodeUrl.parse(SERIES).episode_key is None
+    assert EpisodeUrl.parse(f'{SERIES}/2/de').language == 'de'
+    assert EpisodeUrl.parse(f'{SERIES}/1/3-Kopfjagd/en').episode_key == ('gravity-falls', '1', '3')
+    assert EpisodeUrl.parse('https://bs.to/andere-serien') is None
+
+
+def test_hoster_key():
+    assert hoster_key('VOE ') == hoster_key('Voe') == 'voe'
+
+
+def test_first_episodes_counts_episodes_not_variants():
+    urls = [
+        f'{SERIES}/1/1-Tourist-Trapped/de/VOE',
+        f'{SERIES}/1/1-Tourist-Trapped/en/VOE',
+        f'{SERIES}/1/2-The-Legend/de/VOE',
+        f'{SERIES}/1/3-Headhunters/de/VOE',
+    ]
+    assert EpisodePlanner().first_episodes(urls, 2) == urls[:3]
+
+
+def test_plan_prefers_language_and_plain_episode_page():
+    planner = EpisodePlanner(['de', 'en'])
+    fetches = planner.plan([
+        f'{SERIES}/1/1-Tourist-Trapped/en/VOE',
+        f'{SERIES}/1/1-Tourist-Trapped/de/VOE',
+        f'{SERIES}/1/1-Tourist-Trapped/de',
+        f'{SERIES}/1/2-The-Legend/en/Doodstream',
+    ])
+    assert [fetch.primary.url for fetch in fetches] == [
+        f'{SERIES}/1/1-Tourist-Trapped/de',
+        f'{SERIES}/1/2-The-Legend/en/Doodstream',
+    ]
+    assert [variant.language for variant in fetches[0].variants] == ['en']
+    assert planner.stats.episode_urls == 4 and planner.stats.episodes == 2
+
+
+def test_other_languages_only_for_missing_hosters():
+    planner = EpisodePlanner(['de', 'en', 'des'])
+    fetch, = planner.plan([
+        f'{SERIES}/1/1-Tourist-Trapped/de/VOE',
+        f'{SERIES}/1/1-Tourist-Trapped/en/VOE',
+        f'{SERIES}/1/1-Tourist-Trapped/en/Streamtape',
+        f'{SERIES}/1/1-Tourist-Trapped/des/Streamtape',
+    ])
+    assert [variant.language for variant in planner.variants_to_fetch(fetch, ['VOE'])] == ['en']
+    assert planner.stats.variant_fetches == 1 and planner.stats.variants_skipped == 1
+    # The primary page already showed Streamtape
+    fetch.primary.hosters.add('streamtape')
+    assert planner.variants_to_fetch(fetch, []) == []
+
+
+def test_collapse_links_keeps_preferred_language_per_hoster():
+    planner = EpisodePlanner(['de', 'en'])
+    links = [
+        {'url': f'{SERIES}/1/1-Tourist-Trapped/de/VOE', 'hoster': 'VOE'},
+        {'url': f'{SERIES}/1/1-Tourist-Trapped/en/VOE', 'hoster': 'VOE'},
+        {'url': f'{SERIES}/1/1-Tourist-Trapped/en/Vidoza', 'hoster': 'Vidoza'},
+        {'url': 'https://voe.sx/e/abc', 'hoster': 'VOE'},
+    ]
+    assert planner.collapse_links(links) == [links[0], links[2], links[3]]
@@ -0,0 +1,40 @@
+from main.fetcher.EscalationLadder import EscalationLadder, path_pattern
+
+LEVELS = ('http', 'chromium', 'camoufox')
+
+
+def test_path_pattern_groups_by_first_segment():
+    assert path_pattern('https://www.bs.to/serie/Foo/1/de') == 'bs.to/serie'
+    assert path_pattern('https://filmpalast.to/page/2') == 'filmpalast.to/page'
+
+
+def test_pattern_moves_up_after_threshold_escalations():
+    ladder = EscalationLadder(LEVELS, prefix_threshold=2)
+    for name in ('a', 'b'):
+        url = f'https://bs.to/serie/{name}'
+        assert ladder.start_level(url) == 0
+        ladder.record_challenge(url, 0)
+        ladder.record_success(url, 1)
+    assert ladder.start_level('https://bs.to/serie/c') == 1
+    assert ladder.challenges['http'] == 2 and ladder.hits['chromium'] == 2
+
+
+def test_successes_without_challenge_below_do_not_move_the_pattern():
+    ladder = EscalationLadder(LEVELS, prefix_threshold=2)
+    for name in ('a', 'b', 'c'):
+        # e.g. hoster tabs that skip HTTP because the caller already tried it
+        ladder.record_success(f'https://bs.to/serie/{name}', 1, escalated=False)
+    assert ladder.start_level('https://bs.to/serie/d') == 0
+    assert ladder.pattern_levels() == {}
+
+
+def test_probe_on_cheaper_level_lowers_the_pattern(tmp_path):
+    path = str(tmp_path / 'ladder.json')
+    ladder = EscalationLadder(LEVELS, path=path, prefix_threshold=1, probe_interval=2)
+    ladder.record_success('https://bs.to/serie/a', 2)
+    assert ladder.pattern_levels() == {'bs.to/serie': 'camoufox'}
+
+    assert ladder.start_level('https://bs.to/serie/b') == 2
+    assert ladder.start_level('https://bs.to/serie/c') == 1
+    ladder.record_success('https://bs.to/serie/c', 1)
+    assert EscalationLadder(LEVELS, path=path).pattern_levels() == {'bs.to/serie': 'chromium'}
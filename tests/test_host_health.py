@@ -0,0 +1,90 @@
+import pytest
+
+from main.fetcher.HostHealth import CLOSED, HALF_OPEN, OPEN, HostHealth
+
+URL = 'https://www.bs.to/serie/x'
+
+
+def state(health):
+    return health._hosts['bs.to']
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    health = HostHealth(30000, failure_threshold=3, cooldown=60)
+    for _ in range(2):
+        health.record(URL, 5.0, False)
+    assert state(health).breaker == CLOSED
+    health.record(URL, 5.0, False)
+    assert state(health).breaker == OPEN
+
+    assert not health.allow(URL)
+    assert health.fast_fails == 1
+    assert health.saved_seconds == pytest.approx(5.0)
+
+
+def test_success_resets_failure_count(clock):
+    health = HostHealth(30000, failure_threshold=3)
+    health.record(URL, 5.0, False)
+    health.record(URL, 5.0, False)
+    health.record(URL, 0.5, True)
+    health.record(URL, 5.0, False)
+    assert state(health).breaker == CLOSED
+
+
+def test_half_open_probe_closes_or_reopens(clock):
+    health = HostHealth(30000, failure_threshold=1, cooldown=60)
+    health.record(URL, 1.0, False)
+    clock[0] += 60
+
+    # One probe goes through, the next request waits for its outcome
+    assert health.allow(URL)
+    assert state(health).breaker == HALF_OPEN
+    assert not health.allow(URL)
+
+    health.record(URL, 1.0, False)
+    assert state(health).breaker == OPEN
+    assert not health.allow(URL)
+
+    clock[0] += 60
+    assert health.allow(URL)
+    health.record(URL, 0.2, True)
+    assert state(health).breaker == CLOSED
+    assert health.allow(URL)
+
+
+def test_lost_probe_does_not_block_forever(clock):
+    health = HostHealth(30000, failure_threshold=1, cooldown=60)
+    health.record(URL, 1.0, False)
+    clock[0] += 60
+    assert health.allow(URL)
+    clock[0] += 60
+    assert health.allow(URL)
+
+
+def test_zero_threshold_disables_breakers(clock):
+    health = HostHealth(30000, failure_threshold=0)
+    for _ in range(10):
+        health.record(URL, 1.0, False)
+    assert health.allow(URL)
+
+
+def test_timeouts_are_derived_per_backend(clock):
+    health = HostHealth(30000, min_timeout_ms=1000, timeout_factor=3, min_samples=5)
+    for _ in range(4):
+        health.record(URL, 0.5, True, 'http')
+    assert health.timeout_for(URL, backend='http') == 30000
+
+    health.record(URL, 0.5, True, 'http')
+    assert health.timeout_for(URL, backend='http') == pytest.approx(1500)
+    # No browser samples yet: the browser keeps the default
+    assert health.timeout_for(URL, backend='browser') == 30000
+    # The caller's default is the upper bound
+    for _ in range(5):
+        health.record(URL, 20.0, True, 'browser')
+    assert health.timeout_for(URL, 10000, backend='browser') == 10000
+
+
+def test_derived_timeout_has_a_floor(clock):
+    health = HostHealth(30000, min_timeout_ms=3000, min_samples=1)
+    health.record(URL, 0.01, True)
+    assert health.timeout_for(URL) == 3000
@@ -0,0 +1,48 @@
+from main.fetcher.PageCache import PageCache
+
+
+def test_round_trip(clock, tmp_path):
+    cache = PageCache(str(tmp_path))
+    cache.put('https://bs.to/serie/x', 'https://bs.to/serie/x/1', '<html>x</html>',
+              headers={'content-type': 'text/html'})
+    snapshot = cache.get('https://bs.to/serie/x')
+    assert snapshot.html == '<html>x</html>'
+    assert snapshot.final_url == 'https://bs.to/serie/x/1'
+    assert snapshot.headers == {'content-type': 'text/html'}
+    assert cache.hits == 1 and cache.stores == 1
+
+
+def test_identical_pages_share_one_blob(clock, tmp_path):
+    cache = PageCache(str(tmp_path))
+    first = cache.put('https://bs.to/a', 'https://bs.to/a', '<html>same</html>')
+    second = cache.put('https://bs.to/b', 'https://bs.to/b', '<html>same</html>')
+    assert first == second
+    blobs = [path for path in (tmp_path / 'objects').rglob('*.html.gz')]
+    assert len(blobs) == 1
+
+
+def test_ttl_per_host_and_replay_ignores_it(clock, tmp_path):
+    cache = PageCache(str(tmp_path), ttls={'bs.to': 60}, default_ttl=3600)
+    cache.put('https://www.bs.to/a', 'https://bs.to/a', '<html>a</html>')
+    cache.put('https://filmpalast.to/a', 'https://filmpalast.to/a', '<html>b</html>')
+    clock[0] += 61
+
+    assert cache.get('https://www.bs.to/a') is None
+    assert cache.get('https://www.bs.to/a', ignore_ttl=True).html == '<html>a</html>'
+    assert cache.get('https://filmpalast.to/a').html == '<html>b</html>'
+
+
+def test_evicts_least_recently_used_above_max_bytes(clock, tmp_path):
+    cache = PageCache(str(tmp_path), max_bytes=10 ** 9)
+    for name in ('a', 'b', 'c'):
+        clock[0] += 1
+        # Random-looking bodies so gzip cannot shrink them to nothing
+        cache.put(f'https://bs.to/{name}', f'https://bs.to/{name}', name * 10 + str(hash(name)) * 50)
+    clock[0] += 1
+    cache.get('https://bs.to/a')
+
+    cache.max_bytes = cache._total_bytes - 1
+    cache.evict()
+    assert cache.get('https://bs.to/b') is None
+    assert cache.get('https://bs.to/a') is not None
+    assert cache.evictions >= 1
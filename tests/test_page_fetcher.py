@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('playwright')
+pytest.importorskip('httpx')
+pytest.importorskip('selectolax')
+
+from main.extractor.ExtractionBackend import HtmlDocument  # noqa: E402
+from main.fetcher.EscalationLadder import EscalationLadder  # noqa: E402
+from main.fetcher.HttpFetcher import HttpPage  # noqa: E402
+from main.fetcher.PageFetcher import PageFetcher  # noqa: E402
+from main.fetcher.ReadinessStrategy import ReadinessStrategy  # noqa: E402
+
+LEVELS = ('http', 'chromium', 'camoufox')
+SERIES = ReadinessStrategy.for_selectors('test:series', 'table.episodes')
+SERIES_HTML = '<html><body><table class="episodes"><tr><td>1</td></tr></table></body></html>'
+CHALLENGE_HTML = '<html><head><title>Just a moment...</title></head></html>'
+
+
+class FakeHttp:
+    def __init__(self, response):
+        self.response = response
+
+    async def get(self, url, timeout=None):
+        return self.response
+
+    def set_cookies(self, cookies):
+        pass
+
+
+def make_fetcher(response):
+    ladder = EscalationLadder(LEVELS, prefix_threshold=2)
+    fetcher = PageFetcher(None, http_fetcher=FakeHttp(response), ladder=ladder, engine='camoufox')
+    fetcher.browser_loads = []
+
+    async def fetch_on(engine, url, readiness, sniffer, backend):
+        # Stands in for a browser navigation that got a real page
+        fetcher.browser_loads.append(engine)
+        fetcher._record_backend(url, backend)
+        return f'page:{engine}', False
+
+    fetcher._fetch_on = fetch_on
+    return fetcher, ladder
+
+
+def fetch_series(fetcher, names=('a', 'b', 'c')):
+    return [asyncio.run(fetcher.fetch(f'https://bs.to/serie/{name}', SERIES)) for name in names]
+
+
+def test_http_response_is_served_as_document_without_a_browser():
+    fetcher, ladder = make_fetcher(HttpPage('https://bs.to/serie/a', 200, SERIES_HTML, {'content-type': 'text/html'}))
+    document = asyncio.run(fetcher.fetch('https://bs.to/serie/a', SERIES))
+    assert isinstance(document, HtmlDocument)
+    assert document.url == 'https://bs.to/serie/a'
+    assert fetcher.browser_loads == []
+    assert fetcher.served_by['https://bs.to/serie/a'] == 'http'
+    assert ladder.hits['http'] == 1
+
+
+def test_challenges_escalate_the_pattern():
+    fetcher, ladder = make_fetcher(HttpPage('https://bs.to/serie/a', 200, CHALLENGE_HTML, {'content-type': 'text/html'}))
+    assert fetch_series(fetcher, ('a', 'b')) == ['page:chromium', 'page:chromium']
+    assert ladder.challenges['http'] == 2
+    assert ladder.start_level('https://bs.to/serie/c') == 1
+
+
+@pytest.mark.parametrize('response', [
+    None,  # network error or timeout
+    HttpPage('https://bs.to/serie/a', 200, '<html><body>maintenance</body></html>', {'content-type': 'text/html'}),
+    HttpPage('https://bs.to/serie/a', 200, '%PDF', {'content-type': 'application/pdf'}),
+])
+def test_unusable_http_responses_fall_back_without_escalating(response):
+    fetcher, ladder = make_fetcher(response)
+    assert fetch_series(fetcher) == ['page:chromium'] * 3
+    assert ladder.challenges['http'] == 0
+    assert ladder.start_level('https://bs.to/serie/d') == 0
+    assert fetcher.backend_counts['http_fallback'] == 3
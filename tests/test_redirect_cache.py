@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from main.fetcher.RedirectCache import RedirectCache
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'redirects.db')
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_lookup_ignores_www_and_trailing_slash(clock, db_path):
+    cache = RedirectCache(db_path)
+    run(cache.put('https://www.filmpalast.to/redirect/1/', 'https://voe.sx/e/1'))
+    assert run(cache.get('https://filmpalast.to/redirect/1')) == 'https://voe.sx/e/1'
+    assert cache.memory_hits == 1
+    cache.close()
+
+
+def test_empty_targets_are_not_stored(clock, db_path):
+    cache = RedirectCache(db_path)
+    run(cache.put('https://filmpalast.to/redirect/1', ''))
+    assert run(cache.get('https://filmpalast.to/redirect/1')) is None
+    assert cache.stores == 0 and cache.misses == 1
+    cache.close()
+
+
+def test_lru_evicts_oldest_and_falls_back_to_disk(clock, db_path):
+    cache = RedirectCache(db_path, lru_size=2)
+    for n in (1, 2, 3):
+        run(cache.put(f'https://bs.to/r/{n}', f'https://voe.sx/e/{n}'))
+    assert list(cache._lru) == ['bs.to/r/2', 'bs.to/r/3']
+
+    assert run(cache.get('https://bs.to/r/1')) == 'https://voe.sx/e/1'
+    assert cache.disk_hits == 1
+    # The disk hit is back in memory and pushed out the least recently used entry
+    assert list(cache._lru) == ['bs.to/r/3', 'bs.to/r/1']
+    cache.close()
+
+
+def test_entries_expire_after_ttl(clock, db_path):
+    cache = RedirectCache(db_path, ttl=60)
+    run(cache.put('https://bs.to/r/1', 'https://voe.sx/e/1'))
+    clock[0] += 61
+    assert run(cache.get('https://bs.to/r/1')) is None
+    assert 'bs.to/r/1' not in cache._lru
+    cache.close()
+
+
+def test_a_new_run_starts_warm_and_purges_expired(clock, db_path):
+    cache = RedirectCache(db_path, ttl=60)
+    run(cache.put('https://bs.to/r/old', 'https://voe.sx/e/old'))
+    clock[0] += 50
+    run(cache.put('https://bs.to/r/new', 'https://voe.sx/e/new'))
+    cache.close()
+
+    clock[0] += 20
+    reopened = RedirectCache(db_path, ttl=60)
+    assert run(reopened.get('https://bs.to/r/new')) == 'https://voe.sx/e/new'
+    assert reopened.disk_hits == 1
+    assert reopened.purge_expired() == 0
+    assert run(reopened.get('https://bs.to/r/old')) is None
+    reopened.close()
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from main.fetcher import RetryQueue as retry_module
+from main.fetcher.RetryQueue import RetryQueue
+
+
+def test_backoff_doubles_and_is_capped(clock):
+    queue = RetryQueue(base_delay=5, max_delay=30, jitter=0)
+    delays = []
+    for attempts in range(1, 6):
+        item = retry_module.RetryItem(url=f'https://bs.to/{attempts}', attempts=attempts)
+        queue._schedule(item)
+        delays.append(item.next_at - clock[0])
+    assert delays == [5, 10, 20, 30, 30]
+
+
+def test_jitter_stays_within_bounds(clock, monkeypatch):
+    queue = RetryQueue(base_delay=10, jitter=0.5)
+    for bound in (-0.5, 0.5):
+        monkeypatch.setattr(retry_module.random, 'uniform', lambda low, high, bound=bound: bound)
+        item = retry_module.RetryItem(url='https://bs.to/x')
+        queue._schedule(item)
+        assert item.next_at - clock[0] == pytest.approx(10 * (1 + bound))
+
+
+def test_push_ignores_queued_duplicates(clock):
+    queue = RetryQueue()
+    queue.push('https://bs.to/a')
+    queue.push('https://bs.to/a')
+    assert len(queue) == 1
+
+
+def test_process_due_only_runs_elapsed_items(clock):
+    queue = RetryQueue(base_delay=5, jitter=0)
+    queue.push('https://bs.to/a')
+    handled = []
+
+    async def handler(item):
+        handled.append(item.url)
+        return True
+
+    assert asyncio.run(queue.process_due(handler)) == 0
+    clock[0] += 5
+    assert asyncio.run(queue.process_due(handler)) == 1
+    assert handled == ['https://bs.to/a']
+    assert queue.recovered == 1 and len(queue) == 0
+
+
+def test_gives_up_after_max_attempts(clock, tmp_path):
+    path = tmp_path / 'failed.json'
+    queue = RetryQueue(max_attempts=3, base_delay=1, jitter=0, failures_path=str(path))
+    queue.push('https://bs.to/a', meta={'title': 'A'}, error='timeout')
+
+    async def handler(item):
+        raise RuntimeError('still down')
+
+    for _ in range(2):
+        clock[0] += 100
+        asyncio.run(queue.process_due(handler))
+
+    assert len(queue) == 0
+    assert [item.url for item in queue.failures] == ['https://bs.to/a']
+    assert queue.failures[0].attempts == 3
+    assert queue.failures[0].last_error == 'still down'
+
+    queue.save_failures()
+    loaded = RetryQueue(failures_path=str(path)).load_failures()
+    assert [(item.url, item.meta) for item in loaded] == [('https://bs.to/a', {'title': 'A'})]
@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('playwright')
+pytest.importorskip('httpx')
+pytest.importorskip('selectolax')
+
+from main.data.MovieInfo import MovieInfo  # noqa: E402
+from main.extractor.ExtractionBackend import HtmlDocument  # noqa: E402
+from main.sitespec.SpecScanner import SpecScanner  # noqa: E402
+from main.sitespec.sites import BSTO_SPEC, FILMPALAST_SPEC  # noqa: E402
+
+BSTO_SERIES_PAGE = """
+<html><body>
+<div id="sp_left"><div class="infos">
+  <div><span>Genres</span><p>Drama Komödie</p></div>
+  <div><span>Produktionsjahre</span><p><em>2005</em> bis <em>2014</em></p></div>
+</div></div>
+<table class="episodes"><tr>
+  <td><a href="/serie/Show/1/1-Pilot/de">Pilot</a></td>
+  <td><a href="/serie/Show/1/1-Pilot/de">Pilot</a></td>
+  <td><a href="/serie/Show/1">Season</a></td>
+  <td><a href="/serie/Show/1/2-Second/de">Second</a></td>
+</tr></table>
+</body></html>
+"""
+
+BSTO_EPISODE_PAGE = """
+<html><body>
+<ul class="hoster-tabs">
+  <li><a href="serie/Show/1/1-Pilot/de/VOE" title="VOE">VOE</a></li>
+  <li><a href="serie/Show/1/1-Pilot/de/Doodstream">Doodstream</a></li>
+  <li><a href="serie/Show/1/1-Pilot/de/Empty" title=""></a></li>
+</ul>
+<table class="episodes"><tr>
+  <td><a href="serie/Show/1/1-Pilot/en/Streamtape"><i class="hoster streamtape"></i></a></td>
+  <td><a href="serie/Show/1/1-Pilot/en/Other"><i class="hoster"></i></a></td>
+  <td><a href="serie/Show/1/1-Pilot">Pilot</a></td>
+</tr></table>
+</body></html>
+"""
+
+FILMPALAST_LISTING = """
+<html><body>
+<article>
+  <h2 class="h2-start"><a href="/stream/toy-story">Toy Story </a></h2>
+  <span class="releaseTitleHome">Toy.Story.1995.German.DL</span>
+  <div class="toggle-content">Imdb: 8.3/10</div>
+  <a href="/stream/toy-story">more</a><a href="/stream/toy-story-hd">HD</a>
+</article>
+<article><h2 class="h2-start"><a href="/stream/x"></a></h2></article>
+</body></html>
+"""
+
+FILMPALAST_DETAIL = """
+<html><body>
+<iframe src="https://voe.sx/e/abc"></iframe>
+<a class="watchEpisode" href="/redirect/1"><i class="icon VOE"></i><h4>VOE</h4></a>
+<a class="watchEpisode" href="/redirect/2"><i class="icon fa streamtape"></i></a>
+<ul><li><div><span class="hostName">Mixdrop HD</span></div>
+  <div><a data-player-url="https://mixdrop.co/e/1">play</a></div></li></ul>
+</body></html>
+"""
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class FakeResolverHttp:
+    """Plain HTTP client for the redirect resolvers, answering from a dict."""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    async def get(self, url, timeout=None):
+        return self.pages.get(url)
+
+
+def test_bsto_listing_limit_and_absolute_urls():
+    scanner = SpecScanner(BSTO_SPEC)
+    document = HtmlDocument(
+        '<div id="seriesContainer"><div class="genre"><ul>'
+        '<li><a href="serie/A"> A </a></li><li><a href="serie/B">B</a></li><li><a href="serie/C">C</a></li>'
+        '</ul></div></div>', 'https://bs.to/andere-serien'
+    )
+    total, series = run(scanner.extract_listing(document, limit=2))
+    assert total == 3
+    assert [(s.title, s.source_url) for s in series] == [
+        ('A', ['https://bs.to/serie/A']), ('B', ['https://bs.to/serie/B'])
+    ]
+
+
+def test_bsto_detail_reads_labelled_rows_and_episode_links():
+    scanner = SpecScanner(BSTO_SPEC)
+    series = MovieInfo(title='Show', source_url=['https://bs.to/serie/Show'])
+    urls = run(scanner.extract_detail(HtmlDocument(BSTO_SERIES_PAGE, 'https://bs.to/serie/Show'), series))
+    assert urls == ['https://bs.to/serie/Show/1/1-Pilot/de', 'https://bs.to/serie/Show/1/2-Second/de']
+    assert series.release_info == 'Genres: Drama Komödie | Years: 2005'
+
+
+def test_bsto_hoster_links_skip_unlabelled_tabs_and_filter_the_table():
+    scanner = SpecScanner(BSTO_SPEC, group_filters={'table': lambda links: links[:1]})
+    links = run(scanner.extract_video_links(HtmlDocument(BSTO_EPISODE_PAGE, 'https://bs.to/serie/Show/1/1-Pilot')))
+    assert links == [
+        {'url': 'https://bs.to/serie/Show/1/1-Pilot/de/VOE', 'hoster': 'VOE'},
+        {'url': 'https://bs.to/serie/Show/1/1-Pilot/de/Doodstream', 'hoster': 'Doodstream'},
+        {'url': 'https://bs.to/serie/Show/1/1-Pilot/en/Streamtape', 'hoster': 'streamtape'},
+    ]
+
+
+def test_bsto_cached_tab_counts_only_the_player_or_known_hosters():
+    scanner = SpecScanner(BSTO_SPEC)
+    rule = BSTO_SPEC.redirects[0]
+    url = 'https://bs.to/serie/Show/1/1-Pilot/de/VOE'
+    player = HtmlDocument('<iframe id="bs_player" src="https://player.example/e/1"></iframe>', url)
+    captcha = HtmlDocument('<iframe src="https://captcha.example/challenge"></iframe>', url)
+    assert run(scanner.read_redirect_target(player, url, rule)) == 'https://player.example/e/1'
+    assert run(scanner.read_redirect_target(captcha, url, rule)) == ''
+
+
+def test_filmpalast_listing_items():
+    scanner = SpecScanner(FILMPALAST_SPEC)
+    total, movies = run(scanner.extract_listing(HtmlDocument(FILMPALAST_LISTING, 'https://filmpalast.to/page/1')))
+    assert total == 2
+    assert len(movies) == 1
+    movie = movies[0]
+    assert movie.title == 'Toy Story'
+    assert movie.source_url == ['https://filmpalast.to/stream/toy-story', 'https://filmpalast.to/stream/toy-story-hd']
+    assert movie.release_info == 'Toy.Story.1995.German.DL'
+    assert movie.imdb_rating == '8.3'
+
+
+def test_filmpalast_redirects_resolve_after_extraction_and_unresolved_ones_are_dropped():
+    from main.fetcher.HttpFetcher import HttpPage
+
+    scanner = SpecScanner(FILMPALAST_SPEC)
+    scanner.resolvers[FILMPALAST_SPEC.redirects[0].url_pattern].http_fetcher = FakeResolverHttp({
+        'https://filmpalast.to/redirect/1': HttpPage(
+            'https://filmpalast.to/redirect/1', 200, "<script>window.location.href = 'https://voe.sx/e/xyz';</script>"
+        ),
+    })
+
+    async def no_browser(url, rule):
+        return ''
+
+    scanner._open_redirect = no_browser
+    links = run(scanner.extract_video_links(HtmlDocument(FILMPALAST_DETAIL, 'https://filmpalast.to/stream/toy-story')))
+    assert links == [
+        {'url': 'https://voe.sx/e/abc', 'hoster': 'Voe'},
+        {'url': 'https://filmpalast.to/redirect/1', 'hoster': 'VOE'},
+        {'url': 'https://filmpalast.to/redirect/2', 'hoster': 'Streamtape'},
+        {'url': 'https://mixdrop.co/e/1', 'hoster': 'Mixdrop'},
+    ]
+
+    assert run(scanner.resolve_links(links)) == 1
+    assert links == [
+        {'url': 'https://voe.sx/e/abc', 'hoster': 'Voe'},
+        {'url': 'https://voe.sx/e/xyz', 'hoster': 'VOE', 'source_url': 'https://filmpalast.to/redirect/1'},
+        {'url': 'https://mixdrop.co/e/1', 'hoster': 'Mixdrop'},
+    ]